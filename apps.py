@@ -4,3 +4,24 @@ from django.apps import AppConfig
 class FacilityConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "facility"
+
+    def ready(self):
+        from .signals import (
+            connect_occupancy_signals,
+            connect_organization_closure_signals,
+            connect_department_closure_signals,
+            connect_settings_cache_signals,
+            connect_dashboard_cache_signals,
+            connect_facility_stats_signals,
+            connect_facility_access_signals,
+            connect_faculty_roster_signals,
+        )
+
+        connect_occupancy_signals()
+        connect_organization_closure_signals()
+        connect_department_closure_signals()
+        connect_settings_cache_signals()
+        connect_dashboard_cache_signals()
+        connect_facility_stats_signals()
+        connect_facility_access_signals()
+        connect_faculty_roster_signals()
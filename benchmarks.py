@@ -0,0 +1,205 @@
+""" Facility View Benchmarks and Query Budgets. """
+
+import time
+import tracemalloc
+
+from django.contrib.auth.hashers import make_password
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import resolve, reverse
+
+from reports.models import GeneratedReport
+from user.models import User
+
+from .models import Department, Facility, FacultyProfile, Quarters, QuartersType
+from .selectors import FACILITY_LIST_COUNTS, reports_visible_to
+
+# (label, url name, url scope) for every routed view with a declared query budget; the
+# scope says which slug the URL takes: "facility", "organization" or None.
+BUDGETED_VIEWS = (
+    ("facility index", "facilities:index", None),
+    ("facility show", "facilities:show", "facility"),
+    ("facility manage", "facilities:manage", "facility"),
+    ("faculty dashboard", "facilities:faculty:dashboard", "facility"),
+    ("faculty roster", "facilities:roster", "organization"),
+    ("quarters index", "facilities:quarters:index", "facility"),
+    ("department index", "facilities:departments:index", "facility"),
+)
+
+# How far a declared budget may sit above the measured count. Anything looser is a guess
+# rather than a measurement and is reported so it gets lowered.
+QUERY_BUDGET_SLACK = 2
+
+
+def seed_facility(organization, name, faculty=10, quarters=10, departments=5):
+    """
+    Create a synthetic facility of the given size with bulk inserts and return it.
+    """
+    facility = Facility.objects.create(name=name, organization=organization)
+    prefix = facility.slug or f"facility-{facility.pk}"
+
+    Department.objects.bulk_create(
+        [
+            Department(
+                name=f"Department {i}",
+                abbreviation=f"D{i}",
+                slug=f"{prefix}-department-{i}",
+                facility=facility,
+            )
+            for i in range(departments)
+        ]
+    )
+
+    quarters_type, _created = QuartersType.objects.get_or_create(
+        name="Benchmark Cabin", organization=organization
+    )
+    Quarters.objects.bulk_create(
+        [
+            Quarters(
+                name=f"Cabin {i}",
+                slug=f"{prefix}-cabin-{i}",
+                capacity=8,
+                type=quarters_type,
+                facility=facility,
+            )
+            for i in range(quarters)
+        ],
+        batch_size=1000,
+    )
+
+    password = make_password(None)
+    users = User.objects.bulk_create(
+        [
+            User(
+                username=f"{prefix}-faculty-{i}",
+                password=password,
+                user_type=User.UserType.FACULTY,
+            )
+            for i in range(faculty)
+        ],
+        batch_size=1000,
+    )
+    FacultyProfile.objects.bulk_create(
+        [
+            FacultyProfile(
+                user=user,
+                slug=f"{prefix}-faculty-{i}",
+                organization=organization,
+                facility=facility,
+            )
+            for i, user in enumerate(users)
+        ],
+        batch_size=1000,
+    )
+    return facility
+
+
+def view_url(url_name, facility, scope):
+    kwargs = {}
+    if scope == "facility":
+        kwargs["facility_slug"] = facility.slug
+    elif scope == "organization":
+        kwargs["organization_slug"] = facility.organization.slug
+    return reverse(url_name, kwargs=kwargs)
+
+
+def query_budget(url):
+    """Return the ``query_budget`` declared on the view serving ``url``."""
+    view_class = getattr(resolve(url).func, "view_class", None)
+    return getattr(view_class, "query_budget", None)
+
+
+def measure(client, url):
+    """
+    GET ``url`` and return the status, query count, wall time and peak Python memory.
+    """
+    tracemalloc.start()
+    started = time.perf_counter()
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(url)
+        if hasattr(response, "render") and not response.is_rendered:
+            response.render()
+    elapsed = time.perf_counter() - started
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "status": response.status_code,
+        "queries": len(queries),
+        "seconds": elapsed,
+        "peak_kb": peak / 1024,
+    }
+
+
+def run_benchmarks(client, facility):
+    """
+    Measure every budgeted view for ``facility``; each row carries its ``budget``, an
+    ``over_budget`` flag and a ``loose_budget`` flag for budgets more than
+    ``QUERY_BUDGET_SLACK`` above the measured count.
+    """
+    results = []
+    for label, url_name, scope in BUDGETED_VIEWS:
+        url = view_url(url_name, facility, scope)
+        row = measure(client, url)
+        budget = query_budget(url)
+        row.update(
+            label=label,
+            budget=budget,
+            over_budget=budget is not None and row["queries"] > budget,
+            loose_budget=budget is not None
+            and budget - row["queries"] > QUERY_BUDGET_SLACK,
+        )
+        results.append(row)
+    return results
+
+
+def benchmark_facility_list(client):
+    """
+    Measure the facility index unsorted and sorted on each count column; every row
+    carries its ``sort``, ``budget`` and ``over_budget`` flag.
+    """
+    url = reverse("facilities:index")
+    budget = query_budget(url)
+    results = []
+    for sort in ("", *FACILITY_LIST_COUNTS):
+        row = measure(client, f"{url}?sort={sort}" if sort else url)
+        row.update(
+            sort=sort or "name",
+            budget=budget,
+            over_budget=budget is not None and row["queries"] > budget,
+        )
+        results.append(row)
+    return results
+
+
+def legacy_reports_visible_to(user):
+    """The OR-of-joins + DISTINCT query ``reports_visible_to`` replaced, for comparison."""
+    created = GeneratedReport.objects.filter(generated_by=user)
+    shared = GeneratedReport.objects.filter(template__available_to=user)
+    return (created | shared).distinct()
+
+
+def time_queryset(queryset, repeat=3):
+    """Return the sorted primary keys and best wall time of evaluating ``queryset``."""
+    best = None
+    for _attempt in range(repeat):
+        started = time.perf_counter()
+        rows = list(queryset.all())
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return sorted(row.pk for row in rows), best
+
+
+def benchmark_report_visibility(user):
+    """
+    Time the legacy and current report-visibility queries for ``user`` against the
+    current report table. Both must return the same rows, compared by primary key.
+    """
+    legacy_pks, legacy_seconds = time_queryset(legacy_reports_visible_to(user))
+    pks, seconds = time_queryset(reports_visible_to(user))
+    return {
+        "table_rows": GeneratedReport.objects.count(),
+        "visible_rows": len(pks),
+        "rows_match": pks == legacy_pks,
+        "legacy_seconds": legacy_seconds,
+        "seconds": seconds,
+    }
@@ -0,0 +1,76 @@
+""" Streaming Table Exports. """
+
+import csv
+import tempfile
+
+from django.utils.encoding import force_str
+from django_tables2.rows import BoundRow
+
+try:
+    from openpyxl import Workbook
+except ImportError:  # pragma: no cover - optional dependency
+    Workbook = None
+
+EXPORT_CHUNK_SIZE = 2000
+EXCLUDED_EXPORT_COLUMNS = ("actions",)
+
+
+class Echo:
+    """File-like object whose ``write`` hands the value back, for streaming csv."""
+
+    def write(self, value):
+        return value
+
+
+def iter_table_values(table_class, queryset, chunk_size=EXPORT_CHUNK_SIZE, context=None):
+    """
+    Yield the header and then one list of cell values per row, using ``table_class``
+    column definitions but reading ``queryset`` with ``iterator()`` so only one chunk
+    of rows is in memory at a time.
+    """
+    table = table_class([])
+    if context:
+        table.context = context
+    columns = [
+        column
+        for column in table.columns.iterall()
+        if not column.column.exclude_from_export
+        and column.name not in EXCLUDED_EXPORT_COLUMNS
+    ]
+    yield [force_str(column.header, strings_only=True) for column in columns]
+    for record in queryset.iterator(chunk_size=chunk_size):
+        row = BoundRow(record, table=table)
+        yield [
+            force_str(row.get_cell_value(column.name), strings_only=True)
+            for column in columns
+        ]
+
+
+def stream_csv(values):
+    """Yield CSV lines for ``values`` one row at a time."""
+    writer = csv.writer(Echo())
+    for row in values:
+        yield writer.writerow(row)
+
+
+def xlsx_available():
+    return Workbook is not None
+
+
+def write_xlsx(values, title="Export"):
+    """
+    Write ``values`` to a temporary XLSX file with openpyxl's write-only mode (rows are
+    flushed to disk as they are appended) and return the open file, rewound.
+
+    XLSX is a zip archive that is only valid once complete, so it is not streamed: the
+    whole workbook is spooled to local disk before the first byte is sent, and needs
+    temporary space roughly the size of the export. The file is removed when closed.
+    """
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(title=title[:31])
+    for row in values:
+        sheet.append(row)
+    handle = tempfile.TemporaryFile()
+    workbook.save(handle)
+    handle.seek(0)
+    return handle
@@ -0,0 +1,80 @@
+# facility/forms/choices.py
+"""Facility-scoped, lightweight model choice fields."""
+
+from django import forms
+from django.core.exceptions import ValidationError
+from django.urls import reverse
+
+from ..selectors import choice_querysets
+
+# Above this many candidates a select only renders its current value and is filled
+# from the autocomplete endpoint as the user types.
+CHOICE_AUTOCOMPLETE_THRESHOLD = 200
+
+
+def _label(obj):
+    return obj.name
+
+
+class AutocompleteSelect(forms.Select):
+    """
+    A select that renders only its selected option. The script in its template adds a
+    search box that loads matching options from ``data-autocomplete-url``, so the
+    submitted value is still a primary key validated by the model choice field.
+    """
+
+    template_name = "facility/autocomplete_select.html"
+
+    def __init__(self, queryset, autocomplete_url, attrs=None):
+        attrs = {"class": "form-select", "data-autocomplete-url": autocomplete_url, **(attrs or {})}
+        super().__init__(attrs)
+        self.queryset = queryset
+
+    def optgroups(self, name, value, attrs=None):
+        selected = [pk for pk in value if pk not in (None, "")]
+        try:
+            options = [(obj.pk, _label(obj)) for obj in self.queryset.filter(pk__in=selected)]
+        except (TypeError, ValueError, ValidationError):
+            options = []
+        self.choices = [("", "---------"), *options]
+        return super().optgroups(name, value, attrs)
+
+
+def scope_choice_field(field, queryset, autocomplete_url=None):
+    """
+    Point ``field`` at ``queryset`` loading only ``id`` and ``name``.
+
+    When ``autocomplete_url`` is given and there are more than
+    ``CHOICE_AUTOCOMPLETE_THRESHOLD`` candidates, the select becomes an
+    ``AutocompleteSelect`` that renders only the current value.
+    """
+    field.queryset = queryset.only("id", "name").order_by("name")
+    field.label_from_instance = _label
+    if autocomplete_url and field.queryset.count() > CHOICE_AUTOCOMPLETE_THRESHOLD:
+        field.widget = AutocompleteSelect(field.queryset, autocomplete_url)
+
+
+class ScopedChoicesMixin:
+    """
+    Scope model choice fields to a facility.
+
+    Subclasses map field names to a kind from ``selectors.choice_querysets`` in
+    ``scoped_choice_fields``; pass ``facility=`` when building the form.
+    """
+
+    scoped_choice_fields = {}
+
+    def __init__(self, *args, facility=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.facility = facility
+        querysets = choice_querysets(facility)
+        for name, kind in self.scoped_choice_fields.items():
+            if name not in self.fields:
+                continue
+            autocomplete_url = None
+            if facility is not None:
+                autocomplete_url = reverse(
+                    "facilities:autocomplete",
+                    kwargs={"facility_slug": facility.slug, "kind": kind},
+                )
+            scope_choice_field(self.fields[name], querysets[kind], autocomplete_url)
@@ -5,6 +5,7 @@ from django import forms
 from core.forms.base import BaseForm
 from core.mixins.forms import SuccessMessageMixin, PrefillFormMixin
 from ..models.facility import Facility
+from ..selectors import live_facilities_named
 
 
 class FacilityForm(SuccessMessageMixin, PrefillFormMixin, BaseForm):
@@ -32,11 +33,11 @@ class FacilityForm(SuccessMessageMixin, PrefillFormMixin, BaseForm):
 
     def clean_name(self):
         """
-        Ensure the facility name is unique within an organization.
+        Ensure the facility name is unique among the organization's live facilities.
         """
         name = self.cleaned_data.get("name")
         organization = self.cleaned_data.get("organization")
-        if Facility.objects.filter(name=name, organization=organization).exists():
+        if live_facilities_named(organization, name).exists():
             raise forms.ValidationError(
                 "A facility with this name already exists in the organization."
             )
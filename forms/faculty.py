@@ -4,16 +4,21 @@
 from django import forms
 
 from course.models.facility_class import FacilityClass
+from enrollment.models.temporal import Week
 from user.models import User
 from user.forms import ProfileUserFieldsMixin, RegistrationForm
 
 from ..models.faculty import FacultyProfile
-from ..models.quarters import Quarters
+from ..models.quarters import Quarters, QuartersType
 from ..models.department import Department
 from ..models.facility import Facility
+from ..models.organization_closure import OrganizationClosure
+from ..services.housing import auto_assign_quarters
+from ..services.roster import import_roster, read_roster_csv
+from .choices import ScopedChoicesMixin, scope_choice_field
 
 
-class FacultyRegistrationForm(RegistrationForm):
+class FacultyRegistrationForm(ScopedChoicesMixin, RegistrationForm):
     """A specialized registration form for faculty user creation.
 
     Extends the base RegistrationForm to include additional faculty-specific fields like first
@@ -49,6 +54,8 @@ class FacultyRegistrationForm(RegistrationForm):
         widget=forms.Select(attrs={"class": "form-control"}),
     )
 
+    scoped_choice_fields = {"facility": "facility"}
+
     class Meta(RegistrationForm.Meta):
         model = User
         fields = RegistrationForm.Meta.fields + ["first_name", "last_name"]
@@ -78,7 +85,7 @@ class FacultyRegistrationForm(RegistrationForm):
         return user
 
 
-class FacultyForm(ProfileUserFieldsMixin):
+class FacultyForm(ScopedChoicesMixin, ProfileUserFieldsMixin):
     """A comprehensive form for creating a new faculty user with detailed information.
 
     Provides a form interface for registering a faculty member with personal details, email,
@@ -107,6 +114,8 @@ class FacultyForm(ProfileUserFieldsMixin):
         widget=forms.Select(attrs={"class": "form-control"}),
     )
 
+    scoped_choice_fields = {"facility": "facility"}
+
     class Meta:
         model = FacultyProfile
         fields = ["facility", "role"]  # Fields specific to FacultyProfile
@@ -123,7 +132,7 @@ class FacultyForm(ProfileUserFieldsMixin):
         return profile
 
 
-class PromoteFacultyForm(forms.ModelForm):
+class PromoteFacultyForm(ScopedChoicesMixin, forms.ModelForm):
     """A form for promoting a faculty member to an administrative role.
 
     Provides a simple interface to toggle a user's administrative status using a checkbox input.
@@ -132,6 +141,8 @@ class PromoteFacultyForm(forms.ModelForm):
         role: Select the faculty role (facility admin or department admin).
     """
 
+    scoped_choice_fields = {"department": "department"}
+
     class Meta:
         model = FacultyProfile
         fields = ["role", "department"]
@@ -141,7 +152,7 @@ class PromoteFacultyForm(forms.ModelForm):
         }
 
 
-class AssignDepartmentForm(forms.ModelForm):
+class AssignDepartmentForm(ScopedChoicesMixin, forms.ModelForm):
     """
     Form for assigning a faculty member to a department.
     """
@@ -151,12 +162,14 @@ class AssignDepartmentForm(forms.ModelForm):
         widget=forms.Select(attrs={"class": "form-control"}),
     )
 
+    scoped_choice_fields = {"department": "department"}
+
     class Meta:
         model = FacultyProfile
         fields = ["department"]
 
 
-class AssignClassForm(forms.ModelForm):
+class AssignClassForm(ScopedChoicesMixin, forms.ModelForm):
     """
     Form for assigning a faculty member to a class.
     """
@@ -166,12 +179,14 @@ class AssignClassForm(forms.ModelForm):
         widget=forms.Select(attrs={"class": "form-control"}),
     )
 
+    scoped_choice_fields = {"facility_class": "facility_class"}
+
     class Meta:
         model = FacultyProfile
         fields = ["facility_class"]
 
 
-class ChangeQuartersForm(forms.ModelForm):
+class ChangeQuartersForm(ScopedChoicesMixin, forms.ModelForm):
     """
     Form for changing the quarters assigned to a faculty member.
     """
@@ -181,16 +196,88 @@ class ChangeQuartersForm(forms.ModelForm):
         widget=forms.Select(attrs={"class": "form-control"}),
     )
 
+    scoped_choice_fields = {"quarters": "quarters"}
+
     class Meta:
         model = FacultyProfile
         fields = ["quarters"]
 
 
-class FacultyQuartersAssignmentForm(forms.Form):
+class FacultyRosterImportForm(forms.Form):
+    """
+    Upload a CSV roster (username, email, first_name, last_name, role, department) to
+    create faculty for a facility in bulk.
+    """
+
+    roster = forms.FileField(
+        help_text="CSV with username, email, first_name, last_name, role, department.",
+    )
+
+    def save(self, facility):
+        """Import the uploaded roster and return ``{"created": n, "skipped": [...]}``."""
+        return import_roster(facility, read_roster_csv(self.cleaned_data["roster"].read()))
+
+
+class FacultyRosterFilterForm(forms.Form):
     """
-    Placeholder: Faculty assigned housing.
+    GET filters for the organization faculty roster; facility and department choices
+    cover every facility under ``organization``.
     """
-    quarters = forms.CharField(required=True)
+
+    role = forms.ChoiceField(
+        choices=[("", "Any role"), *FacultyProfile.FacultyRole.choices], required=False
+    )
+    facility = forms.ModelChoiceField(queryset=Facility.objects.none(), required=False)
+    department = forms.ModelChoiceField(queryset=Department.objects.none(), required=False)
+
+    def __init__(self, *args, organization, **kwargs):
+        super().__init__(*args, **kwargs)
+        facilities = Facility.objects.filter(
+            organization_id__in=OrganizationClosure.descendant_ids(organization)
+        )
+        scope_choice_field(self.fields["facility"], facilities)
+        scope_choice_field(
+            self.fields["department"], Department.objects.filter(facility__in=facilities)
+        )
+
+    def filter(self, queryset):
+        """Apply the filters to a ``FacultyRosterEntry`` queryset; invalid ones match nothing."""
+        if not self.is_valid():
+            return queryset.none()
+        data = self.cleaned_data
+        if data["role"]:
+            queryset = queryset.filter(role=data["role"])
+        if data["facility"]:
+            queryset = queryset.filter(facility=data["facility"])
+        if data["department"]:
+            queryset = queryset.filter(department=data["department"])
+        return queryset
+
+
+class FacultyQuartersAssignmentForm(ScopedChoicesMixin, forms.Form):
+    """
+    Auto-assign housing for a week's unassigned faculty and faction enrollments.
+    """
+
+    week = forms.ModelChoiceField(
+        queryset=Week.objects.all(),
+        widget=forms.Select(attrs={"class": "form-control"}),
+    )
+    quarters_type = forms.ModelChoiceField(
+        queryset=QuartersType.objects.all(),
+        required=False,
+        widget=forms.Select(attrs={"class": "form-control"}),
+    )
+
+    scoped_choice_fields = {"week": "week", "quarters_type": "quarters_type"}
+
+    def save(self, facility=None):
+        """Run the assignment engine and return ``(assigned, unplaced)``."""
+        return auto_assign_quarters(
+            facility or self.facility,
+            self.cleaned_data["week"],
+            quarters_type=self.cleaned_data.get("quarters_type"),
+        )
 
 
 
@@ -6,6 +6,7 @@ from core.forms.base import BaseForm
 from core.mixins.forms import SuccessMessageMixin, FormValidationMixin
 
 from ..models.quarters import Quarters, QuartersType
+from ..selectors import live_quarters_named, live_quarters_types_named
 
 
 class QuartersForm(SuccessMessageMixin, BaseForm, FormValidationMixin):
@@ -35,11 +36,11 @@ class QuartersForm(SuccessMessageMixin, BaseForm, FormValidationMixin):
 
     def clean_name(self):
         """
-        Ensure that Quarters name is unique within a facility.
+        Ensure that Quarters name is unique among the facility's live quarters.
         """
         name = self.cleaned_data.get("name")
         facility = self.cleaned_data.get("facility")
-        if Quarters.objects.filter(name=name, facility=facility).exists():
+        if live_quarters_named(facility, name).exists():
             raise forms.ValidationError(
                 "Quarters with this name already exist in the facility."
             )
@@ -67,11 +68,11 @@ class QuartersTypeForm(SuccessMessageMixin, BaseForm):
 
     def clean_name(self):
         """
-        Ensure that QuartersType name is unique within an organization.
+        Ensure that QuartersType name is unique among the organization's live types.
         """
         name = self.cleaned_data.get("name")
         organization = self.cleaned_data.get("organization")
-        if QuartersType.objects.filter(name=name, organization=organization).exists():
+        if live_quarters_types_named(organization, name).exists():
             raise forms.ValidationError(
                 "A quarters type with this name already exists in the organization."
             )
@@ -0,0 +1,165 @@
+# facility/management/commands/benchmark_facility_views.py
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.test import Client
+from django.test.utils import override_settings
+
+from facility.benchmarks import (
+    benchmark_facility_list,
+    benchmark_report_visibility,
+    run_benchmarks,
+    seed_facility,
+)
+from facility.models.faculty import FacultyProfile
+from user.models import User
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed synthetic facilities, measure query count, wall time and peak memory for "
+        "the facility views, and fail if any view exceeds its declared query budget. "
+        "All seeded data is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "organization_slug", help="Organization the synthetic facilities belong to."
+        )
+        parser.add_argument(
+            "--sizes",
+            default="10,1000,50000",
+            help="Comma-separated faculty counts to seed (default: 10,1000,50000).",
+        )
+        parser.add_argument(
+            "--quarters", type=int, default=5000, help="Quarters per facility."
+        )
+        parser.add_argument(
+            "--departments", type=int, default=25, help="Departments per facility."
+        )
+        parser.add_argument(
+            "--facilities",
+            type=int,
+            default=0,
+            help=(
+                "Also seed this many small facilities (e.g. 5000) and time the facility "
+                "list with each count column as the sort."
+            ),
+        )
+        parser.add_argument(
+            "--reports-user",
+            help=(
+                "Also time the dashboard report-visibility query for this username "
+                "against the existing report table."
+            ),
+        )
+
+    def handle(self, *args, **options):
+        organization_model = apps.get_model("organization", "Organization")
+        try:
+            organization = organization_model.objects.get(slug=options["organization_slug"])
+        except organization_model.DoesNotExist as exc:
+            raise CommandError("Organization not found.") from exc
+        sizes = [int(size) for size in options["sizes"].split(",") if size]
+
+        failures = []
+        with override_settings(ALLOWED_HOSTS=["*"]), transaction.atomic():
+            for size in sizes:
+                facility = seed_facility(
+                    organization,
+                    f"Benchmark Facility {size}",
+                    faculty=size,
+                    quarters=options["quarters"],
+                    departments=options["departments"],
+                )
+                admin = User.objects.create_superuser(
+                    username=f"benchmark.admin.{facility.pk}",
+                    email=f"benchmark.admin.{facility.pk}@example.com",
+                    password=None,
+                )
+                FacultyProfile.objects.create(
+                    user=admin,
+                    organization=organization,
+                    facility=facility,
+                    role=FacultyProfile.FacultyRole.ADMIN,
+                )
+                client = Client()
+                client.force_login(admin)
+
+                self.stdout.write(f"\n{size} faculty / {options['quarters']} quarters")
+                for row in run_benchmarks(client, facility):
+                    line = (
+                        f"  {row['label']:<18} status={row['status']} "
+                        f"queries={row['queries']}/{row['budget']} "
+                        f"time={row['seconds'] * 1000:.1f}ms peak={row['peak_kb']:.0f}KiB"
+                    )
+                    if row["over_budget"]:
+                        failures.append(f"{row['label']} at {size} faculty")
+                        self.stdout.write(self.style.ERROR(line))
+                    elif row["loose_budget"]:
+                        self.stdout.write(
+                            self.style.WARNING(f"{line} (budget above measured count)")
+                        )
+                    else:
+                        self.stdout.write(line)
+            if options["facilities"]:
+                failures.extend(
+                    self.benchmark_facility_list(organization, options["facilities"])
+                )
+            transaction.set_rollback(True)
+
+        if options["reports_user"]:
+            failures.extend(self.benchmark_reports(options["reports_user"]))
+
+        if failures:
+            raise CommandError("Benchmark failures: " + ", ".join(failures))
+        self.stdout.write(self.style.SUCCESS("\nAll views within their query budgets."))
+
+    def benchmark_facility_list(self, organization, count):
+        for index in range(count):
+            seed_facility(
+                organization,
+                f"Benchmark List Facility {index}",
+                faculty=2,
+                quarters=2,
+                departments=1,
+            )
+        admin = User.objects.create_superuser(
+            username="benchmark.list.admin",
+            email="benchmark.list.admin@example.com",
+            password=None,
+        )
+        client = Client()
+        client.force_login(admin)
+
+        failures = []
+        self.stdout.write(f"\nfacility list over {count} extra facilities")
+        for row in benchmark_facility_list(client):
+            line = (
+                f"  sort={row['sort']:<15} status={row['status']} "
+                f"queries={row['queries']}/{row['budget']} "
+                f"time={row['seconds'] * 1000:.1f}ms peak={row['peak_kb']:.0f}KiB"
+            )
+            if row["over_budget"] or row["status"] != 200:
+                failures.append(f"facility list sorted by {row['sort']}")
+                self.stdout.write(self.style.ERROR(line))
+            else:
+                self.stdout.write(line)
+        return failures
+
+    def benchmark_reports(self, username):
+        try:
+            user = User.objects.get(username=username)
+        except User.DoesNotExist as exc:
+            raise CommandError("Reports user not found.") from exc
+        row = benchmark_report_visibility(user)
+        self.stdout.write(
+            f"\nreport visibility over {row['table_rows']} reports: "
+            f"{row['visible_rows']} visible, "
+            f"legacy={row['legacy_seconds'] * 1000:.1f}ms "
+            f"exists={row['seconds'] * 1000:.1f}ms"
+        )
+        if not row["rows_match"]:
+            return ["report visibility rows differ from the legacy query"]
+        return []
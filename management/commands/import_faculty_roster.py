@@ -0,0 +1,39 @@
+# facility/management/commands/import_faculty_roster.py
+
+from django.core.management.base import BaseCommand, CommandError
+
+from facility.models.facility import Facility
+from facility.services.roster import ROSTER_BATCH_SIZE, import_roster, read_roster_csv
+
+
+class Command(BaseCommand):
+    help = (
+        "Create users and faculty profiles for a facility from a CSV with columns "
+        "username, email, first_name, last_name, role, department."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("facility_slug")
+        parser.add_argument("csv_path")
+        parser.add_argument("--batch-size", type=int, default=ROSTER_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        try:
+            facility = Facility.objects.get(slug=options["facility_slug"])
+        except Facility.DoesNotExist as exc:
+            raise CommandError("Facility not found.") from exc
+        except Facility.MultipleObjectsReturned as exc:
+            raise CommandError("Facility slug is ambiguous across organizations.") from exc
+
+        with open(options["csv_path"], newline="", encoding="utf-8-sig") as handle:
+            result = import_roster(
+                facility, read_roster_csv(handle), batch_size=options["batch_size"]
+            )
+
+        for line, reason in result["skipped"]:
+            self.stdout.write(self.style.WARNING(f"Line {line}: {reason}"))
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {result['created']} faculty; skipped {len(result['skipped'])}."
+            )
+        )
@@ -0,0 +1,13 @@
+# facility/management/commands/rebuild_department_closure.py
+
+from django.core.management.base import BaseCommand
+
+from facility.services.hierarchy import rebuild_department_closure
+
+
+class Command(BaseCommand):
+    help = "Recompute the department ancestor/descendant closure table."
+
+    def handle(self, *args, **options):
+        written = rebuild_department_closure()
+        self.stdout.write(self.style.SUCCESS(f"Wrote {written} closure rows."))
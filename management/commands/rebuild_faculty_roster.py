@@ -0,0 +1,29 @@
+# facility/management/commands/rebuild_faculty_roster.py
+
+from django.core.management.base import BaseCommand, CommandError
+
+from organization.models.organization import Organization
+from facility.services.faculty_roster import rebuild_faculty_roster
+
+
+class Command(BaseCommand):
+    help = "Re-project FacultyRosterEntry rows from faculty profiles and their related rows."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--organization",
+            dest="organization_slug",
+            help="Only rebuild the roster of this organization and its sub-organizations.",
+        )
+
+    def handle(self, *args, **options):
+        organization = None
+        if options["organization_slug"]:
+            organization = Organization.objects.filter(
+                slug=options["organization_slug"]
+            ).first()
+            if organization is None:
+                raise CommandError("Organization not found.")
+
+        written = rebuild_faculty_roster(organization)
+        self.stdout.write(self.style.SUCCESS(f"Wrote {written} roster rows."))
@@ -0,0 +1,14 @@
+# facility/management/commands/rebuild_organization_closure.py
+
+from django.apps import apps
+from django.core.management.base import BaseCommand
+
+from facility.services.hierarchy import rebuild_organization_closure
+
+
+class Command(BaseCommand):
+    help = "Recompute the organization ancestor/descendant closure table."
+
+    def handle(self, *args, **options):
+        written = rebuild_organization_closure(apps.get_model("organization", "Organization"))
+        self.stdout.write(self.style.SUCCESS(f"Wrote {written} closure rows."))
@@ -0,0 +1,42 @@
+# facility/management/commands/rebuild_quarters_occupancy.py
+
+from django.core.management.base import BaseCommand
+
+from facility.models.quarters import Quarters
+from facility.services.occupancy import occupancy_drift, rebuild_occupancy
+
+
+class Command(BaseCommand):
+    help = "Recount per-week quarters occupancy from enrollments and report any drift."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--facility",
+            dest="facility_slug",
+            help="Only rebuild quarters belonging to the facility with this slug.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report drift without writing corrected counts.",
+        )
+
+    def handle(self, *args, **options):
+        queryset = Quarters.objects.all()
+        if options["facility_slug"]:
+            queryset = queryset.filter(facility__slug=options["facility_slug"])
+
+        if options["dry_run"]:
+            drift = occupancy_drift(queryset)
+        else:
+            drift = rebuild_occupancy(queryset)
+
+        for pk, name, week_id, stored, actual in drift:
+            self.stdout.write(
+                f"{name} (#{pk}) week #{week_id}: stored {stored}, actual {actual}"
+            )
+
+        verb = "found" if options["dry_run"] else "fixed"
+        self.stdout.write(
+            self.style.SUCCESS(f"Occupancy drift {verb} on {len(drift)} quarters week(s).")
+        )
@@ -0,0 +1,35 @@
+# facility/management/commands/reconcile_facility_stats.py
+
+from django.core.management.base import BaseCommand, CommandError
+
+from facility.models.facility import Facility
+from facility.services.facility_stats import reconcile_facility_stats
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute FacilityStats from the source tables and fix any drift. "
+        "Intended to run nightly."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--facility",
+            dest="facility_slug",
+            help="Only reconcile the facility with this slug.",
+        )
+
+    def handle(self, *args, **options):
+        facility_ids = None
+        if options["facility_slug"]:
+            facility = Facility.objects.filter(slug=options["facility_slug"]).first()
+            if facility is None:
+                raise CommandError("Facility not found.")
+            facility_ids = [facility.pk]
+
+        drifted = reconcile_facility_stats(facility_ids)
+        for facility_id in drifted:
+            self.stdout.write(f"facility {facility_id}: rewritten")
+        self.stdout.write(
+            self.style.SUCCESS(f"Reconciled facility stats; {len(drifted)} row(s) rewritten.")
+        )
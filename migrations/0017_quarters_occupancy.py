@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("facility", "0016_facultyprofile_department_facultyprofile_role"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="quarters",
+            name="occupancy",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+    ]
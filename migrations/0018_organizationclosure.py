@@ -0,0 +1,78 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def build_closure(apps, schema_editor):
+    Organization = apps.get_model("organization", "Organization")
+    OrganizationClosure = apps.get_model("facility", "OrganizationClosure")
+    parent_map = dict(Organization._base_manager.values_list("pk", "parent_id"))
+    rows = []
+    for node in parent_map:
+        ancestor, depth, seen = node, 0, set()
+        while ancestor is not None and ancestor not in seen:
+            rows.append(
+                OrganizationClosure(ancestor_id=ancestor, descendant_id=node, depth=depth)
+            )
+            seen.add(ancestor)
+            ancestor = parent_map.get(ancestor)
+            depth += 1
+    OrganizationClosure.objects.bulk_create(rows, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("facility", "0017_quarters_occupancy"),
+        ("organization", "0008_organization_address"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="OrganizationClosure",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("depth", models.PositiveIntegerField()),
+                (
+                    "ancestor",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="descendant_links",
+                        to="organization.organization",
+                    ),
+                ),
+                (
+                    "descendant",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="ancestor_links",
+                        to="organization.organization",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Organization Closure",
+                "verbose_name_plural": "Organization Closures",
+                "indexes": [
+                    models.Index(
+                        fields=["descendant", "depth"],
+                        name="org_closure_desc_depth_idx",
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("ancestor", "descendant"),
+                        name="unique_organization_closure_pair",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(build_closure, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,55 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("facility", "0018_organizationclosure"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="quarters",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["facility", "name"],
+                name="quarters_fac_name_live_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="quarterstype",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["organization", "name"],
+                name="quarterstype_org_name_live_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="facility",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["organization", "name"],
+                name="facility_org_name_live_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="department",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["facility", "name"],
+                name="department_fac_name_live_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="facultyprofile",
+            index=models.Index(
+                fields=["facility", "role"], name="faculty_facility_role_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="facultyprofile",
+            index=models.Index(
+                fields=["facility", "department"], name="faculty_facility_dept_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,77 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def build_closure(apps, schema_editor):
+    Department = apps.get_model("facility", "Department")
+    DepartmentClosure = apps.get_model("facility", "DepartmentClosure")
+    parent_map = dict(Department._base_manager.values_list("pk", "parent_id"))
+    rows = []
+    for node in parent_map:
+        ancestor, depth, seen = node, 0, set()
+        while ancestor is not None and ancestor not in seen:
+            rows.append(
+                DepartmentClosure(ancestor_id=ancestor, descendant_id=node, depth=depth)
+            )
+            seen.add(ancestor)
+            ancestor = parent_map.get(ancestor)
+            depth += 1
+    DepartmentClosure.objects.bulk_create(rows, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("facility", "0019_facility_lookup_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DepartmentClosure",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("depth", models.PositiveIntegerField()),
+                (
+                    "ancestor",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="descendant_links",
+                        to="facility.department",
+                    ),
+                ),
+                (
+                    "descendant",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="ancestor_links",
+                        to="facility.department",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Department Closure",
+                "verbose_name_plural": "Department Closures",
+                "indexes": [
+                    models.Index(
+                        fields=["descendant", "depth"],
+                        name="dept_closure_desc_depth_idx",
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("ancestor", "descendant"),
+                        name="unique_department_closure_pair",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(build_closure, migrations.RunPython.noop),
+    ]
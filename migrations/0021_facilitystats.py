@@ -0,0 +1,131 @@
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Q, Sum
+from django.utils import timezone
+
+ROLE_FIELDS = {
+    "ADMIN": "admin_count",
+    "DEPARTMENT_ADMIN": "department_admin_count",
+    "STAFF": "staff_count",
+}
+
+
+def _live(model):
+    queryset = model._base_manager.all()
+    if any(field.name == "is_deleted" for field in model._meta.concrete_fields):
+        queryset = queryset.filter(is_deleted=False)
+    return queryset
+
+
+def _grouped(queryset, facility_field, **aggregates):
+    rows = (
+        queryset.filter(**{f"{facility_field}__isnull": False})
+        .order_by()
+        .values(facility_field)
+        .annotate(**aggregates)
+    )
+    return {row.pop(facility_field): row for row in rows}
+
+
+def build_stats(apps, schema_editor):
+    Facility = apps.get_model("facility", "Facility")
+    FacilityStats = apps.get_model("facility", "FacilityStats")
+    FacultyProfile = apps.get_model("facility", "FacultyProfile")
+    Department = apps.get_model("facility", "Department")
+    Quarters = apps.get_model("facility", "Quarters")
+    FacilityEnrollment = apps.get_model("enrollment", "FacilityEnrollment")
+    try:
+        FacilityClass = apps.get_model("course", "FacilityClass")
+    except LookupError:
+        FacilityClass = None
+
+    sources = [
+        _grouped(
+            _live(FacultyProfile),
+            "facility_id",
+            faculty_count=Count("pk"),
+            **{
+                field: Count("pk", filter=Q(role=role))
+                for role, field in ROLE_FIELDS.items()
+            },
+        ),
+        _grouped(_live(Department), "facility_id", department_count=Count("pk")),
+        _grouped(
+            _live(Quarters),
+            "facility_id",
+            quarters_count=Count("pk"),
+            total_beds=Sum("capacity"),
+            occupied_beds=Sum("occupancy"),
+        ),
+        _grouped(
+            _live(FacilityEnrollment), "facility_id", enrollment_count=Count("pk")
+        ),
+    ]
+    if FacilityClass is not None:
+        sources.append(
+            _grouped(
+                _live(FacilityClass),
+                "facility_enrollment__facility_id",
+                class_count=Count("pk"),
+            )
+        )
+
+    now = timezone.now()
+    rows = []
+    for facility_id in Facility._base_manager.values_list("pk", flat=True).iterator():
+        counts = {}
+        for source in sources:
+            counts.update(source.get(facility_id, {}))
+        counts = {field: value or 0 for field, value in counts.items()}
+        rows.append(FacilityStats(facility_id=facility_id, reconciled_at=now, **counts))
+    FacilityStats.objects.bulk_create(rows, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("facility", "0020_departmentclosure"),
+        ("enrollment", "0016_alter_facultyclassenrollment_options_and_more"),
+        ("course", "__first__"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="FacilityStats",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("faculty_count", models.IntegerField(default=0)),
+                ("admin_count", models.IntegerField(default=0)),
+                ("department_admin_count", models.IntegerField(default=0)),
+                ("staff_count", models.IntegerField(default=0)),
+                ("department_count", models.IntegerField(default=0)),
+                ("quarters_count", models.IntegerField(default=0)),
+                ("total_beds", models.IntegerField(default=0)),
+                ("occupied_beds", models.IntegerField(default=0)),
+                ("enrollment_count", models.IntegerField(default=0)),
+                ("class_count", models.IntegerField(default=0)),
+                ("reconciled_at", models.DateTimeField(blank=True, null=True)),
+                (
+                    "facility",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="stats",
+                        to="facility.facility",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Facility Stats",
+                "verbose_name_plural": "Facility Stats",
+            },
+        ),
+        migrations.RunPython(build_stats, migrations.RunPython.noop),
+    ]
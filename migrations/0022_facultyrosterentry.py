@@ -0,0 +1,146 @@
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def build_roster(apps, schema_editor):
+    FacultyProfile = apps.get_model("facility", "FacultyProfile")
+    FacultyRosterEntry = apps.get_model("facility", "FacultyRosterEntry")
+    profiles = FacultyProfile._base_manager.select_related("user", "facility", "department")
+    rows = []
+    for profile in profiles.iterator():
+        facility, department, user = profile.facility, profile.department, profile.user
+        rows.append(
+            FacultyRosterEntry(
+                profile_id=profile.pk,
+                user_id=profile.user_id,
+                organization_id=(
+                    facility.organization_id if facility else profile.organization_id
+                ),
+                facility_id=profile.facility_id,
+                department_id=profile.department_id,
+                role=profile.role,
+                profile_slug=profile.slug or "",
+                first_name=user.first_name or "",
+                last_name=user.last_name or "",
+                email=user.email or "",
+                facility_name=facility.name if facility else "",
+                facility_slug=facility.slug if facility else "",
+                department_name=department.name if department else "",
+            )
+        )
+    FacultyRosterEntry.objects.bulk_create(rows, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("facility", "0021_facilitystats"),
+        ("organization", "0008_organization_address"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="FacultyRosterEntry",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "role",
+                    models.CharField(
+                        choices=[
+                            ("ADMIN", "Facility Admin"),
+                            ("DEPARTMENT_ADMIN", "Department Admin"),
+                            ("STAFF", "Faculty"),
+                        ],
+                        default="STAFF",
+                        max_length=32,
+                    ),
+                ),
+                ("profile_slug", models.CharField(blank=True, max_length=255)),
+                ("first_name", models.CharField(blank=True, max_length=150)),
+                ("last_name", models.CharField(blank=True, max_length=150)),
+                ("email", models.CharField(blank=True, max_length=254)),
+                ("facility_name", models.CharField(blank=True, max_length=255)),
+                ("facility_slug", models.CharField(blank=True, max_length=255)),
+                ("department_name", models.CharField(blank=True, max_length=255)),
+                ("refreshed_at", models.DateTimeField(auto_now=True)),
+                (
+                    "profile",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="roster_entry",
+                        to="facility.facultyprofile",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "organization",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="organization.organization",
+                    ),
+                ),
+                (
+                    "facility",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="facility.facility",
+                    ),
+                ),
+                (
+                    "department",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="facility.department",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Faculty Roster Entry",
+                "verbose_name_plural": "Faculty Roster Entries",
+                "indexes": [
+                    models.Index(
+                        fields=["organization", "last_name", "first_name"],
+                        name="roster_org_name_idx",
+                    ),
+                    models.Index(
+                        fields=["organization", "role"], name="roster_org_role_idx"
+                    ),
+                    models.Index(
+                        fields=["organization", "facility"],
+                        name="roster_org_facility_idx",
+                    ),
+                    models.Index(
+                        fields=["organization", "department"],
+                        name="roster_org_dept_idx",
+                    ),
+                ],
+            },
+        ),
+        migrations.RunPython(build_roster, migrations.RunPython.noop),
+    ]
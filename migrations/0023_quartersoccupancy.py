@@ -0,0 +1,119 @@
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count
+
+SCOPE_FIELDS = ("week", "facility_enrollment")
+
+
+def fill_occupancy(apps, schema_editor):
+    """
+    Count the live enrollment rows reserving each quarters in each week they cover:
+    their own week, or every week of their facility enrollment.
+    """
+    QuartersOccupancy = apps.get_model("facility", "QuartersOccupancy")
+    Week = apps.get_model("enrollment", "Week")
+
+    session_weeks = {}
+    weeks = Week._base_manager.values_list("facility_enrollment_id", "pk")
+    for session_id, week_id in weeks:
+        session_weeks.setdefault(session_id, []).append(week_id)
+
+    counts = {}
+    for model in apps.get_app_config("enrollment").get_models():
+        field_names = {field.name for field in model._meta.concrete_fields}
+        scope = next((name for name in SCOPE_FIELDS if name in field_names), None)
+        if scope is None:
+            continue
+        for field in model._meta.concrete_fields:
+            if not field.many_to_one:
+                continue
+            if field.related_model._meta.label_lower != "facility.quarters":
+                continue
+            rows = model._base_manager.filter(
+                **{f"{field.name}__isnull": False, f"{scope}__isnull": False}
+            )
+            if "is_deleted" in field_names:
+                rows = rows.filter(is_deleted=False)
+            rows = rows.order_by().values_list(field.attname, f"{scope}_id").annotate(
+                reserved=Count("pk")
+            )
+            for quarters_id, scope_id, reserved in rows:
+                if scope == "week":
+                    week_ids = [scope_id]
+                else:
+                    week_ids = session_weeks.get(scope_id, [])
+                for week_id in week_ids:
+                    key = (quarters_id, week_id)
+                    counts[key] = counts.get(key, 0) + reserved
+
+    QuartersOccupancy.objects.bulk_create(
+        [
+            QuartersOccupancy(quarters_id=quarters_id, week_id=week_id, occupancy=count)
+            for (quarters_id, week_id), count in counts.items()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+    """
+    Replace the season-wide ``Quarters.occupancy`` counter with per-week
+    ``QuartersOccupancy`` rows, counted from the enrollment rows that reserve quarters.
+    """
+
+    dependencies = [
+        ("facility", "0022_facultyrosterentry"),
+        ("enrollment", "0016_alter_facultyclassenrollment_options_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="QuartersOccupancy",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("occupancy", models.PositiveIntegerField(default=0)),
+                (
+                    "quarters",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="week_occupancy",
+                        to="facility.quarters",
+                    ),
+                ),
+                (
+                    "week",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="enrollment.week",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Quarters Occupancy",
+                "verbose_name_plural": "Quarters Occupancy",
+                "indexes": [
+                    models.Index(
+                        fields=["week", "quarters"], name="quarters_occ_week_idx"
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("quarters", "week"),
+                        name="unique_quarters_week_occupancy",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(fill_occupancy, migrations.RunPython.noop),
+        migrations.RemoveField(model_name="quarters", name="occupancy"),
+        migrations.RemoveField(model_name="facilitystats", name="occupied_beds"),
+    ]
@@ -1,6 +1,22 @@
 from .facility import Facility
 from .department import Department
 from .quarters import Quarters, QuartersType
+from .quarters_occupancy import QuartersOccupancy
 from .faculty import FacultyProfile
+from .organization_closure import OrganizationClosure
+from .department_closure import DepartmentClosure
+from .facility_stats import FacilityStats
+from .faculty_roster import FacultyRosterEntry
 
-__all__ = ["Facility", "Department", "Quarters", "QuartersType", "FacultyProfile"]
+__all__ = [
+    "Facility",
+    "Department",
+    "Quarters",
+    "QuartersType",
+    "QuartersOccupancy",
+    "FacultyProfile",
+    "OrganizationClosure",
+    "DepartmentClosure",
+    "FacilityStats",
+    "FacultyRosterEntry",
+]
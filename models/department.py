@@ -1,11 +1,14 @@
 """ Department Related Models. """
 
+from django.core.exceptions import ValidationError
 from django.db import models
 from django.urls import reverse
 
 from core.mixins import models as mixins
 from core.mixins import settings as stgs
 
+from .department_closure import DepartmentClosure
+
 
 class Department(
     mixins.NameDescriptionMixin,
@@ -44,6 +47,9 @@ class Department(
         get_fallback_chain():
             Returns a predefined chain of related model names for fallback purposes.
 
+        descendants(), ancestors(), faculty_in_subtree():
+            Subtree queries answered by ``DepartmentClosure`` in a single query each.
+
     Returns:
         str: The absolute URL for the department's detail view from the get_absolute_url method.
         list: A list of strings representing the fallback chain of model names from the 
@@ -55,17 +61,39 @@ class Department(
         "Facility", on_delete=models.CASCADE, related_name="departments"
     )
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["facility", "name"],
+                condition=models.Q(is_deleted=False),
+                name="department_fac_name_live_idx",
+            ),
+        ]
+
     def __str__(self):
         return f"{self.name}"
 
+    def clean(self):
+        """Reject a parent that is this department or one of its descendants."""
+        super().clean()
+        if self.pk is None or self.parent_id is None:
+            return
+        if (
+            self.parent_id == self.pk
+            or DepartmentClosure.descendant_ids(self).filter(descendant_id=self.parent_id).exists()
+        ):
+            raise ValidationError(
+                {"parent": "A department cannot be moved under itself or its own sub-departments."}
+            )
+
     def get_absolute_url(self):
         """
         get_absolute_url constructs the absolute URL for a department instance, allowing for easy 
         navigation to its detail view.
 
         This method utilizes Django's reverse function to generate a URL based on the department's 
-        associated facility and its own slug. It ensures that the correct URL is returned for 
-        accessing the department's detail page.
+        associated facility and its own slug. A ``facility_slug`` annotation, when present, is 
+        used instead of loading the facility so list rows do not issue one query each.
 
         Returns:
             str: The absolute URL for the department's detail view.
@@ -73,8 +101,33 @@ class Department(
 
         return reverse(
             "facilities:departments:show",
-            kwargs={"facility_slug": self.facility.slug, "department_slug": self.slug},
+            kwargs={
+                "facility_slug": getattr(self, "facility_slug", None) or self.facility.slug,
+                "department_slug": self.slug,
+            },
         )
 
     def get_fallback_chain(self):
         return ["facility", "facility.organization"]
+
+    def descendants(self, include_self=False):
+        """Departments below this one, at any depth."""
+        return Department.objects.filter(
+            pk__in=DepartmentClosure.descendant_ids(self, include_self=include_self)
+        )
+
+    def ancestors(self, include_self=False):
+        """Departments above this one, root first."""
+        min_depth = 0 if include_self else 1
+        return Department.objects.filter(
+            descendant_links__descendant=self,
+            descendant_links__depth__gte=min_depth,
+        ).order_by("-descendant_links__depth")
+
+    def faculty_in_subtree(self):
+        """Faculty assigned to this department or any department below it."""
+        from .faculty import FacultyProfile
+
+        return FacultyProfile.objects.filter(
+            department__in=DepartmentClosure.descendant_ids(self)
+        ).select_related("user", "department")
@@ -0,0 +1,52 @@
+# facility/models/department_closure.py
+
+from django.db import models
+
+
+class DepartmentClosure(models.Model):
+    """
+    Ancestor/descendant closure of the department tree.
+
+    Mirrors ``OrganizationClosure``: one row per (ancestor, descendant) pair, including
+    each department paired with itself at depth 0, so subtree and ancestor lookups are
+    one indexed join. Maintained by ``facility.signals``; rebuild with
+    ``manage.py rebuild_department_closure``.
+    """
+
+    ancestor = models.ForeignKey(
+        "facility.Department",
+        on_delete=models.CASCADE,
+        related_name="descendant_links",
+    )
+    descendant = models.ForeignKey(
+        "facility.Department",
+        on_delete=models.CASCADE,
+        related_name="ancestor_links",
+    )
+    depth = models.PositiveIntegerField()
+
+    class Meta:
+        verbose_name = "Department Closure"
+        verbose_name_plural = "Department Closures"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["ancestor", "descendant"],
+                name="unique_department_closure_pair",
+            )
+        ]
+        indexes = [
+            models.Index(
+                fields=["descendant", "depth"], name="dept_closure_desc_depth_idx"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.ancestor_id} -> {self.descendant_id} ({self.depth})"
+
+    @classmethod
+    def descendant_ids(cls, department, include_self=True):
+        """Subquery of the ids below ``department`` (and itself unless excluded)."""
+        links = cls.objects.filter(ancestor=department)
+        if not include_self:
+            links = links.filter(depth__gt=0)
+        return links.values("descendant_id")
@@ -6,6 +6,8 @@ from django.urls import reverse
 from core.mixins import models as mixins
 from core.mixins import settings as stgs
 
+from .organization_closure import OrganizationClosure
+
 
 class Facility(mixins.HierarchicalEntity, mixins.AddressableMixin, stgs.SettingsMixin, models.Model):
     """Facility Model."""
@@ -24,7 +26,8 @@ class Facility(mixins.HierarchicalEntity, mixins.AddressableMixin, stgs.Settings
         return reverse("facility_show", kwargs={"facility_slug": self.slug})
 
     def get_root_organization(self):
-        return self.organization.get_root_organization()
+        root = OrganizationClosure.root_for(self.organization_id)
+        return root or self.organization.get_root_organization()
 
     def get_fallback_chain(self):
         return ['organization']
@@ -35,3 +38,10 @@ class Facility(mixins.HierarchicalEntity, mixins.AddressableMixin, stgs.Settings
                 fields=["organization", "slug"], name="unique_facility_slug_per_org"
             )
         ]
+        indexes = [
+            models.Index(
+                fields=["organization", "name"],
+                condition=models.Q(is_deleted=False),
+                name="facility_org_name_live_idx",
+            ),
+        ]
@@ -0,0 +1,58 @@
+# facility/models/facility_stats.py
+
+from django.db import models
+
+
+class FacilityStats(models.Model):
+    """
+    Denormalized per-facility counters.
+
+    One row per facility, read by the facility dashboard instead of running an aggregate
+    per metric. Kept current by delta updates from ``facility.signals`` and repaired by
+    ``manage.py reconcile_facility_stats``; rows are created on first use.
+    """
+
+    COUNTER_FIELDS = (
+        "faculty_count",
+        "admin_count",
+        "department_admin_count",
+        "staff_count",
+        "department_count",
+        "quarters_count",
+        "total_beds",
+        "enrollment_count",
+        "class_count",
+    )
+
+    facility = models.OneToOneField(
+        "facility.Facility", on_delete=models.CASCADE, related_name="stats"
+    )
+    faculty_count = models.IntegerField(default=0)
+    admin_count = models.IntegerField(default=0)
+    department_admin_count = models.IntegerField(default=0)
+    staff_count = models.IntegerField(default=0)
+    department_count = models.IntegerField(default=0)
+    quarters_count = models.IntegerField(default=0)
+    total_beds = models.IntegerField(default=0)
+    enrollment_count = models.IntegerField(default=0)
+    class_count = models.IntegerField(default=0)
+    reconciled_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name = "Facility Stats"
+        verbose_name_plural = "Facility Stats"
+
+    def __str__(self):
+        return f"Stats for facility {self.facility_id}"
+
+    def as_metrics(self):
+        return {
+            "Faculty": self.faculty_count,
+            "Facility Admins": self.admin_count,
+            "Department Admins": self.department_admin_count,
+            "Departments": self.department_count,
+            "Quarters": self.quarters_count,
+            "Beds": self.total_beds,
+            "Enrollments": self.enrollment_count,
+            "Classes": self.class_count,
+        }
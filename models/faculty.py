@@ -5,6 +5,9 @@ from django.db import models
 from user.models import BaseUserProfile
 from enrollment.models.faculty import FacultyEnrollment
 
+from ..managers.faculty import FacultyManager
+from .organization_closure import OrganizationClosure
+
 
 class FacultyProfile(BaseUserProfile):
     class FacultyRole(models.TextChoices):
@@ -25,6 +28,14 @@ class FacultyProfile(BaseUserProfile):
                 name="unique_faculty_per_facility_user",
             ),
         ]
+        indexes = [
+            models.Index(
+                fields=["facility", "role"], name="faculty_facility_role_idx"
+            ),
+            models.Index(
+                fields=["facility", "department"], name="faculty_facility_dept_idx"
+            ),
+        ]
 
     role = models.CharField(
         max_length=32,
@@ -42,6 +53,8 @@ class FacultyProfile(BaseUserProfile):
         "facility.Facility", on_delete=models.SET_NULL, null=True, blank=True
     )
 
+    objects = FacultyManager()
+
     @property
     def is_facility_admin(self):
         return self.role == self.FacultyRole.ADMIN
@@ -60,11 +73,27 @@ class FacultyProfile(BaseUserProfile):
         """
         return FacultyEnrollment.objects.filter(faculty=self)
 
+    @property
+    def enrollment_list(self):
+        """
+        This faculty member's enrollments, as a list.
+
+        Reads ``prefetched_enrollments`` when the profile was loaded with
+        ``FacultyProfileQuerySet.with_enrollments`` or ``prime_enrollments``; otherwise
+        queries once and keeps the result on the instance.
+        """
+        prefetched = getattr(self, "prefetched_enrollments", None)
+        if prefetched is None:
+            prefetched = list(self.enrollments)
+            self.prefetched_enrollments = prefetched
+        return prefetched
+
     def get_root_organization(self):
         """Return the root organization for this faculty member."""
-        if self.organization:
-            return self.organization.get_root_organization()
-        return None
+        if not self.organization_id:
+            return None
+        root = OrganizationClosure.root_for(self.organization_id)
+        return root or self.organization.get_root_organization()
 
     def get_fallback_chain(self):
         return ["facility", "facility.organization"]
@@ -75,7 +104,8 @@ class FacultyProfile(BaseUserProfile):
         return reverse(
             "facilities:faculty:show",
             kwargs={
-                "facility_slug": self.facility.slug,
+                # Prefer a ``facility_slug`` annotation over loading the facility.
+                "facility_slug": getattr(self, "facility_slug", None) or self.facility.slug,
                 "faculty_slug": self.slug,
             },
         )
@@ -0,0 +1,60 @@
+# facility/models/organization_closure.py
+
+from django.db import models
+
+
+class OrganizationClosure(models.Model):
+    """
+    Ancestor/descendant closure of the organization tree.
+
+    One row per (ancestor, descendant) pair, including each organization paired with
+    itself at depth 0, so subtree and root lookups are a single indexed join instead of
+    a recursive walk. Maintained by ``facility.signals`` whenever an organization is
+    created or moved; rebuild with ``manage.py rebuild_organization_closure``.
+    """
+
+    ancestor = models.ForeignKey(
+        "organization.Organization",
+        on_delete=models.CASCADE,
+        related_name="descendant_links",
+    )
+    descendant = models.ForeignKey(
+        "organization.Organization",
+        on_delete=models.CASCADE,
+        related_name="ancestor_links",
+    )
+    depth = models.PositiveIntegerField()
+
+    class Meta:
+        verbose_name = "Organization Closure"
+        verbose_name_plural = "Organization Closures"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["ancestor", "descendant"],
+                name="unique_organization_closure_pair",
+            )
+        ]
+        indexes = [
+            models.Index(
+                fields=["descendant", "depth"], name="org_closure_desc_depth_idx"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.ancestor_id} -> {self.descendant_id} ({self.depth})"
+
+    @classmethod
+    def descendant_ids(cls, organization):
+        """Subquery of the ids of ``organization`` and everything below it."""
+        return cls.objects.filter(ancestor=organization).values("descendant_id")
+
+    @classmethod
+    def root_for(cls, organization_id):
+        """Return the root organization above ``organization_id``, or ``None``."""
+        link = (
+            cls.objects.filter(descendant_id=organization_id)
+            .select_related("ancestor")
+            .order_by("-depth")
+            .first()
+        )
+        return link.ancestor if link else None
@@ -11,6 +11,15 @@ class QuartersType(mixins.NameDescriptionMixin, mixins.TimestampMixin, mixins.So
         "organization.Organization", on_delete=models.SET_NULL, null=True, blank=True
     )
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["organization", "name"],
+                condition=models.Q(is_deleted=False),
+                name="quarterstype_org_name_live_idx",
+            ),
+        ]
+
     def __str__(self):
         return f"{self.name}"
 
@@ -28,9 +37,30 @@ class Quarters(mixins.NameDescriptionMixin, mixins.TimestampMixin, mixins.SoftDe
         "Facility", on_delete=models.CASCADE, related_name="quarters"
     )
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["facility", "name"],
+                condition=models.Q(is_deleted=False),
+                name="quarters_fac_name_live_idx",
+            ),
+        ]
+
     def __str__(self):
         return self.name
 
+    @property
+    def available_beds(self):
+        """
+        Free beds given a ``reserved_beds`` annotation (``selectors.available_quarters``
+        or ``with_current_occupancy``), or ``None`` without one; occupancy is kept per
+        week in ``QuartersOccupancy``, so an unannotated row cannot know it.
+        """
+        reserved = getattr(self, "reserved_beds", None)
+        if reserved is None:
+            return None
+        return max(self.capacity - reserved, 0)
+
     def get_absolute_url(self):
         return reverse("quarters_show", kwargs={"quarters_slug": self.slug})
 
@@ -0,0 +1,37 @@
+# facility/models/quarters_occupancy.py
+
+from django.db import models
+
+
+class QuartersOccupancy(models.Model):
+    """
+    Beds reserved in one quarters during one week.
+
+    Keyed per week so a reservation only fills the weeks it covers: rows scoped to a
+    week count there, rows scoped to a facility enrollment count in each of its weeks.
+    Kept current by delta updates from ``facility.signals``; recount with
+    ``manage.py rebuild_quarters_occupancy``.
+    """
+
+    quarters = models.ForeignKey(
+        "facility.Quarters", on_delete=models.CASCADE, related_name="week_occupancy"
+    )
+    week = models.ForeignKey(
+        "enrollment.Week", on_delete=models.CASCADE, related_name="+"
+    )
+    occupancy = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        verbose_name = "Quarters Occupancy"
+        verbose_name_plural = "Quarters Occupancy"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["quarters", "week"], name="unique_quarters_week_occupancy"
+            )
+        ]
+        indexes = [
+            models.Index(fields=["week", "quarters"], name="quarters_occ_week_idx"),
+        ]
+
+    def __str__(self):
+        return f"Quarters {self.quarters_id}, week {self.week_id}: {self.occupancy}"
@@ -0,0 +1,174 @@
+""" Facility Table Paginators. """
+
+import base64
+import json
+
+from django.db import connection
+from django.db.models import Q
+
+
+def encode_cursor(values, direction, ordering=()):
+    payload = {"k": list(values), "d": direction}
+    if ordering:
+        payload["o"] = list(ordering)
+    payload = json.dumps(payload, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor, ordering=()):
+    """
+    Return ``(values, direction)`` for an opaque cursor, or ``(None, "next")``. A cursor
+    issued for a different ``ordering`` (the table was re-sorted) is ignored.
+    """
+    if not cursor:
+        return None, "next"
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if ordering and payload.get("o", list(ordering)) != list(ordering):
+            return None, "next"
+        direction = payload["d"] if payload["d"] in ("next", "prev") else "next"
+        return list(payload["k"]), direction
+    except (ValueError, KeyError, TypeError, AttributeError):
+        return None, "next"
+
+
+def _field_name(field):
+    return field.lstrip("-")
+
+
+def _reverse(field):
+    return field[1:] if field.startswith("-") else f"-{field}"
+
+
+def keyset_filter(ordering, values, direction):
+    """
+    ``Q`` selecting rows strictly after (or before) ``values`` in ``ordering``, i.e. the
+    expanded form of ``(a, b, c) > (x, y, z)``. Fields prefixed with ``-`` sort
+    descending.
+    """
+    condition = Q()
+    for index, field in enumerate(ordering):
+        ascending = not field.startswith("-")
+        lookup = "gt" if (direction == "next") == ascending else "lt"
+        step = Q(**{_field_name(f): v for f, v in zip(ordering[:index], values)})
+        step &= Q(**{f"{_field_name(field)}__{lookup}": values[index]})
+        condition |= step
+    return condition
+
+
+def estimated_count(queryset):
+    """
+    Planner row estimate for an unfiltered table on PostgreSQL, otherwise an exact count.
+    """
+    if connection.vendor == "postgresql" and not queryset.query.where:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE relname = %s",
+                [queryset.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+        if row and row[0] >= 0:
+            return row[0]
+    return queryset.count()
+
+
+class KeysetPage:
+    """One page of a ``KeysetPaginator``; exposes opaque next/previous cursors."""
+
+    number = 1
+
+    def __init__(self, object_list, paginator, next_cursor=None, previous_cursor=None):
+        self.object_list = object_list
+        self.paginator = paginator
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+
+class KeysetPaginator:
+    """
+    Cursor pagination over a stable ordering instead of OFFSET.
+
+    Accepts a queryset or django-tables2 ``BoundRows`` (as ``Table.paginate`` passes) and
+    always orders on ``ordering`` (``-`` prefixes allowed), which must end in a unique
+    column. The total is only computed when asked for: ``count_mode`` is ``None`` (no
+    count), ``"exact"`` or ``"estimate"``.
+    """
+
+    def __init__(
+        self,
+        object_list,
+        per_page,
+        orphans=0,
+        allow_empty_first_page=True,
+        cursor=None,
+        ordering=("name", "pk"),
+        count_mode=None,
+    ):
+        self.rows = object_list
+        # BoundRows -> TableQuerysetData -> QuerySet
+        self.queryset = getattr(getattr(object_list, "data", None), "data", object_list)
+        self.per_page = int(per_page)
+        self.cursor = cursor
+        self.ordering = tuple(ordering)
+        self.count_mode = count_mode
+        self.num_pages = None
+
+    @property
+    def count(self):
+        if self.count_mode == "exact":
+            return self.queryset.count()
+        if self.count_mode == "estimate":
+            return estimated_count(self.queryset)
+        return None
+
+    def _key(self, record):
+        return [getattr(record, _field_name(field)) for field in self.ordering]
+
+    def _wrap(self, records):
+        table = getattr(self.rows, "table", None)
+        if table is None:
+            return records
+        return type(self.rows)(data=records, table=table)
+
+    def page(self, number=1):
+        values, direction = decode_cursor(self.cursor, self.ordering)
+        queryset = self.queryset
+        if values is not None and len(values) == len(self.ordering):
+            queryset = queryset.filter(keyset_filter(self.ordering, values, direction))
+        else:
+            values, direction = None, "next"
+
+        if direction == "next":
+            records = list(queryset.order_by(*self.ordering)[: self.per_page + 1])
+            more = len(records) > self.per_page
+            records = records[: self.per_page]
+            has_next, has_previous = more, values is not None
+        else:
+            reverse = [_reverse(field) for field in self.ordering]
+            records = list(queryset.order_by(*reverse)[: self.per_page + 1])
+            more = len(records) > self.per_page
+            records = list(reversed(records[: self.per_page]))
+            has_next, has_previous = True, more
+
+        next_cursor = previous_cursor = None
+        if records and has_next:
+            next_cursor = encode_cursor(self._key(records[-1]), "next", self.ordering)
+        if records and has_previous:
+            previous_cursor = encode_cursor(self._key(records[0]), "prev", self.ordering)
+        return KeysetPage(self._wrap(records), self, next_cursor, previous_cursor)
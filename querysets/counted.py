@@ -0,0 +1,60 @@
+# facility/querysets/counted.py
+
+from functools import lru_cache
+
+from django.db.models import F, Func, IntegerField, Subquery
+from django.db.models.functions import Coalesce
+
+
+class KnownCountMixin:
+    """
+    Answer ``count()`` from a total computed up front instead of issuing a
+    fresh ``COUNT(*)``.
+
+    The total survives re-ordering (tables sort before they paginate) but any
+    other chained call produces a plain clone that counts for real.
+    """
+
+    known_count = None
+
+    def count(self):
+        if self.known_count is not None and self._result_cache is None:
+            return self.known_count
+        return super().count()
+
+    def order_by(self, *field_names):
+        clone = super().order_by(*field_names)
+        clone.known_count = self.known_count
+        return clone
+
+
+@lru_cache(maxsize=None)
+def _known_count_class(queryset_class):
+    return type(
+        f"KnownCount{queryset_class.__name__}", (KnownCountMixin, queryset_class), {}
+    )
+
+
+def with_known_count(queryset, count):
+    """Return a clone of ``queryset`` whose ``count()`` returns ``count``."""
+    clone = queryset._chain()
+    clone.__class__ = _known_count_class(queryset.__class__)
+    clone.known_count = count
+    return clone
+
+
+def count_subquery(queryset):
+    """Return ``COUNT(*)`` of ``queryset`` as a subquery expression (0 when empty)."""
+    # COUNT via Func rather than Count() so the subquery is not grouped.
+    total = queryset.order_by().values(
+        total=Func(F("pk"), function="COUNT", output_field=IntegerField())
+    )
+    return Coalesce(Subquery(total[:1]), 0, output_field=IntegerField())
+
+
+def sum_subquery(queryset, field):
+    """Return ``SUM(field)`` of ``queryset`` as a subquery expression (0 when empty)."""
+    total = queryset.order_by().values(
+        total=Func(F(field), function="SUM", output_field=IntegerField())
+    )
+    return Coalesce(Subquery(total[:1]), 0, output_field=IntegerField())
@@ -1,7 +1,7 @@
 # facility/querysets/faculty.py
 
 from django.db import models
-from django.db.models import Prefetch
+from django.db.models import Prefetch, prefetch_related_objects
 
 from enrollment.models.facility import FacilityEnrollment
 from enrollment.models.faculty import FacultyEnrollment
@@ -15,8 +15,11 @@ class FacultyQuerySet(models.QuerySet):
         return self.filter(facultyprofile__facility=facility)
 
     def by_organization(self, organization):
-        all_organizations = [organization] + organization.get_all_children()
-        return self.filter(facultyprofile__organization__in=all_organizations)
+        from facility.models.organization_closure import OrganizationClosure
+
+        return self.filter(
+            facultyprofile__organization__in=OrganizationClosure.descendant_ids(organization)
+        )
 
     def get_faculty_with_enrollments(self, facility_enrollment):
         return self.prefetch_related(
@@ -27,17 +30,73 @@ class FacultyQuerySet(models.QuerySet):
         ).distinct()
 
 
+def enrollments_prefetch(queryset=None):
+    """
+    Prefetch a profile's faculty enrollments into ``prefetched_enrollments``, the
+    attribute ``FacultyProfile.enrollment_list`` reads.
+    """
+    if queryset is None:
+        queryset = FacultyEnrollment.objects.select_related('facility_enrollment__facility')
+    accessor = FacultyEnrollment._meta.get_field('faculty').remote_field.get_accessor_name()
+    return Prefetch(accessor, queryset=queryset, to_attr='prefetched_enrollments')
+
+
+def prime_enrollments(profiles, queryset=None):
+    """
+    Load enrollments for a list of profiles with one query; profiles that already
+    carry ``prefetched_enrollments`` are left alone.
+    """
+    profiles = list(profiles)
+    prefetch_related_objects(profiles, enrollments_prefetch(queryset))
+    return profiles
+
+
+def _enrollments_queryset(enrollment=None, week=None):
+    from facility.services.occupancy import week_scope_field
+
+    queryset = FacultyEnrollment.objects.select_related('facility_enrollment__facility')
+    if enrollment is not None:
+        queryset = queryset.filter(facility_enrollment=enrollment)
+    if week is not None:
+        if week_scope_field(FacultyEnrollment) == 'week':
+            queryset = queryset.filter(week=week)
+        else:
+            queryset = queryset.filter(facility_enrollment_id=week.facility_enrollment_id)
+    return queryset
+
+
 class FacultyProfileQuerySet(models.QuerySet):
-    def with_enrollments(self, enrollment=None, prefetch=True):
+    """
+    Chainable faculty profile lookups. Each method carries the joins or prefetches its
+    callers need, so views and selectors share one query path.
+    """
+
+    def for_facility(self, facility):
+        return self.filter(facility=facility)
+
+    def with_department(self):
+        return self.select_related('department')
+
+    def with_enrollments(self, enrollment=None, prefetch=True, week=None):
+        """
+        Prefetch enrollments (optionally for one facility enrollment and/or week) into
+        ``prefetched_enrollments``. With ``prefetch=False`` the profiles are instead
+        restricted to those having such an enrollment.
+        """
+        queryset = _enrollments_queryset(enrollment, week)
         if prefetch:
-            queryset=FacultyEnrollment.objects.select_related('facility_enrollment__facility')
-            if enrollment:
-                queryset = queryset.filter(facility_enrollment=enrollment).distinct()
-            return self.prefetch_related(
-                Prefetch(
-                    'enrollments',
-                    queryset=queryset,
-                    to_attr='prefetched_enrollments'
-                )
-            )
-        return self.get_queryset().filter()
\ No newline at end of file
+            return self.prefetch_related(enrollments_prefetch(queryset))
+        return self.filter(pk__in=queryset.values('faculty_id'))
+
+    def roster_rows(self):
+        """Lightweight named tuples for roster listings and exports."""
+        return self.order_by('user__last_name', 'user__first_name', 'pk').values_list(
+            'pk',
+            'slug',
+            'user__first_name',
+            'user__last_name',
+            'user__email',
+            'role',
+            'department__name',
+            named=True,
+        )
\ No newline at end of file
@@ -1,44 +1,200 @@
+from bisect import bisect_left, insort
+
+from django.db.models import Exists, F, OuterRef, Q
 from django.shortcuts import get_object_or_404
 
-from core.policies import visible_facilities_for_user
 from course.models.facility_class import FacilityClass
 from course.tables.facility_class import FacilityClassTable
 from enrollment.models.facility import FacilityEnrollment
+from enrollment.models.temporal import Week
 from enrollment.tables.facility import FacilityEnrollmentTable
 from facility.models.department import Department
 from facility.models.facility import Facility
 from facility.models.faculty import FacultyProfile
-from facility.models.quarters import Quarters
+from facility.models.quarters import Quarters, QuartersType
+from facility.querysets.counted import count_subquery, sum_subquery, with_known_count
+from facility.services.facility_access import scope_to_visible_facilities
+from facility.services.occupancy import current_occupancy, stored_occupancy
+from facility.services.settings_resolver import with_fallback_chain
 from facility.tables.department import DepartmentTable
 from facility.tables.facility import FacilityTable
 from facility.tables.faculty import FacultyTable
 from facility.tables.quarters import QuartersTable
+from reports.models import GeneratedReport
+
+
+def _live(model, **filters):
+    """Rows of ``model`` matching ``filters``, without soft-deleted ones when it has any."""
+    queryset = model.objects.filter(**filters)
+    if "is_deleted" in {field.name for field in model._meta.concrete_fields}:
+        queryset = queryset.filter(is_deleted=False)
+    return queryset
+
+
+def _facility_list_counts():
+    facility = OuterRef("pk")
+    quarters = _live(Quarters, facility=facility)
+    return {
+        "department_count": count_subquery(_live(Department, facility=facility)),
+        "quarters_count": count_subquery(quarters),
+        "bed_count": sum_subquery(quarters, "capacity"),
+        # Profiles only soft-delete if their base profile model does; match the others.
+        "faculty_count": count_subquery(_live(FacultyProfile, facility=facility)),
+    }
+
+
+# Annotations ``facility_list_queryset`` can add on request.
+FACILITY_LIST_COUNTS = ("department_count", "quarters_count", "bed_count", "faculty_count")
 
 
-def facility_list_queryset(user=None):
+def with_facility_counts(queryset, counts=FACILITY_LIST_COUNTS):
+    """
+    Annotate ``queryset`` with the requested ``FACILITY_LIST_COUNTS``.
+
+    Each count is its own correlated subquery, so combining several one-to-many
+    relations never multiplies rows the way joined ``Count`` aggregates would.
+    """
+    expressions = _facility_list_counts()
+    return queryset.annotate(**{name: expressions[name] for name in counts})
+
+
+def facility_list_queryset(user=None, counts=()):
+    queryset = Facility.objects.all()
     if user is not None:
-        return visible_facilities_for_user(user)
-    return Facility.objects.all()
+        queryset = scope_to_visible_facilities(queryset, user)
+    if counts:
+        queryset = with_facility_counts(queryset, counts)
+    return queryset
 
 
 def facility_queryset_for_organization(organization):
     return Facility.objects.filter(organization=organization)
 
 
+def facility_scope_queryset():
+    return Facility.objects.select_related("organization")
+
+
 def get_facility_by_slug(slug):
     return get_object_or_404(Facility, slug=slug)
 
 
 def departments_for_facility(facility):
-    return Department.objects.filter(facility=facility)
+    return with_fallback_chain(
+        Department.objects.filter(facility=facility, is_deleted=False).select_related(
+            "parent"
+        )
+    )
+
+
+# Name lookups for uniqueness checks; each matches a partial ``*_live_idx`` index.
+def live_facilities_named(organization, name):
+    return Facility.objects.filter(organization=organization, name=name, is_deleted=False)
+
+
+def live_quarters_named(facility, name):
+    return Quarters.objects.filter(facility=facility, name=name, is_deleted=False)
+
+
+def live_quarters_types_named(organization, name):
+    return QuartersType.objects.filter(
+        organization=organization, name=name, is_deleted=False
+    )
+
+
+def department_tree(queryset):
+    """
+    Departments from ``queryset`` in depth-first order (siblings by name), each with a
+    ``tree_depth`` attribute, read with one query. Departments whose parent is not in
+    ``queryset`` are treated as roots.
+    """
+    departments = list(queryset.order_by("name", "pk"))
+    present = {department.pk for department in departments}
+    children = {}
+    for department in departments:
+        parent_id = department.parent_id if department.parent_id in present else None
+        children.setdefault(parent_id, []).append(department)
+
+    ordered = []
+    stack = [(department, 0) for department in reversed(children.get(None, []))]
+    while stack:
+        department, depth = stack.pop()
+        department.tree_depth = depth
+        ordered.append(department)
+        stack.extend(
+            (child, depth + 1) for child in reversed(children.get(department.pk, []))
+        )
+    return ordered
 
 
 def quarters_for_facility(facility):
-    return Quarters.objects.filter(facility=facility)
+    return with_fallback_chain(Quarters.objects.filter(facility=facility))
+
+
+def with_current_occupancy(queryset):
+    """Annotate quarters with ``reserved_beds`` for the week running now."""
+    return queryset.annotate(reserved_beds=current_occupancy())
+
+
+def quarters_table_queryset(facility):
+    return with_current_occupancy(quarters_for_facility(facility))
+
+
+def available_quarters(facility, week, min_beds=1, type=None):
+    """
+    Active, not soft-deleted quarters at ``facility`` with at least ``min_beds`` free
+    beds during ``week``, annotated with ``reserved_beds`` and ``free_beds`` and
+    ordered tightest fit first.
+    """
+    queryset = (
+        with_fallback_chain(_live(Quarters, facility=facility, is_active=True))
+        .annotate(reserved_beds=stored_occupancy(week))
+        .annotate(free_beds=F("capacity") - F("reserved_beds"))
+        .filter(free_beds__gte=min_beds)
+    )
+    if type is not None:
+        queryset = queryset.filter(type=type)
+    return queryset.select_related("type").order_by("free_beds", "name")
+
+
+def plan_quarters_for_requests(facility, requests, type=None):
+    """
+    Place many ``(week, party_size)`` requests at once.
+
+    Runs one ``available_quarters`` query per distinct week, then best-fits parties in
+    memory, largest first. Returns a list aligned with ``requests`` holding the chosen
+    ``Quarters`` or ``None`` where nothing had room. Nothing is written.
+    """
+    requests = list(requests)
+    assignments = [None] * len(requests)
+    by_week = {}
+    for index, (week, party_size) in enumerate(requests):
+        by_week.setdefault(week, []).append((party_size, index))
+
+    for week, parties in by_week.items():
+        quarters_by_pk = {}
+        free = []  # sorted (free_beds, pk)
+        for quarters in available_quarters(facility, week, 1, type=type):
+            quarters_by_pk[quarters.pk] = quarters
+            free.append((quarters.free_beds, quarters.pk))
+        free.sort()
+
+        for party_size, index in sorted(parties, reverse=True):
+            slot = bisect_left(free, (party_size, 0))
+            if slot == len(free):
+                continue
+            beds, pk = free.pop(slot)
+            assignments[index] = quarters_by_pk[pk]
+            if beds > party_size:
+                insort(free, (beds - party_size, pk))
+
+    return assignments
 
 
 def faculty_for_facility(facility):
-    return FacultyProfile.objects.filter(facility=facility).select_related("user")
+    return with_fallback_chain(
+        FacultyProfile.objects.for_facility(facility).select_related("user")
+    )
 
 
 def classes_for_facility(facility):
@@ -49,39 +205,87 @@ def enrollments_for_facility(facility):
     return FacilityEnrollment.objects.filter(facility=facility)
 
 
-def facility_manage_tables_config(facility):
+def choice_querysets(facility=None):
+    """
+    Querysets behind the facility-scoped choice fields and autocomplete endpoint, keyed
+    by kind. Without a facility every row is a candidate.
+    """
+    if facility is None:
+        return {
+            "facility": Facility.objects.all(),
+            "department": Department.objects.all(),
+            "quarters": Quarters.objects.all(),
+            "quarters_type": QuartersType.objects.all(),
+            "facility_class": FacilityClass.objects.all(),
+            "week": Week.objects.all(),
+        }
+    return {
+        "facility": facility_queryset_for_organization(facility.organization_id),
+        "department": Department.objects.filter(facility=facility),
+        "quarters": Quarters.objects.filter(facility=facility),
+        "quarters_type": QuartersType.objects.filter(
+            organization_id=facility.organization_id
+        ),
+        "facility_class": classes_for_facility(facility),
+        "week": Week.objects.filter(facility_enrollment__facility=facility),
+    }
+
+
+def reports_visible_to(user):
+    """
+    Reports ``user`` generated or whose template is available to them.
+
+    The template check is a correlated EXISTS, so each report appears at most once
+    without a join fan-out or a DISTINCT over every report column.
+    """
+    template_model = GeneratedReport._meta.get_field("template").related_model
+    shared = template_model.objects.filter(pk=OuterRef("template_id"), available_to=user)
+    return GeneratedReport.objects.filter(Q(generated_by=user) | Exists(shared))
+
+
+# (table name, table class, selector) for every table on the facility manage page.
+FACILITY_MANAGE_TABLES = (
+    ("departments", DepartmentTable, departments_for_facility),
+    ("quarters", QuartersTable, quarters_table_queryset),
+    ("faculty", FacultyTable, faculty_for_facility),
+    ("facility_classes", FacilityClassTable, classes_for_facility),
+    ("facility_enrollments", FacilityEnrollmentTable, enrollments_for_facility),
+)
+
+
+def facility_manage_tables(names=None):
+    """``FACILITY_MANAGE_TABLES``, optionally restricted to ``names``."""
+    if names is None:
+        return FACILITY_MANAGE_TABLES
+    return tuple(table for table in FACILITY_MANAGE_TABLES if table[0] in names)
+
+
+def facility_manage_counts(facility, names=None):
+    """
+    Return the row total of every manage-page table (or just ``names``), keyed by
+    table name, using one query against ``Facility``.
+    """
+    tables = facility_manage_tables(names)
+    annotations = {
+        f"{name}_count": count_subquery(selector(OuterRef("pk")))
+        for name, _table, selector in tables
+    }
+    totals = Facility.objects.filter(pk=facility.pk).values(**annotations).first() or {}
+    return {name: totals.get(f"{name}_count", 0) for name, _table, _selector in tables}
+
+
+def facility_manage_tables_config(facility, names=None):
     context = {"facility_slug": facility.slug}
+    totals = facility_manage_counts(facility, names)
     return {
-        "departments": {
-            "class": DepartmentTable,
-            "queryset": departments_for_facility(facility),
-            "paginate_by": 6,
-            "context": context,
-        },
-        "quarters": {
-            "class": QuartersTable,
-            "queryset": quarters_for_facility(facility),
+        name: {
+            "class": table_class,
+            # Paginators read the precomputed total instead of counting again.
+            "queryset": with_known_count(selector(facility), totals[name]),
             "paginate_by": 6,
             "context": context,
-        },
-        "faculty": {
-            "class": FacultyTable,
-            "queryset": faculty_for_facility(facility),
-            "paginate_by": 6,
-            "context": context,
-        },
-        "facility_classes": {
-            "class": FacilityClassTable,
-            "queryset": classes_for_facility(facility),
-            "paginate_by": 6,
-            "context": context,
-        },
-        "facility_enrollments": {
-            "class": FacilityEnrollmentTable,
-            "queryset": enrollments_for_facility(facility),
-            "paginate_by": 6,
-            "context": context,
-        },
+        }
+        for name, table_class, selector in facility_manage_tables(names)
     }
 
 
@@ -93,7 +297,7 @@ def facility_detail_tables_config(facility):
         },
         "quarters_table": {
             "class": QuartersTable,
-            "queryset": quarters_for_facility(facility),
+            "queryset": quarters_table_queryset(facility),
         },
         "faculty_table": {
             "class": FacultyTable,
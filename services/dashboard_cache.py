@@ -0,0 +1,69 @@
+# facility/services/dashboard_cache.py
+"""
+Versioned cache for dashboard widget data.
+
+Widgets are cached under (widget, facility, role[, user], data version). Each facility
+has its own version, bumped by signals whenever its faculty profiles or faculty
+enrollments change; report widgets also depend on a global reports version. Bumping a
+version orphans every key built from the old one, so nothing has to be deleted.
+"""
+
+import time
+
+from django.core.cache import cache
+
+DASHBOARD_CACHE_TIMEOUT = 60 * 5
+
+
+def _version_key(scope):
+    return f"facility:dashboard:version:{scope}"
+
+
+def _initial_version():
+    # Widgets outlive an evicted version key; restarting from the clock keeps the new
+    # version clear of every number the old counter handed out.
+    return time.time_ns()
+
+
+def data_version(scope):
+    return cache.get_or_set(_version_key(scope), _initial_version, None)
+
+
+def bump_data_version(scope):
+    try:
+        cache.incr(_version_key(scope))
+    except ValueError:
+        cache.set(_version_key(scope), _initial_version(), None)
+
+
+def facility_scope(facility_id):
+    return f"facility:{facility_id}"
+
+
+REPORTS_SCOPE = "reports"
+
+
+def cached_widget(widget, builder, facility_id, role, user_id=None, scopes=()):
+    """
+    Return the cached payload for ``widget`` or build, cache and return it.
+
+    ``builder`` must return something picklable (evaluate querysets to lists).
+    """
+    versions = [data_version(facility_scope(facility_id))]
+    versions += [data_version(scope) for scope in scopes]
+    key = ":".join(
+        str(part)
+        for part in (
+            "facility:widget",
+            widget,
+            facility_id,
+            role,
+            user_id or "-",
+            *versions,
+        )
+    )
+    payload = cache.get(key)
+    if payload is None:
+        payload = builder()
+        cache.set(key, payload, DASHBOARD_CACHE_TIMEOUT)
+    return payload
@@ -0,0 +1,90 @@
+# facility/services/facility_access.py
+"""
+Cached facility visibility per user.
+
+Superusers see every facility and skip the lookup. For everyone else
+``core.policies.visible_facilities_for_user`` is resolved once into a set of facility
+ids and cached behind two version keys: one per user, bumped when that user or their
+faculty profile (role, facility, organization) changes, and a global one bumped when
+facilities or organizations change. ``scope_to_visible_facilities`` turns the cached
+set into a plain ``IN`` filter any facility queryset can reuse.
+"""
+
+import time
+
+from django.core.cache import cache
+
+from core.policies import visible_facilities_for_user
+
+ACCESS_CACHE_TIMEOUT = 60 * 15
+ACCESS_VERSION_KEY = "facility:access:version"
+
+# Returned in place of an id set for users who may see every facility.
+ALL_FACILITIES = "*"
+
+
+def _user_version_key(user_id):
+    return f"facility:access:version:user:{user_id}"
+
+
+def _initial_version():
+    # A version key can be evicted while sets cached under its old values live on, so
+    # a restarted counter begins at the clock rather than at a number already used.
+    return time.time_ns()
+
+
+def _bump(key):
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, _initial_version(), None)
+
+
+def invalidate_facility_access(**kwargs):
+    """Drop every cached visibility set; usable directly as a signal receiver."""
+    _bump(ACCESS_VERSION_KEY)
+
+
+def invalidate_user_facility_access(user_id):
+    """Drop the cached visibility set of one user."""
+    if user_id:
+        _bump(_user_version_key(user_id))
+
+
+def _access_versions(user_id):
+    keys = (ACCESS_VERSION_KEY, _user_version_key(user_id))
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            versions[key] = cache.get_or_set(key, _initial_version, None)
+    return [versions[key] for key in keys]
+
+
+def visible_facility_ids(user):
+    """
+    Return the ids of the facilities ``user`` may see as a ``frozenset``, or
+    ``ALL_FACILITIES`` for superusers.
+    """
+    if user is None or not user.is_authenticated:
+        return frozenset()
+    if user.is_superuser:
+        return ALL_FACILITIES
+    global_version, user_version = _access_versions(user.pk)
+    cache_key = f"facility:access:{global_version}:{user_version}:{user.pk}"
+    ids = cache.get(cache_key)
+    if ids is None:
+        queryset = visible_facilities_for_user(user)
+        ids = frozenset(queryset.order_by().values_list("pk", flat=True))
+        cache.set(cache_key, ids, ACCESS_CACHE_TIMEOUT)
+    return ids
+
+
+def scope_to_visible_facilities(queryset, user, field="pk"):
+    """
+    Restrict ``queryset`` to rows whose ``field`` (``"pk"`` for facilities,
+    ``"facility"`` for rows hanging off one) is a facility ``user`` may see.
+    """
+    ids = visible_facility_ids(user)
+    if ids == ALL_FACILITIES:
+        return queryset
+    return queryset.filter(**{f"{field}__in": ids})
@@ -0,0 +1,220 @@
+# facility/services/facility_stats.py
+"""
+Per-facility statistics rollup.
+
+Every source row (faculty profile, department, quarters, facility enrollment, facility
+class) contributes fixed amounts to one facility's ``FacilityStats`` counters. Signals
+subtract a row's old contribution and add its new one in a single ``F()`` UPDATE, so a
+save costs the same however large the facility is. ``reconcile_facility_stats``
+recomputes counters from the source tables to repair drift from bulk writes that
+bypass signals.
+"""
+
+from django.db import transaction
+from django.db.models import F, OuterRef
+from django.utils import timezone
+
+from course.models.facility_class import FacilityClass
+from enrollment.models.facility import FacilityEnrollment
+
+from ..models.department import Department
+from ..models.facility import Facility
+from ..models.facility_stats import FacilityStats
+from ..models.faculty import FacultyProfile
+from ..models.quarters import Quarters
+from ..querysets.counted import count_subquery, sum_subquery
+
+ROLE_FIELDS = {
+    FacultyProfile.FacultyRole.ADMIN: "admin_count",
+    FacultyProfile.FacultyRole.DEPARTMENT_ADMIN: "department_admin_count",
+    FacultyProfile.FacultyRole.STAFF: "staff_count",
+}
+
+NO_CONTRIBUTION = (None, {})
+
+
+def _live(instance):
+    return not getattr(instance, "is_deleted", False)
+
+
+def profile_contribution(profile):
+    if not profile.facility_id or not _live(profile):
+        return NO_CONTRIBUTION
+    counts = {"faculty_count": 1}
+    role_field = ROLE_FIELDS.get(profile.role)
+    if role_field:
+        counts[role_field] = 1
+    return profile.facility_id, counts
+
+
+def department_contribution(department):
+    if not department.facility_id or not _live(department):
+        return NO_CONTRIBUTION
+    return department.facility_id, {"department_count": 1}
+
+
+def quarters_contribution(quarters):
+    if not quarters.facility_id or not _live(quarters):
+        return NO_CONTRIBUTION
+    return quarters.facility_id, {
+        "quarters_count": 1,
+        "total_beds": quarters.capacity or 0,
+    }
+
+
+def facility_enrollment_contribution(enrollment):
+    if not enrollment.facility_id or not _live(enrollment):
+        return NO_CONTRIBUTION
+    return enrollment.facility_id, {"enrollment_count": 1}
+
+
+def facility_class_contribution(facility_class):
+    if not facility_class.facility_enrollment_id or not _live(facility_class):
+        return NO_CONTRIBUTION
+    facility_id = (
+        FacilityEnrollment._base_manager.filter(pk=facility_class.facility_enrollment_id)
+        .values_list("facility_id", flat=True)
+        .first()
+    )
+    if facility_id is None:
+        return NO_CONTRIBUTION
+    return facility_id, {"class_count": 1}
+
+
+# (model label, contribution function) for every model feeding FacilityStats.
+STATS_SOURCES = (
+    ("facility.FacultyProfile", profile_contribution),
+    ("facility.Department", department_contribution),
+    ("facility.Quarters", quarters_contribution),
+    ("enrollment.FacilityEnrollment", facility_enrollment_contribution),
+    ("course.FacilityClass", facility_class_contribution),
+)
+
+
+def stats_delta(before, after):
+    """
+    Return ``{facility_id: {field: delta}}`` turning contribution ``before`` into
+    ``after``; unchanged fields are dropped.
+    """
+    deltas = {}
+    for sign, (facility_id, counts) in ((-1, before), (1, after)):
+        if facility_id is None:
+            continue
+        bucket = deltas.setdefault(facility_id, {})
+        for field, amount in counts.items():
+            bucket[field] = bucket.get(field, 0) + sign * amount
+    return {
+        facility_id: {field: amount for field, amount in bucket.items() if amount}
+        for facility_id, bucket in deltas.items()
+    }
+
+
+def merge_stats_deltas(*deltas):
+    """Sum several ``stats_delta`` results into one."""
+    merged = {}
+    for delta in deltas:
+        for facility_id, changes in delta.items():
+            bucket = merged.setdefault(facility_id, {})
+            for field, amount in changes.items():
+                bucket[field] = bucket.get(field, 0) + amount
+    return merged
+
+
+def apply_stats_deltas(deltas):
+    """Apply ``{facility_id: {field: delta}}``; facilities without a row are computed."""
+    for facility_id, changes in deltas.items():
+        if not changes:
+            continue
+        updated = FacilityStats.objects.filter(facility_id=facility_id).update(
+            **{field: F(field) + amount for field, amount in changes.items()}
+        )
+        if not updated:
+            # First touch: build the row from the sources, which already include the change.
+            reconcile_facility_stats([facility_id])
+
+
+def _live_rows(model, **filters):
+    queryset = model._base_manager.filter(**filters)
+    if "is_deleted" in {field.name for field in model._meta.concrete_fields}:
+        queryset = queryset.filter(is_deleted=False)
+    return queryset
+
+
+def stats_annotations():
+    """Subquery expressions computing every counter for ``OuterRef("pk")``."""
+    facility = OuterRef("pk")
+    profiles = _live_rows(FacultyProfile, facility=facility)
+    quarters = _live_rows(Quarters, facility=facility)
+    annotations = {
+        "faculty_count": count_subquery(profiles),
+        "department_count": count_subquery(_live_rows(Department, facility=facility)),
+        "quarters_count": count_subquery(quarters),
+        "total_beds": sum_subquery(quarters, "capacity"),
+        "enrollment_count": count_subquery(
+            _live_rows(FacilityEnrollment, facility=facility)
+        ),
+        "class_count": count_subquery(
+            _live_rows(FacilityClass, facility_enrollment__facility=facility)
+        ),
+    }
+    for role, field in ROLE_FIELDS.items():
+        annotations[field] = count_subquery(profiles.filter(role=role))
+    return annotations
+
+
+def compute_facility_stats(facility_ids=None):
+    """Return ``{facility_id: {field: value}}`` recomputed from the source tables."""
+    queryset = Facility._base_manager.all()
+    if facility_ids is not None:
+        queryset = queryset.filter(pk__in=facility_ids)
+    return {
+        row.pop("pk"): row
+        for row in queryset.order_by("pk").values("pk", **stats_annotations())
+    }
+
+
+@transaction.atomic
+def reconcile_facility_stats(facility_ids=None):
+    """
+    Recompute the counters of ``facility_ids`` (every facility by default), write the
+    rows that drifted or were missing and return their facility ids.
+    """
+    fresh = compute_facility_stats(facility_ids)
+    stored = {
+        stats.facility_id: stats
+        for stats in FacilityStats.objects.select_for_update().filter(facility_id__in=fresh)
+    }
+    now = timezone.now()
+    drifted, to_create, to_update = [], [], []
+    for facility_id, values in fresh.items():
+        stats = stored.get(facility_id)
+        if stats is None:
+            to_create.append(
+                FacilityStats(facility_id=facility_id, reconciled_at=now, **values)
+            )
+            drifted.append(facility_id)
+            continue
+        stats.reconciled_at = now
+        if any(getattr(stats, field) != value for field, value in values.items()):
+            drifted.append(facility_id)
+            for field, value in values.items():
+                setattr(stats, field, value)
+        to_update.append(stats)
+    FacilityStats.objects.bulk_create(to_create, batch_size=1000, ignore_conflicts=True)
+    FacilityStats.objects.bulk_update(
+        to_update, [*FacilityStats.COUNTER_FIELDS, "reconciled_at"], batch_size=1000
+    )
+    return drifted
+
+
+def facility_stats_for(facility, compute=True):
+    """
+    Return the ``FacilityStats`` row of ``facility``. A missing row is computed, or
+    with ``compute=False`` reported as ``None``.
+    """
+    stats = FacilityStats.objects.filter(facility=facility).first()
+    if stats is None and compute:
+        reconcile_facility_stats([facility.pk])
+        stats = FacilityStats.objects.get(facility=facility)
+    return stats
+
@@ -0,0 +1,147 @@
+# facility/services/faculty_roster.py
+"""
+Read-model projection behind the cross-facility faculty roster.
+
+``FacultyRosterEntry`` copies the columns the roster shows from ``FacultyProfile``,
+``User``, ``Facility`` and ``Department``. Profile saves re-project that one profile;
+user, facility and department saves push their changed columns to the rows that copy
+them with a single UPDATE. A soft-deleted facility or department shows as blank on the
+roster (its id is kept, so restoring it brings the name back), and deleting one blanks
+its columns before the foreign keys are nulled. ``rebuild_faculty_roster`` re-projects
+everything to repair drift from writes that bypass signals.
+"""
+
+from django.db import transaction
+
+from ..models.faculty import FacultyProfile
+from ..models.faculty_roster import FacultyRosterEntry
+from ..models.organization_closure import OrganizationClosure
+
+ROSTER_BATCH_SIZE = 1000
+
+# Roster column -> lookup on FacultyProfile it is copied from.
+ROSTER_SOURCE_FIELDS = {
+    "user_id": "user_id",
+    "organization_id": "facility__organization_id",
+    "facility_id": "facility_id",
+    "department_id": "department_id",
+    "role": "role",
+    "profile_slug": "slug",
+    "first_name": "user__first_name",
+    "last_name": "user__last_name",
+    "email": "user__email",
+    "facility_name": "facility__name",
+    "facility_slug": "facility__slug",
+    "department_name": "department__name",
+}
+
+ROSTER_UPDATE_FIELDS = [field.removesuffix("_id") for field in ROSTER_SOURCE_FIELDS]
+
+
+# Roster columns left blank while the related row is soft-deleted.
+SOFT_DELETED_COLUMNS = {
+    "facility__is_deleted": ("facility_name", "facility_slug"),
+    "department__is_deleted": ("department_name",),
+}
+
+
+def _project(profile_queryset):
+    lookups = list(ROSTER_SOURCE_FIELDS.values())
+    entries = []
+    rows = profile_queryset.order_by().values_list(
+        "pk", "organization_id", *SOFT_DELETED_COLUMNS, *lookups
+    )
+    for pk, profile_organization_id, *values in rows:
+        deleted_flags = values[: len(SOFT_DELETED_COLUMNS)]
+        values = values[len(SOFT_DELETED_COLUMNS) :]
+        row = {
+            field: "" if value is None and not field.endswith("_id") else value
+            for field, value in zip(ROSTER_SOURCE_FIELDS, values)
+        }
+        for deleted, columns in zip(deleted_flags, SOFT_DELETED_COLUMNS.values()):
+            if deleted:
+                row.update(dict.fromkeys(columns, ""))
+        # Profiles without a facility still belong to their own organization.
+        row["organization_id"] = row["organization_id"] or profile_organization_id
+        entries.append(FacultyRosterEntry(profile_id=pk, **row))
+    return entries
+
+
+@transaction.atomic
+def refresh_roster_entries(profile_ids):
+    """Re-project the roster rows of ``profile_ids``; rows of missing profiles are dropped."""
+    profile_ids = set(profile_ids)
+    if not profile_ids:
+        return 0
+    entries = _project(FacultyProfile._base_manager.filter(pk__in=profile_ids))
+    FacultyRosterEntry.objects.filter(profile_id__in=profile_ids).exclude(
+        profile_id__in=[entry.profile_id for entry in entries]
+    ).delete()
+    FacultyRosterEntry.objects.bulk_create(
+        entries,
+        batch_size=ROSTER_BATCH_SIZE,
+        update_conflicts=True,
+        unique_fields=["profile"],
+        update_fields=[*ROSTER_UPDATE_FIELDS, "refreshed_at"],
+    )
+    return len(entries)
+
+
+def rebuild_faculty_roster(organization=None):
+    """
+    Re-project every profile (under ``organization`` and its descendants when given) and
+    return how many rows were written.
+    """
+    profiles = FacultyProfile._base_manager.all()
+    if organization is not None:
+        profiles = profiles.filter(
+            facility__organization_id__in=OrganizationClosure.descendant_ids(organization)
+        )
+    profile_ids = list(profiles.order_by("pk").values_list("pk", flat=True))
+    written = 0
+    for start in range(0, len(profile_ids), ROSTER_BATCH_SIZE):
+        written += refresh_roster_entries(profile_ids[start : start + ROSTER_BATCH_SIZE])
+    return written
+
+
+def sync_user_roster(user):
+    FacultyRosterEntry.objects.filter(user_id=user.pk).update(
+        first_name=user.first_name or "",
+        last_name=user.last_name or "",
+        email=user.email or "",
+    )
+
+
+def sync_facility_roster(facility):
+    live = not getattr(facility, "is_deleted", False)
+    FacultyRosterEntry.objects.filter(facility_id=facility.pk).update(
+        organization_id=facility.organization_id,
+        facility_name=(facility.name or "") if live else "",
+        facility_slug=(facility.slug or "") if live else "",
+    )
+
+
+def sync_department_roster(department):
+    live = not getattr(department, "is_deleted", False)
+    FacultyRosterEntry.objects.filter(department_id=department.pk).update(
+        department_name=(department.name or "") if live else ""
+    )
+
+
+def clear_facility_roster(facility):
+    """Blank the columns copied from ``facility``, which is about to be deleted."""
+    FacultyRosterEntry.objects.filter(facility_id=facility.pk).update(
+        facility_name="", facility_slug=""
+    )
+
+
+def clear_department_roster(department):
+    """Blank the columns copied from ``department``, which is about to be deleted."""
+    FacultyRosterEntry.objects.filter(department_id=department.pk).update(department_name="")
+
+
+def roster_for_organization(organization):
+    """Roster rows of every facility under ``organization``, including sub-organizations."""
+    return FacultyRosterEntry.objects.filter(
+        organization_id__in=OrganizationClosure.descendant_ids(organization)
+    )
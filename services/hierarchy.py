@@ -0,0 +1,113 @@
+# facility/services/hierarchy.py
+"""
+Maintenance of the closure tables behind the organization and department trees.
+
+A closure model has ``ancestor``, ``descendant`` and ``depth`` fields and one row per
+(ancestor, descendant) pair, including every node paired with itself at depth 0.
+"""
+
+from django.db import transaction
+
+from ..models.department import Department
+from ..models.department_closure import DepartmentClosure
+from ..models.organization_closure import OrganizationClosure
+
+
+def closure_rows(parent_map):
+    """
+    Yield ``(ancestor_id, descendant_id, depth)`` for a ``{pk: parent_id}`` mapping.
+    """
+    for node in parent_map:
+        ancestor, depth, seen = node, 0, set()
+        while ancestor is not None and ancestor not in seen:
+            yield ancestor, node, depth
+            seen.add(ancestor)
+            ancestor = parent_map.get(ancestor)
+            depth += 1
+
+
+def _ancestors(closure_model, node_id):
+    return list(
+        closure_model.objects.filter(descendant_id=node_id).values_list(
+            "ancestor_id", "depth"
+        )
+    )
+
+
+def insert_node(closure_model, node):
+    """Add closure rows for a newly created node."""
+    rows = [closure_model(ancestor_id=node.pk, descendant_id=node.pk, depth=0)]
+    if node.parent_id:
+        rows += [
+            closure_model(ancestor_id=ancestor_id, descendant_id=node.pk, depth=depth + 1)
+            for ancestor_id, depth in _ancestors(closure_model, node.parent_id)
+        ]
+    closure_model.objects.bulk_create(rows, ignore_conflicts=True)
+
+
+@transaction.atomic
+def move_node(closure_model, node):
+    """Re-link the subtree of ``node`` under its current parent."""
+    subtree = list(
+        closure_model.objects.filter(ancestor_id=node.pk).values_list(
+            "descendant_id", "depth"
+        )
+    )
+    if not subtree:
+        insert_node(closure_model, node)
+        return
+    subtree_ids = [descendant_id for descendant_id, _depth in subtree]
+    closure_model.objects.filter(descendant_id__in=subtree_ids).exclude(
+        ancestor_id__in=subtree_ids
+    ).delete()
+    if node.parent_id:
+        closure_model.objects.bulk_create(
+            [
+                closure_model(
+                    ancestor_id=ancestor_id,
+                    descendant_id=descendant_id,
+                    depth=ancestor_depth + depth + 1,
+                )
+                for ancestor_id, ancestor_depth in _ancestors(closure_model, node.parent_id)
+                for descendant_id, depth in subtree
+            ]
+        )
+
+
+@transaction.atomic
+def rebuild_closure(closure_model, node_model):
+    """Recompute a whole closure table and return the number of rows written."""
+    parent_map = dict(node_model._base_manager.values_list("pk", "parent_id"))
+    closure_model.objects.all().delete()
+    rows = closure_model.objects.bulk_create(
+        [
+            closure_model(ancestor_id=a, descendant_id=d, depth=depth)
+            for a, d, depth in closure_rows(parent_map)
+        ],
+        batch_size=1000,
+    )
+    return len(rows)
+
+
+def insert_organization(organization):
+    insert_node(OrganizationClosure, organization)
+
+
+def move_organization(organization):
+    move_node(OrganizationClosure, organization)
+
+
+def rebuild_organization_closure(organization_model):
+    return rebuild_closure(OrganizationClosure, organization_model)
+
+
+def insert_department(department):
+    insert_node(DepartmentClosure, department)
+
+
+def move_department(department):
+    move_node(DepartmentClosure, department)
+
+
+def rebuild_department_closure():
+    return rebuild_closure(DepartmentClosure, Department)
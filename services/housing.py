@@ -0,0 +1,147 @@
+# facility/services/housing.py
+"""
+Bulk housing assignment.
+
+``auto_assign_quarters`` takes every unassigned reservation for a week (faculty,
+faction and any other enrollment that references quarters), groups them into parties,
+packs the parties into the week's free beds with first-fit-decreasing and writes the
+result with one ``bulk_update`` per source inside a single transaction. Parties booked
+for a whole facility enrollment only fit where every week of it has room.
+"""
+
+from django.db import transaction
+from django.db.models import Max
+
+from ..models.quarters_occupancy import QuartersOccupancy
+from ..selectors import available_quarters
+from .occupancy import (
+    adjust_occupancy,
+    merge_deltas,
+    occupancy_deltas,
+    occupancy_sources,
+    reservations_for,
+    week_scope_field,
+)
+
+
+def _party_key(reservation):
+    """Reservations sharing a faction are housed together; everyone else alone."""
+    faction_id = getattr(reservation, "faction_id", None)
+    if faction_id is not None:
+        return (reservation._meta.label_lower, "faction", faction_id)
+    return (reservation._meta.label_lower, "pk", reservation.pk)
+
+
+def unassigned_parties(week, facility):
+    """
+    Return ``(model, field_name, reservations)`` parties for the week's reservations at
+    ``facility`` that have no quarters yet, largest party first.
+    """
+    parties = {}
+    for model, field_name in occupancy_sources():
+        scope = week_scope_field(model)
+        if scope is None:
+            # Without a week or session there is no way to scope rows to this week.
+            continue
+        facility_lookup = {
+            "week": "week__facility_enrollment__facility",
+            "facility_enrollment": "facility_enrollment__facility",
+        }[scope]
+        reservations = reservations_for(model, field_name, None, week=week).filter(
+            **{facility_lookup: facility}
+        )
+        for reservation in reservations:
+            key = _party_key(reservation)
+            parties.setdefault(key, (model, field_name, []))[2].append(reservation)
+    return sorted(parties.values(), key=lambda party: len(party[2]), reverse=True)
+
+
+def session_free_beds(bins, week):
+    """
+    Free beds of each quarters in ``bins`` across every week of ``week``'s facility
+    enrollment: capacity minus the busiest week's stored occupancy.
+    """
+    peaks = dict(
+        QuartersOccupancy.objects.filter(
+            quarters__in=bins, week__facility_enrollment_id=week.facility_enrollment_id
+        )
+        .order_by()
+        .values("quarters")
+        .annotate(peak=Max("occupancy"))
+        .values_list("quarters", "peak")
+    )
+    return [
+        min(quarters.free_beds, (quarters.capacity or 0) - peaks.get(quarters.pk, 0))
+        for quarters in bins
+    ]
+
+
+def auto_assign_quarters(facility, week, quarters_type=None, type_preferences=None):
+    """
+    Assign quarters to every unassigned reservation at ``facility`` for ``week``.
+
+    Args:
+        facility: The facility whose quarters are filled.
+        week: The week being housed.
+        quarters_type: Only use quarters of this type.
+        type_preferences: Optional ``{model: QuartersType}``; parties from that model try
+            quarters of the preferred type before any other.
+
+    Returns:
+        tuple: ``(assigned, unplaced)`` lists of reservations.
+
+    Raises:
+        ValueError: ``facility`` is missing or ``week`` belongs to another facility.
+    """
+    if facility is None:
+        raise ValueError("auto_assign_quarters needs a facility.")
+    if week.facility_enrollment.facility_id != facility.pk:
+        raise ValueError(f"Week {week.pk} does not belong to facility {facility.pk}.")
+    type_preferences = type_preferences or {}
+
+    with transaction.atomic():
+        # Lock the candidate quarters so concurrent runs cannot fill the same beds.
+        bins = list(
+            available_quarters(facility, week, 1, type=quarters_type).select_for_update(
+                of=("self",)
+            )
+        )
+        # Week-scoped reservations need a bed in ``week`` only; session-scoped ones
+        # occupy every week of the session, so they fit the tightest of those weeks.
+        week_free = [quarters.free_beds for quarters in bins]
+        session_free = session_free_beds(bins, week)
+
+        assigned, unplaced = [], []
+        updates = {}  # (model, field_name) -> reservations to write
+        for model, field_name, reservations in unassigned_parties(week, facility):
+            size = len(reservations)
+            whole_session = week_scope_field(model) == "facility_enrollment"
+            free = session_free if whole_session else week_free
+            preferred = type_preferences.get(model)
+            order = range(len(bins))
+            if preferred is not None:
+                order = sorted(order, key=lambda i: bins[i].type_id != preferred.pk)
+
+            slot = next((i for i in order if free[i] >= size), None)
+            if slot is None:
+                unplaced.extend(reservations)
+                continue
+
+            week_free[slot] -= size
+            if whole_session:
+                session_free[slot] -= size
+            else:
+                session_free[slot] = min(session_free[slot], week_free[slot])
+            for reservation in reservations:
+                setattr(reservation, field_name, bins[slot])
+            updates.setdefault((model, field_name), []).extend(reservations)
+            assigned.extend(reservations)
+
+        deltas = []
+        for (model, field_name), reservations in updates.items():
+            model._default_manager.bulk_update(reservations, [field_name], batch_size=500)
+            deltas.append(occupancy_deltas(model, field_name, reservations))
+        # bulk_update skips the occupancy signals, so apply the deltas here.
+        adjust_occupancy(merge_deltas(*deltas))
+
+    return assigned, unplaced
@@ -0,0 +1,251 @@
+# facility/services/occupancy.py
+"""
+Quarters occupancy maintenance.
+
+``QuartersOccupancy`` is a denormalized count, per quarters and week, of the enrollment
+rows that reserve the quarters. Every model in the ``enrollment`` app with a foreign
+key to ``Quarters`` (faculty, faction, leader enrollments, ...) is a source; each live
+row counts as one occupied bed in every week it covers: its own ``week`` when it has
+one, otherwise each week of its facility enrollment. Rows with neither cover no week
+and never occupy a bed. Signals keep the counters current with per-row deltas and
+``rebuild_occupancy`` repairs any drift from bulk writes that bypass them.
+"""
+
+from django.db import models, transaction
+from django.db.models import Case, F, IntegerField, OuterRef, Q, Subquery, Value, When
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from enrollment.models.temporal import Week
+
+from ..models.quarters import Quarters
+from ..models.quarters_occupancy import QuartersOccupancy
+from ..querysets.counted import count_subquery, sum_subquery
+
+
+def occupancy_sources():
+    """
+    Return ``(model, field_name)`` pairs for every enrollment model that reserves
+    quarters through a foreign key.
+    """
+    return [
+        (rel.related_model, rel.field.name)
+        for rel in Quarters._meta.related_objects
+        if rel.many_to_one and rel.related_model._meta.app_label == "enrollment"
+    ]
+
+
+def _field_names(model):
+    return {field.name for field in model._meta.concrete_fields}
+
+
+def is_soft_deletable(model):
+    return "is_deleted" in _field_names(model)
+
+
+def week_scope_field(model):
+    """Name of the field that ties ``model`` rows to a week, or ``None``."""
+    fields = _field_names(model)
+    for name in ("week", "facility_enrollment"):
+        if name in fields:
+            return name
+    return None
+
+
+def reservations_for(model, field_name, quarters, week=None):
+    """
+    Return the live rows of ``model`` that reserve ``quarters``.
+
+    With ``week``, only reservations for that week count: rows are matched on their own
+    ``week`` when the model has one, otherwise on the week's facility enrollment.
+    """
+    queryset = model._default_manager.filter(**{field_name: quarters})
+    if is_soft_deletable(model):
+        queryset = queryset.filter(is_deleted=False)
+    scope = week_scope_field(model)
+    if week is not None and scope == "week":
+        queryset = queryset.filter(week=week)
+    elif week is not None and scope == "facility_enrollment":
+        queryset = queryset.filter(facility_enrollment_id=week.facility_enrollment_id)
+    return queryset
+
+
+def live_occupancy(quarters=OuterRef("pk"), week=None):
+    """Expression counting the reservations of ``quarters`` across every source."""
+    total = Value(0, output_field=IntegerField())
+    for model, field_name in occupancy_sources():
+        total = total + count_subquery(
+            reservations_for(model, field_name, quarters, week=week)
+        )
+    return total
+
+
+def stored_occupancy(week, quarters=OuterRef("pk")):
+    """Expression reading the stored occupancy of ``quarters`` during ``week`` (0 if none)."""
+    occupancy = QuartersOccupancy.objects.filter(quarters=quarters, week=week).values(
+        "occupancy"
+    )
+    return Coalesce(Subquery(occupancy[:1]), 0, output_field=IntegerField())
+
+
+def current_occupancy(quarters=OuterRef("pk"), on=None):
+    """
+    Expression reading the stored occupancy of ``quarters`` in the week running ``on``
+    (now by default); 0 between weeks.
+    """
+    if on is None:
+        start = Week._meta.get_field("start")
+        on = timezone.now() if isinstance(start, models.DateTimeField) else timezone.localdate()
+    rows = QuartersOccupancy.objects.filter(
+        quarters=quarters, week__start__lte=on, week__end__gte=on
+    )
+    return sum_subquery(rows, "occupancy")
+
+
+def week_ids_for(model, scope_id, _cache=None):
+    """
+    Ids of the weeks covered by a ``model`` row whose week scope field holds
+    ``scope_id``. Pass a dict as ``_cache`` to reuse facility enrollment lookups.
+    """
+    if scope_id is None:
+        return ()
+    scope = week_scope_field(model)
+    if scope == "week":
+        return (scope_id,)
+    if scope != "facility_enrollment":
+        return ()
+    if _cache is not None and scope_id in _cache:
+        return _cache[scope_id]
+    week_ids = tuple(
+        Week.objects.filter(facility_enrollment_id=scope_id).values_list("pk", flat=True)
+    )
+    if _cache is not None:
+        _cache[scope_id] = week_ids
+    return week_ids
+
+
+def merge_deltas(*deltas):
+    merged = {}
+    for changes in deltas:
+        for key, delta in changes.items():
+            merged[key] = merged.get(key, 0) + delta
+    return merged
+
+
+def reservation_key(model, field_name, reservation):
+    """``(quarters_id, scope_id)`` of a live ``reservation``, or ``None``."""
+    scope = week_scope_field(model)
+    if scope is None or getattr(reservation, "is_deleted", False):
+        return None
+    quarters_id = getattr(reservation, f"{field_name}_id")
+    if quarters_id is None:
+        return None
+    return quarters_id, getattr(reservation, f"{scope}_id")
+
+
+def key_deltas(model, key, sign=1, _cache=None):
+    """``{(quarters_id, week_id): sign}`` for every week a ``reservation_key`` covers."""
+    if key is None:
+        return {}
+    quarters_id, scope_id = key
+    return {
+        (quarters_id, week_id): sign for week_id in week_ids_for(model, scope_id, _cache)
+    }
+
+
+def occupancy_deltas(model, field_name, reservations, sign=1):
+    """
+    Return ``{(quarters_id, week_id): delta}`` for adding (``sign=1``) or removing
+    (``sign=-1``) ``reservations`` of ``model``.
+    """
+    weeks = {}
+    return merge_deltas(
+        *(
+            key_deltas(model, reservation_key(model, field_name, reservation), sign, weeks)
+            for reservation in reservations
+        )
+    )
+
+
+@transaction.atomic
+def adjust_occupancy(deltas):
+    """
+    Apply ``{(quarters_id, week_id): delta}`` to the stored counters: missing rows are
+    created, then every counter moves in one UPDATE.
+    """
+    deltas = {key: delta for key, delta in deltas.items() if all(key) and delta}
+    if not deltas:
+        return
+    QuartersOccupancy.objects.bulk_create(
+        [
+            QuartersOccupancy(quarters_id=quarters_id, week_id=week_id)
+            for quarters_id, week_id in deltas
+        ],
+        ignore_conflicts=True,
+    )
+    matches = Q()
+    for quarters_id, week_id in deltas:
+        matches |= Q(quarters_id=quarters_id, week_id=week_id)
+    QuartersOccupancy.objects.filter(matches).update(
+        occupancy=F("occupancy")
+        + Case(
+            *[
+                When(quarters_id=quarters_id, week_id=week_id, then=Value(delta))
+                for (quarters_id, week_id), delta in deltas.items()
+            ],
+            default=Value(0),
+            output_field=IntegerField(),
+        )
+    )
+
+
+def occupancy_drift(queryset=None, weeks=None):
+    """
+    Return ``(pk, name, week_id, stored, actual)`` for every quarters and week whose
+    stored occupancy disagrees with a fresh recount.
+
+    Only weeks of the quarters' own facility are checked; ``weeks`` narrows them
+    further. One query per week.
+    """
+    queryset = Quarters.objects.all() if queryset is None else queryset
+    if weeks is None:
+        weeks = Week.objects.filter(
+            facility_enrollment__facility__in=queryset.values("facility")
+        )
+    drift = []
+    for week in weeks.select_related("facility_enrollment").order_by("pk"):
+        rows = (
+            queryset.filter(facility_id=week.facility_enrollment.facility_id)
+            .annotate(
+                stored_occupancy=stored_occupancy(week),
+                actual_occupancy=live_occupancy(week=week),
+            )
+            .exclude(stored_occupancy=F("actual_occupancy"))
+            .order_by("pk")
+            .values_list("pk", "name", "stored_occupancy", "actual_occupancy")
+        )
+        drift.extend(
+            (pk, name, week.pk, stored, actual) for pk, name, stored, actual in rows
+        )
+    return drift
+
+
+def rebuild_occupancy(queryset=None, weeks=None):
+    """
+    Recount occupancy for ``queryset`` (all quarters by default) in every week of its
+    facility, or only ``weeks``, fix the counters that drifted and return the drift
+    that was found.
+    """
+    drift = occupancy_drift(queryset, weeks)
+    if drift:
+        QuartersOccupancy.objects.bulk_create(
+            [
+                QuartersOccupancy(quarters_id=pk, week_id=week_id, occupancy=actual)
+                for pk, name, week_id, stored, actual in drift
+            ],
+            batch_size=1000,
+            update_conflicts=True,
+            unique_fields=["quarters", "week"],
+            update_fields=["occupancy"],
+        )
+    return drift
@@ -0,0 +1,218 @@
+# facility/services/roster.py
+"""
+Bulk faculty roster import.
+
+Rows (dicts with ``username``, ``email``, ``first_name``, ``last_name``, ``role`` and
+``department``) are processed in batches. Each batch resolves departments and roles
+from maps loaded once, skips rows that would violate
+``unique_faculty_per_facility_user``, generates slugs that respect
+``unique_faculty_slug_per_org`` in memory, then writes users and profiles with
+``bulk_create``. Usernames match existing users case-insensitively and unknown roles
+are reported as skipped rows. ``bulk_create`` skips the profile ``post_save`` signals,
+so each batch applies their side effects once: one roster re-projection, one
+``FacilityStats`` delta and one dashboard cache bump.
+"""
+
+import csv
+import io
+
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from django.db.models.functions import Lower
+from django.utils.text import slugify
+
+from user.models import User
+
+from ..models.department import Department
+from ..models.faculty import FacultyProfile
+from .dashboard_cache import bump_data_version, facility_scope
+from .facility_access import invalidate_user_facility_access
+from .facility_stats import (
+    NO_CONTRIBUTION,
+    apply_stats_deltas,
+    merge_stats_deltas,
+    profile_contribution,
+    stats_delta,
+)
+from .faculty_roster import refresh_roster_entries
+
+ROSTER_BATCH_SIZE = 500
+ROSTER_COLUMNS = ("username", "email", "first_name", "last_name", "role", "department")
+
+
+def read_roster_csv(handle):
+    """Yield one dict per CSV row, with header names normalized to lower_snake_case."""
+    if isinstance(handle, (bytes, bytearray)):
+        handle = io.StringIO(handle.decode("utf-8-sig"))
+    reader = csv.DictReader(handle)
+    for row in reader:
+        yield {
+            (key or "").strip().lower().replace(" ", "_"): (value or "").strip()
+            for key, value in row.items()
+        }
+
+
+def _role_map():
+    roles = {}
+    for value, label in FacultyProfile.FacultyRole.choices:
+        roles[value.lower()] = value
+        roles[label.lower()] = value
+    return roles
+
+
+def _department_map(facility):
+    departments = {}
+    for pk, name, abbreviation in Department.objects.filter(facility=facility).values_list(
+        "pk", "name", "abbreviation"
+    ):
+        departments[name.lower()] = pk
+        if abbreviation:
+            departments[abbreviation.lower()] = pk
+    return departments
+
+
+def _unique_slug(base, taken):
+    slug, suffix = base, 2
+    while slug in taken:
+        slug = f"{base}-{suffix}"
+        suffix += 1
+    taken.add(slug)
+    return slug
+
+
+class RosterImport:
+    """Import faculty rows into ``facility``; see the module docstring."""
+
+    def __init__(self, facility, batch_size=ROSTER_BATCH_SIZE):
+        self.facility = facility
+        self.organization_id = facility.organization_id
+        self.batch_size = batch_size
+        self.roles = _role_map()
+        self.departments = _department_map(facility)
+        self.taken_slugs = set(
+            FacultyProfile.objects.filter(organization_id=self.organization_id).values_list(
+                "slug", flat=True
+            )
+        )
+        self.seen_usernames = set()
+        self.password = make_password(None)
+        self.created = 0
+        self.skipped = []  # (line number, reason)
+
+    def run(self, rows):
+        batch = []
+        for line, row in enumerate(rows, start=2):  # line 1 is the header
+            batch.append((line, row))
+            if len(batch) >= self.batch_size:
+                self._import_batch(batch)
+                batch = []
+        if batch:
+            self._import_batch(batch)
+        return {"created": self.created, "skipped": self.skipped}
+
+    def _clean(self, line, row):
+        username = row.get("username", "")
+        if not username:
+            self.skipped.append((line, "missing username"))
+            return None
+        key = username.lower()
+        if key in self.seen_usernames:
+            self.skipped.append((line, f"duplicate username {username} in file"))
+            return None
+        self.seen_usernames.add(key)
+
+        role_name = row.get("role", "")
+        role = self.roles.get(role_name.lower()) if role_name else FacultyProfile.FacultyRole.STAFF
+        if role is None:
+            self.skipped.append((line, f"unknown role {role_name}"))
+            return None
+        department_name = row.get("department", "").lower()
+        department_id = self.departments.get(department_name)
+        if department_name and department_id is None:
+            self.skipped.append((line, f"unknown department {row['department']}"))
+            return None
+        return dict(row, username=username, role=role, department_id=department_id)
+
+    @transaction.atomic
+    def _import_batch(self, batch):
+        cleaned = [(line, self._clean(line, row)) for line, row in batch]
+        cleaned = [(line, row) for line, row in cleaned if row]
+        if not cleaned:
+            return
+
+        usernames = [row["username"].lower() for _line, row in cleaned]
+        existing_users = {
+            user.username.lower(): user
+            for user in User.objects.annotate(username_lower=Lower("username")).filter(
+                username_lower__in=usernames
+            )
+        }
+        # Profiles are one per user, so any existing profile blocks the row.
+        profiled = dict(
+            FacultyProfile.objects.filter(user__in=existing_users.values()).values_list(
+                "user_id", "facility_id"
+            )
+        )
+
+        new_users, pending = [], []
+        for line, row in cleaned:
+            user = existing_users.get(row["username"].lower())
+            if user is not None and user.pk in profiled:
+                if profiled[user.pk] == self.facility.pk:
+                    reason = f"{row['username']} is already on the roster"
+                else:
+                    reason = f"{row['username']} already has a faculty profile elsewhere"
+                self.skipped.append((line, reason))
+                continue
+            if user is None:
+                user = User(
+                    username=row["username"],
+                    email=row.get("email", ""),
+                    first_name=row.get("first_name", ""),
+                    last_name=row.get("last_name", ""),
+                    password=self.password,
+                    user_type=User.UserType.FACULTY,
+                )
+                new_users.append(user)
+            pending.append((user, row))
+
+        # bulk_create fills in primary keys, so pending rows can reference the users.
+        User.objects.bulk_create(new_users, batch_size=self.batch_size)
+
+        profiles = []
+        for user, row in pending:
+            base = slugify(f"{user.first_name} {user.last_name}") or slugify(user.username)
+            profiles.append(
+                FacultyProfile(
+                    user=user,
+                    organization_id=self.organization_id,
+                    facility=self.facility,
+                    role=row["role"],
+                    department_id=row["department_id"],
+                    slug=_unique_slug(base or "faculty", self.taken_slugs),
+                )
+            )
+        FacultyProfile.objects.bulk_create(profiles, batch_size=self.batch_size)
+        self.created += len(profiles)
+        if profiles:
+            self._apply_profile_side_effects(profiles, existing_users.values())
+
+    def _apply_profile_side_effects(self, profiles, existing_users):
+        """Do once per batch what the skipped profile ``post_save`` receivers would."""
+        refresh_roster_entries([profile.pk for profile in profiles])
+        apply_stats_deltas(
+            merge_stats_deltas(
+                *(stats_delta(NO_CONTRIBUTION, profile_contribution(p)) for p in profiles)
+            )
+        )
+        bump_data_version(facility_scope(self.facility.pk))
+        # New users have nothing cached yet; existing ones may have a visibility set.
+        profiled = {profile.user_id for profile in profiles}
+        for user in existing_users:
+            if user.pk in profiled:
+                invalidate_user_facility_access(user.pk)
+
+
+def import_roster(facility, rows, batch_size=ROSTER_BATCH_SIZE):
+    """Import ``rows`` into ``facility``; returns ``{"created": n, "skipped": [...]}``."""
+    return RosterImport(facility, batch_size=batch_size).run(rows)
@@ -0,0 +1,100 @@
+# facility/services/settings_resolver.py
+"""
+Batched, cached resolution of settings along a model's fallback chain.
+
+Facility models declare ``get_fallback_chain()`` (for example
+``["facility", "facility.organization"]``) and ``SettingsMixin`` walks it, loading one
+foreign key per hop. ``with_fallback_chain`` joins the whole chain into the original
+query, and ``resolve_setting`` memoizes resolved values per (model, pk, key). Every
+object keeps its own version key, bumped when it is saved or deleted; a cached value is
+keyed on the versions of the object and of everything in its chain, so saving one
+facility only invalidates resolutions that pass through that facility.
+"""
+
+from functools import lru_cache
+
+from django.core.cache import cache
+from django.db.models import prefetch_related_objects
+
+SETTINGS_CACHE_TIMEOUT = 60 * 15
+
+_MISSING = object()
+
+
+@lru_cache(maxsize=None)
+def fallback_paths(model):
+    """Return the fallback chain of ``model`` as ORM lookups (``facility__organization``)."""
+    return tuple(path.replace(".", "__") for path in model().get_fallback_chain())
+
+
+def with_fallback_chain(queryset):
+    """Join every object in the model's fallback chain into ``queryset``."""
+    return queryset.select_related(*fallback_paths(queryset.model))
+
+
+def prime_fallback_chains(objects):
+    """Batch-load the fallback chains of already fetched ``objects`` (one query per hop)."""
+    objects = list(objects)
+    if objects:
+        prefetch_related_objects(objects, *fallback_paths(type(objects[0])))
+    return objects
+
+
+def _version_key(obj):
+    return f"facility:settings:version:{obj._meta.label_lower}:{obj.pk}"
+
+
+def chain_objects(obj):
+    """
+    ``obj`` followed by every object on its fallback chain. Join the chain first
+    (``with_fallback_chain`` or ``prime_fallback_chains``) to avoid a query per hop.
+    """
+    objects = [obj]
+    for path in obj.get_fallback_chain():
+        target = obj
+        for attr in path.split("."):
+            target = getattr(target, attr, None)
+            if target is None:
+                break
+        if target is not None:
+            objects.append(target)
+    return objects
+
+
+def _chain_version(obj):
+    keys = [_version_key(item) for item in chain_objects(obj)]
+    versions = cache.get_many(keys)
+    return ".".join(str(versions.get(key, 1)) for key in keys)
+
+
+def invalidate_settings_cache(sender=None, instance=None, **kwargs):
+    """
+    Drop cached resolutions that pass through ``instance``; usable directly as a
+    signal receiver.
+    """
+    if instance is None or instance.pk is None:
+        return
+    key = _version_key(instance)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # Unset versions read as 1, so start past it.
+        cache.set(key, 2, None)
+
+
+def resolve_setting(obj, key, default=None):
+    """
+    Return ``obj.get_setting(key)``, cached per (model, pk, key) until ``obj`` or an
+    object in its fallback chain is saved. Models without settings resolve to
+    ``default``.
+    """
+    if obj is None or not hasattr(obj, "get_setting"):
+        return default
+    cache_key = (
+        f"facility:settings:{obj._meta.label_lower}:{obj.pk}:{key}:{_chain_version(obj)}"
+    )
+    value = cache.get(cache_key, _MISSING)
+    if value is _MISSING:
+        value = obj.get_setting(key)
+        cache.set(cache_key, value, SETTINGS_CACHE_TIMEOUT)
+    return default if value is None else value
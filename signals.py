@@ -0,0 +1,292 @@
+# facility/signals.py
+"""Signal handlers that keep denormalized facility data in step with its sources."""
+
+from django.apps import apps
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+
+from .services.dashboard_cache import REPORTS_SCOPE, bump_data_version, facility_scope
+from .services.facility_access import (
+    invalidate_facility_access,
+    invalidate_user_facility_access,
+)
+from .services.facility_stats import (
+    NO_CONTRIBUTION,
+    STATS_SOURCES,
+    apply_stats_deltas,
+    stats_delta,
+)
+from .services.faculty_roster import (
+    clear_department_roster,
+    clear_facility_roster,
+    refresh_roster_entries,
+    sync_department_roster,
+    sync_facility_roster,
+    sync_user_roster,
+)
+from .services.hierarchy import (
+    insert_department,
+    insert_organization,
+    move_department,
+    move_organization,
+)
+from .services.occupancy import (
+    adjust_occupancy,
+    key_deltas,
+    merge_deltas,
+    occupancy_sources,
+    rebuild_occupancy,
+    reservation_key,
+    week_scope_field,
+)
+from .services.settings_resolver import invalidate_settings_cache
+
+
+def _make_occupancy_handlers(model, field_name):
+    scope = week_scope_field(model)
+    previous_attr = f"_previous_{field_name}_reservation"
+    watched = {field_name, f"{field_name}_id", scope, f"{scope}_id", "is_deleted"}
+
+    def remember_previous(sender, instance, raw=False, update_fields=None, **kwargs):
+        setattr(instance, previous_attr, None)
+        if raw or instance._state.adding or instance.pk is None:
+            return
+        if update_fields is not None and not (watched & set(update_fields)):
+            setattr(instance, previous_attr, reservation_key(model, field_name, instance))
+            return
+        previous = sender._base_manager.filter(pk=instance.pk).first()
+        if previous is not None:
+            setattr(instance, previous_attr, reservation_key(model, field_name, previous))
+
+    def apply_save(sender, instance, raw=False, **kwargs):
+        if raw:
+            return
+        previous = getattr(instance, previous_attr, None)
+        current = reservation_key(model, field_name, instance)
+        if previous != current:
+            adjust_occupancy(
+                merge_deltas(
+                    key_deltas(model, previous, -1), key_deltas(model, current, 1)
+                )
+            )
+
+    def apply_delete(sender, instance, **kwargs):
+        adjust_occupancy(key_deltas(model, reservation_key(model, field_name, instance), -1))
+
+    return remember_previous, apply_save, apply_delete
+
+
+def _recount_week(sender, instance, raw=False, **kwargs):
+    # Session-scoped reservations cover every week of the session, new ones included.
+    if not raw:
+        rebuild_occupancy(weeks=sender._base_manager.filter(pk=instance.pk))
+
+
+def connect_occupancy_signals():
+    """Connect occupancy bookkeeping for every enrollment model that reserves quarters."""
+    for model, field_name in occupancy_sources():
+        if week_scope_field(model) is None:
+            # Rows that cover no week never occupy a bed.
+            continue
+        remember_previous, apply_save, apply_delete = _make_occupancy_handlers(
+            model, field_name
+        )
+        uid = f"facility.occupancy.{model._meta.label_lower}.{field_name}"
+        pre_save.connect(remember_previous, sender=model, weak=False, dispatch_uid=uid)
+        post_save.connect(apply_save, sender=model, weak=False, dispatch_uid=uid)
+        post_delete.connect(apply_delete, sender=model, weak=False, dispatch_uid=uid)
+    week_model = apps.get_model("enrollment", "Week")
+    post_save.connect(_recount_week, sender=week_model, dispatch_uid="facility.occupancy.week")
+
+
+def _remember_previous_parent(sender, instance, raw=False, **kwargs):
+    instance._previous_parent_id = None
+    if raw or instance._state.adding or instance.pk is None:
+        return
+    instance._previous_parent_id = (
+        sender._base_manager.filter(pk=instance.pk)
+        .values_list("parent_id", flat=True)
+        .first()
+    )
+
+
+def _make_closure_handler(insert, move):
+    def sync_closure(sender, instance, created, raw=False, **kwargs):
+        if raw:
+            return
+        if created:
+            insert(instance)
+        elif instance.parent_id != getattr(instance, "_previous_parent_id", None):
+            move(instance)
+
+    return sync_closure
+
+
+_sync_organization_closure = _make_closure_handler(insert_organization, move_organization)
+_sync_department_closure = _make_closure_handler(insert_department, move_department)
+
+
+def connect_organization_closure_signals():
+    """Keep ``OrganizationClosure`` in step with organization saves and moves."""
+    organization_model = apps.get_model("organization", "Organization")
+    uid = "facility.organization_closure"
+    pre_save.connect(_remember_previous_parent, sender=organization_model, dispatch_uid=uid)
+    post_save.connect(_sync_organization_closure, sender=organization_model, dispatch_uid=uid)
+
+
+def connect_department_closure_signals():
+    """Keep ``DepartmentClosure`` in step with department saves and moves."""
+    department_model = apps.get_model("facility", "Department")
+    uid = "facility.department_closure"
+    pre_save.connect(_remember_previous_parent, sender=department_model, dispatch_uid=uid)
+    post_save.connect(_sync_department_closure, sender=department_model, dispatch_uid=uid)
+
+
+# Every model that can appear in a facility fallback chain.
+SETTINGS_CHAIN_MODELS = (
+    "facility.Facility",
+    "facility.Department",
+    "facility.Quarters",
+    "facility.QuartersType",
+    "facility.FacultyProfile",
+    "organization.Organization",
+)
+
+
+def connect_settings_cache_signals():
+    """Invalidate cached setting resolutions when any chain object is saved or deleted."""
+    for label in SETTINGS_CHAIN_MODELS:
+        model = apps.get_model(label)
+        uid = f"facility.settings_cache.{model._meta.label_lower}"
+        post_save.connect(invalidate_settings_cache, sender=model, dispatch_uid=uid)
+        post_delete.connect(invalidate_settings_cache, sender=model, dispatch_uid=uid)
+
+
+def _bump_profile_facility(sender, instance, **kwargs):
+    if instance.facility_id:
+        bump_data_version(facility_scope(instance.facility_id))
+
+
+def _bump_enrollment_facility(sender, instance, **kwargs):
+    facility_id = getattr(instance.facility_enrollment, "facility_id", None)
+    if facility_id:
+        bump_data_version(facility_scope(facility_id))
+
+
+def _bump_reports(sender, instance, **kwargs):
+    bump_data_version(REPORTS_SCOPE)
+
+
+def connect_dashboard_cache_signals():
+    """Bump dashboard data versions when the models behind the widgets change."""
+    receivers = (
+        ("facility.FacultyProfile", _bump_profile_facility),
+        ("enrollment.FacultyEnrollment", _bump_enrollment_facility),
+        ("reports.GeneratedReport", _bump_reports),
+    )
+    for label, receiver in receivers:
+        model = apps.get_model(label)
+        uid = f"facility.dashboard_cache.{model._meta.label_lower}"
+        post_save.connect(receiver, sender=model, dispatch_uid=uid)
+        post_delete.connect(receiver, sender=model, dispatch_uid=uid)
+
+
+def _make_stats_handlers(contribution):
+    def remember_previous(sender, instance, raw=False, **kwargs):
+        instance._previous_stats_contribution = NO_CONTRIBUTION
+        if raw or instance._state.adding or instance.pk is None:
+            return
+        previous = sender._base_manager.filter(pk=instance.pk).first()
+        if previous is not None:
+            instance._previous_stats_contribution = contribution(previous)
+
+    def apply_save(sender, instance, raw=False, **kwargs):
+        if raw:
+            return
+        previous = getattr(instance, "_previous_stats_contribution", NO_CONTRIBUTION)
+        apply_stats_deltas(stats_delta(previous, contribution(instance)))
+
+    def apply_delete(sender, instance, **kwargs):
+        apply_stats_deltas(stats_delta(contribution(instance), NO_CONTRIBUTION))
+
+    return remember_previous, apply_save, apply_delete
+
+
+def connect_facility_stats_signals():
+    """Apply each source row's change to ``FacilityStats`` as a delta."""
+    for label, contribution in STATS_SOURCES:
+        model = apps.get_model(label)
+        remember_previous, apply_save, apply_delete = _make_stats_handlers(contribution)
+        uid = f"facility.stats.{model._meta.label_lower}"
+        pre_save.connect(remember_previous, sender=model, weak=False, dispatch_uid=uid)
+        post_save.connect(apply_save, sender=model, weak=False, dispatch_uid=uid)
+        post_delete.connect(apply_delete, sender=model, weak=False, dispatch_uid=uid)
+
+
+def _invalidate_profile_access(sender, instance, **kwargs):
+    invalidate_user_facility_access(instance.user_id)
+
+
+def _invalidate_user_access(sender, instance, **kwargs):
+    invalidate_user_facility_access(instance.pk)
+
+
+def connect_facility_access_signals():
+    """Invalidate cached facility visibility when roles, profiles or organizations change."""
+    receivers = (
+        (settings.AUTH_USER_MODEL, _invalidate_user_access),
+        ("facility.FacultyProfile", _invalidate_profile_access),
+        ("facility.Facility", invalidate_facility_access),
+        ("organization.Organization", invalidate_facility_access),
+    )
+    for label, receiver in receivers:
+        model = apps.get_model(label)
+        uid = f"facility.access.{model._meta.label_lower}"
+        post_save.connect(receiver, sender=model, dispatch_uid=uid)
+        post_delete.connect(receiver, sender=model, dispatch_uid=uid)
+
+
+def _refresh_profile_roster(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    refresh_roster_entries([instance.pk])
+
+
+def _make_roster_sync(sync):
+    def push_columns(sender, instance, raw=False, **kwargs):
+        if not raw:
+            sync(instance)
+
+    return push_columns
+
+
+def _make_roster_clear(clear):
+    def clear_columns(sender, instance, **kwargs):
+        clear(instance)
+
+    return clear_columns
+
+
+def connect_faculty_roster_signals():
+    """Keep ``FacultyRosterEntry`` rows in step with the models they copy columns from."""
+    receivers = (
+        ("facility.FacultyProfile", _refresh_profile_roster),
+        (settings.AUTH_USER_MODEL, _make_roster_sync(sync_user_roster)),
+        ("facility.Facility", _make_roster_sync(sync_facility_roster)),
+        ("facility.Department", _make_roster_sync(sync_department_roster)),
+    )
+    for label, receiver in receivers:
+        model = apps.get_model(label)
+        uid = f"facility.roster.{model._meta.label_lower}"
+        post_save.connect(receiver, sender=model, weak=False, dispatch_uid=uid)
+
+    # pre_delete, not post_delete: by post_delete the collector has already nulled
+    # the roster's foreign keys, so the rows to blank can no longer be found.
+    clearers = (
+        ("facility.Facility", _make_roster_clear(clear_facility_roster)),
+        ("facility.Department", _make_roster_clear(clear_department_roster)),
+    )
+    for label, receiver in clearers:
+        model = apps.get_model(label)
+        uid = f"facility.roster.clear.{model._meta.label_lower}"
+        pre_delete.connect(receiver, sender=model, weak=False, dispatch_uid=uid)
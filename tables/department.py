@@ -21,6 +21,8 @@ Attributes:
 """
 
 import django_tables2 as tables
+from django.utils.html import format_html
+
 from core.tables.base import BaseTable
 
 from ..models.department import Department
@@ -84,3 +86,20 @@ class DepartmentTable(BaseTable):
         },
     }
     available_actions = ["show", "edit", "delete"]
+
+
+class DepartmentTreeTable(DepartmentTable):
+    """
+    DepartmentTable for rows from ``selectors.department_tree``: names are indented by
+    their ``tree_depth`` and rows keep their tree order instead of being sortable.
+    """
+
+    class Meta(DepartmentTable.Meta):
+        orderable = False
+
+    def render_name(self, value, record):
+        return format_html(
+            '<span class="department-tree-node" style="padding-left: {}rem">{}</span>',
+            getattr(record, "tree_depth", 0) * 1.5,
+            value,
+        )
@@ -4,6 +4,12 @@ from ..models.facility import Facility
 
 
 class FacilityTable(tables.Table):
+    # Filled by ``selectors.with_facility_counts``; sortable because they are annotations.
+    department_count = tables.Column(verbose_name="Departments", default=0)
+    quarters_count = tables.Column(verbose_name="Quarters", default=0)
+    bed_count = tables.Column(verbose_name="Beds", default=0)
+    faculty_count = tables.Column(verbose_name="Faculty", default=0)
+
     class Meta:
         model = Facility
         template_name = "django_tables2/bootstrap4.html"
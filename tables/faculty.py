@@ -4,6 +4,7 @@ import django_tables2 as tables
 from core.tables.base import BaseTable
 
 from ..models.faculty import FacultyProfile
+from ..models.faculty_roster import FacultyRosterEntry
 
 
 class FacultyTable(BaseTable):
@@ -55,3 +56,36 @@ class FacultyTable(BaseTable):
 class FacultyByFacilityTable(FacultyTable):
     class Meta(FacultyTable.Meta):
         pass
+
+
+class FacultyRosterTable(BaseTable):
+    """Cross-facility roster over ``FacultyRosterEntry``; every column is a plain column."""
+
+    last_name = tables.Column(verbose_name="Last Name")
+    first_name = tables.Column(verbose_name="First Name")
+    email = tables.Column(verbose_name="Email")
+    facility_name = tables.Column(verbose_name="Facility")
+    department_name = tables.Column(verbose_name="Department")
+    role = tables.Column(accessor="get_role_display", order_by="role", verbose_name="Role")
+
+    class Meta:
+        model = FacultyRosterEntry
+        fields = (
+            "last_name",
+            "first_name",
+            "email",
+            "facility_name",
+            "department_name",
+            "role",
+        )
+
+    urls = {
+        action: {
+            "kwargs": {
+                "facility_slug": "facility_slug",
+                "faculty_slug": "profile_slug",
+            }
+        }
+        for action in ("show", "edit", "delete")
+    }
+    url_namespace = "facilities:faculty"
@@ -19,7 +19,8 @@ class QuartersTable(BaseTable):
         facility: A column that displays the name of the associated facility.
         type: A column that displays the type of quarters.
         capacity: A column that indicates the maximum capacity of the quarters.
-        occupancy: A column that shows the current occupancy of the quarters.
+        reserved_beds: A column that shows the beds reserved during the current week.
+        available_beds: A column that shows the beds still free in the quarters.
 
         Meta:
             model: The model associated with this table, which is Quarters.
@@ -33,7 +34,9 @@ class QuartersTable(BaseTable):
     facility = tables.Column(verbose_name="Facility")
     type = tables.Column(verbose_name="Type")
     capacity = tables.Column(verbose_name="Capacity")
-    occupancy = tables.Column(verbose_name="Occupancy")
+    # Annotated by ``selectors.with_current_occupancy``.
+    reserved_beds = tables.Column(verbose_name="Occupancy", default=0)
+    available_beds = tables.Column(verbose_name="Available", orderable=False)
 
     class Meta:
         model = Quarters
@@ -43,7 +46,8 @@ class QuartersTable(BaseTable):
             "facility",
             "type",
             "capacity",
-            "occupancy",
+            "reserved_beds",
+            "available_beds",
         )  # Adjust fields as necessary
 
     url_namespace = "facilities:quarters"
@@ -1,19 +1,78 @@
+from contextlib import contextmanager
+from io import StringIO
 from types import SimpleNamespace
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 from datetime import time
+from threading import Barrier, Event
 
-from django.test import RequestFactory
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.core.management import call_command
+from django.db import connection
+from django.db.models import QuerySet
+from django.db.models.signals import post_save
+from django.db.models.fields.related_descriptors import ForwardManyToOneDescriptor
+from django.test import RequestFactory, SimpleTestCase
 from django.http import Http404
 from django.urls import reverse
 
 from core.tests import BaseDomainTestCase, mute_profile_signals
+from reports.models import GeneratedReport
 from user.models import User
 from .models.faculty import FacultyProfile
 from .models.quarters import Quarters, QuartersType
+from .models.quarters_occupancy import QuartersOccupancy
+from .forms.choices import AutocompleteSelect, scope_choice_field
 from .forms.quarters import QuartersForm
-from .views.faculty import ManageView
-from .selectors import facility_list_queryset
+from .benchmarks import run_benchmarks, seed_facility
+from .paginators import KeysetPaginator
+from .querysets.faculty import FacultyProfileQuerySet, prime_enrollments
+from .services.facility_access import (
+    ALL_FACILITIES,
+    _user_version_key,
+    scope_to_visible_facilities,
+    visible_facility_ids,
+)
+from .services.faculty_roster import (
+    rebuild_faculty_roster,
+    roster_for_organization,
+    sync_department_roster,
+)
+from .services.facility_stats import facility_stats_for, reconcile_facility_stats
+from .services.housing import auto_assign_quarters
+from .services.occupancy import occupancy_drift
+from .services.roster import import_roster, read_roster_csv
+from .services.settings_resolver import resolve_setting
+from .views.faculty import ManageView, RosterImportView
+from .views.facility import ChoiceAutocompleteView, ExportView
+from .views.facility import DashboardView as FacilityDashboardView
+from .views.facility import ManageView as FacilityManageView
+from .views.faculty import CreateView as FacultyCreateView
+from .views.faculty import DashboardView as FacultyDashboardView
+from .views.mixins import ParallelWidgetsMixin
+from .views.quarters import AssignView as QuartersAssignView
+from .views.quarters import IndexView as QuartersIndexView
+from .selectors import (
+    available_quarters,
+    choice_querysets,
+    department_tree,
+    departments_for_facility,
+    enrollments_for_facility,
+    FACILITY_LIST_COUNTS,
+    facility_list_queryset,
+    facility_manage_counts,
+    facility_manage_tables_config,
+    faculty_for_facility,
+    live_facilities_named,
+    live_quarters_named,
+    live_quarters_types_named,
+    plan_quarters_for_requests,
+    reports_visible_to,
+)
 from .models.facility import Facility
+from .models.facility_stats import FacilityStats
+from .models.faculty_roster import FacultyRosterEntry
+from .models.organization_closure import OrganizationClosure
 from facility.models.department import Department
 from enrollment.models.faculty import FacultyEnrollment as FacultyEnrollmentRecord
 from enrollment.models.facility_class import (
@@ -32,7 +91,40 @@ from enrollment.views.facility import (
     FacultyEnrollmentUpdateView,
 )
 from core.utils import is_department_admin, is_faculty_admin
-from facility.forms.faculty import FacultyForm, PromoteFacultyForm
+from facility.forms.faculty import AssignDepartmentForm, FacultyForm, PromoteFacultyForm
+from facility.tables.department import DepartmentTable
+from facility.tables.faculty import FacultyTable
+
+
+@contextmanager
+def forbid_lazy_fk_loads():
+    """Fail on any foreign key that is loaded lazily instead of joined up front."""
+
+    def guarded(descriptor, instance):
+        raise AssertionError(
+            f"Lazy load of {descriptor.field.model.__name__}.{descriptor.field.name}"
+        )
+
+    with patch.object(ForwardManyToOneDescriptor, "get_object", guarded):
+        yield
+
+
+def clone_session(facility_enrollment, **changes):
+    """Copy a seeded facility enrollment so every required field is already filled in."""
+    session = facility_enrollment.__class__._base_manager.get(pk=facility_enrollment.pk)
+    session.pk = session.id = None
+    session._state.adding = True
+    if getattr(session, "slug", None):
+        session.slug = f"{session.slug}-copy"
+    for field, value in changes.items():
+        setattr(session, field, value)
+    session.save()
+    return session
+
+
+def render_table_rows(table):
+    """Render every cell of ``table`` (including action URLs) without a template."""
+    return [[cell for cell in row] for row in table.rows]
 
 
 class FacilityModelTests(BaseDomainTestCase):
@@ -61,6 +153,38 @@ class FacilityModelTests(BaseDomainTestCase):
         )
 
 
+class OrganizationClosureTests(BaseDomainTestCase):
+    def test_root_lookup_is_a_single_query(self):
+        facility = Facility.objects.get(pk=self.facility.pk)
+        with self.assertNumQueries(1):
+            self.assertEqual(facility.get_root_organization(), self.parent_org)
+
+    def test_descendants_include_child_organizations(self):
+        descendants = set(
+            OrganizationClosure.descendant_ids(self.parent_org).values_list(
+                "descendant_id", flat=True
+            )
+        )
+        self.assertIn(self.parent_org.pk, descendants)
+        self.assertIn(self.organization.pk, descendants)
+
+    def test_moving_an_organization_relinks_its_subtree(self):
+        new_root = self.parent_org.__class__.objects.create(
+            name="New Root",
+            abbreviation="NR",
+            max_depth=5,
+        )
+        self.organization.parent = new_root
+        self.organization.save()
+
+        self.assertEqual(OrganizationClosure.root_for(self.organization.pk), new_root)
+        self.assertFalse(
+            OrganizationClosure.descendant_ids(self.parent_org)
+            .filter(descendant_id=self.organization.pk)
+            .exists()
+        )
+
+
 class FacilityAccessScopeTests(BaseDomainTestCase):
     @classmethod
     def setUpTestData(cls):
@@ -133,6 +257,195 @@ class FacilityAccessScopeTests(BaseDomainTestCase):
         self.assertContains(response, "Classes")
 
 
+class FacilityAccessCacheTests(BaseDomainTestCase):
+    def setUp(self):
+        super().setUp()
+        self.other_facility = Facility.objects.create(
+            name="Access Other Facility", organization=self.organization
+        )
+        with mute_profile_signals():
+            self.user = User.objects.create_user(
+                username="facility.access.faculty",
+                password="pass12345",
+                user_type=User.UserType.FACULTY,
+            )
+        self.profile = FacultyProfile.objects.create(
+            user=self.user,
+            organization=self.organization,
+            facility=self.facility,
+        )
+
+    def test_visible_ids_are_cached(self):
+        self.assertEqual(visible_facility_ids(self.user), {self.facility.pk})
+        with self.assertNumQueries(0):
+            self.assertEqual(visible_facility_ids(self.user), {self.facility.pk})
+
+    def test_profile_change_invalidates_cached_ids(self):
+        visible_facility_ids(self.user)
+        self.profile.facility = self.other_facility
+        self.profile.save()
+
+        self.assertEqual(visible_facility_ids(self.user), {self.other_facility.pk})
+        self.assertQuerySetEqual(
+            facility_list_queryset(self.user), [self.other_facility], transform=lambda x: x
+        )
+
+    def test_evicted_version_never_revives_a_stale_set(self):
+        visible_facility_ids(self.user)
+        cache.delete(_user_version_key(self.user.pk))
+        self.profile.facility = self.other_facility
+        self.profile.save()
+
+        self.assertEqual(visible_facility_ids(self.user), {self.other_facility.pk})
+
+    def test_superusers_see_everything_without_a_lookup(self):
+        with mute_profile_signals():
+            admin = User.objects.create_superuser(
+                username="facility.access.admin",
+                email="facility.access.admin@example.com",
+                password="pass12345",
+            )
+        with self.assertNumQueries(0):
+            self.assertEqual(visible_facility_ids(admin), ALL_FACILITIES)
+        queryset = Facility.objects.all()
+        self.assertIs(scope_to_visible_facilities(queryset, admin), queryset)
+
+    def test_unfiltered_policy_results_are_cached_as_ids(self):
+        with patch(
+            "facility.services.facility_access.visible_facilities_for_user",
+            return_value=Facility.objects.all(),
+        ):
+            ids = visible_facility_ids(self.user)
+        self.assertEqual(ids, set(Facility.objects.values_list("pk", flat=True)))
+
+    def test_scopes_related_rows_by_facility(self):
+        Department.objects.create(name="Seen", abbreviation="SEE", facility=self.facility)
+        Department.objects.create(
+            name="Hidden", abbreviation="HID", facility=self.other_facility
+        )
+        departments = scope_to_visible_facilities(
+            Department.objects.all(), self.user, field="facility"
+        )
+        self.assertEqual(
+            set(departments.values_list("facility_id", flat=True)), {self.facility.pk}
+        )
+
+
+class FacultyRosterTests(BaseDomainTestCase):
+    def setUp(self):
+        super().setUp()
+        self.department = Department.objects.create(
+            name="Aquatics", abbreviation="AQU", facility=self.facility
+        )
+        with mute_profile_signals():
+            self.user = User.objects.create_user(
+                username="facility.roster.faculty",
+                password="pass12345",
+                first_name="Rosa",
+                last_name="Roster",
+                user_type=User.UserType.FACULTY,
+            )
+            self.admin_user = User.objects.create_superuser(
+                username="facility.roster.admin",
+                email="facility.roster.admin@example.com",
+                password="pass12345",
+            )
+        self.profile = FacultyProfile.objects.create(
+            user=self.user,
+            organization=self.organization,
+            facility=self.facility,
+            department=self.department,
+            role=FacultyProfile.FacultyRole.DEPARTMENT_ADMIN,
+        )
+
+    def entry(self):
+        return FacultyRosterEntry.objects.get(profile=self.profile)
+
+    def test_profile_save_projects_row(self):
+        entry = self.entry()
+        self.assertEqual(
+            (entry.last_name, entry.facility_name, entry.department_name, entry.role),
+            ("Roster", self.facility.name, "Aquatics", self.profile.role),
+        )
+        self.assertEqual(entry.organization_id, self.facility.organization_id)
+        self.assertIn(entry, roster_for_organization(self.parent_org))
+
+    def test_related_saves_push_columns(self):
+        self.user.last_name = "Renamed"
+        self.user.save()
+        self.department.name = "Water Sports"
+        self.department.save()
+        self.facility.name = "Renamed Facility"
+        self.facility.save()
+
+        entry = self.entry()
+        self.assertEqual(
+            (entry.last_name, entry.department_name, entry.facility_name),
+            ("Renamed", "Water Sports", "Renamed Facility"),
+        )
+
+    def test_department_rename_updates_roster_rows(self):
+        self.department.name = "Lifeguarding"
+        with self.assertNumQueries(1):
+            sync_department_roster(self.department)
+        self.assertEqual(self.entry().department_name, "Lifeguarding")
+
+        self.department.name = "Waterfront"
+        self.department.save()
+        self.assertEqual(self.entry().department_name, "Waterfront")
+
+    def test_soft_deleted_department_is_blanked_until_restored(self):
+        self.department.is_deleted = True
+        self.department.save()
+        entry = self.entry()
+        self.assertEqual((entry.department_id, entry.department_name), (self.department.pk, ""))
+
+        rebuild_faculty_roster(self.parent_org)
+        self.assertEqual(self.entry().department_name, "")
+
+        self.department.is_deleted = False
+        self.department.save()
+        self.assertEqual(self.entry().department_name, "Aquatics")
+
+    def test_deleting_department_or_facility_clears_roster_columns(self):
+        # Through the base manager so a soft-delete override cannot turn these into saves.
+        Department._base_manager.filter(pk=self.department.pk).delete()
+        entry = self.entry()
+        self.assertEqual((entry.department_id, entry.department_name), (None, ""))
+
+        Facility._base_manager.filter(pk=self.facility.pk).delete()
+        entry = self.entry()
+        self.assertEqual(
+            (entry.facility_id, entry.facility_name, entry.facility_slug), (None, "", "")
+        )
+
+    def test_rebuild_repairs_missing_rows(self):
+        FacultyRosterEntry.objects.filter(profile=self.profile).delete()
+        rebuild_faculty_roster(self.parent_org)
+        self.assertEqual(self.entry().first_name, "Rosa")
+
+    def test_roster_view_filters_by_role(self):
+        self.client.force_login(self.admin_user)
+        url = reverse("facilities:roster", kwargs={"organization_slug": self.parent_org.slug})
+
+        response = self.client.get(url, {"role": FacultyProfile.FacultyRole.DEPARTMENT_ADMIN})
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Rosa")
+
+        response = self.client.get(url, {"role": FacultyProfile.FacultyRole.STAFF})
+        self.assertNotContains(response, "Rosa")
+
+    def test_roster_view_renders_filters_and_skips_unlinkable_rows(self):
+        self.client.force_login(self.admin_user)
+        url = reverse("facilities:roster", kwargs={"organization_slug": self.parent_org.slug})
+        response = self.client.get(url)
+        self.assertContains(response, 'name="role"')
+        self.assertContains(response, "Rosa")
+
+        FacultyRosterEntry.objects.filter(profile=self.profile).update(facility_slug="")
+        self.assertNotContains(self.client.get(url), "Rosa")
+
+
 class FacultyManageViewTests(BaseDomainTestCase):
     def setUp(self):
         super().setUp()
@@ -172,6 +485,22 @@ class FacultyManageViewTests(BaseDomainTestCase):
         with self.assertRaises(Http404):
             view.get_facility()
 
+    def test_profile_forms_are_scoped_to_the_url_facility(self):
+        view = FacultyCreateView()
+        view.request = self.factory.get("/faculty/new/")
+        view.kwargs = {}
+        with patch.object(FacultyCreateView, "get_scope_facility", return_value=self.facility):
+            form = view.get_form()
+        self.assertEqual(form.facility, self.facility)
+        self.assertEqual(
+            set(form.fields["facility"].queryset),
+            set(choice_querysets(self.facility)["facility"]),
+        )
+
+        with patch.object(FacultyCreateView, "get_scope_facility", return_value=None):
+            with self.assertRaises(Http404):
+                view.get_form_kwargs()
+
     def test_is_faculty_admin_helper_respects_role(self):
         self.assertTrue(is_faculty_admin(self.user))
 
@@ -361,28 +690,1473 @@ class FacultyManageViewTests(BaseDomainTestCase):
         self.assertEqual(updated.department, department)
 
 
-class QuartersFormTests(BaseDomainTestCase):
-    def test_duplicate_name_within_facility_is_invalid(self):
+class FacilityManageScopeTests(BaseDomainTestCase):
+    def setUp(self):
+        super().setUp()
+        self.factory = RequestFactory()
+        with mute_profile_signals():
+            self.user = User.objects.create_user(
+                username="facility.manage.scope",
+                password="pass12345",
+                user_type=User.UserType.FACULTY,
+            )
+        FacultyProfile.objects.create(
+            user=self.user,
+            organization=self.organization,
+            facility=self.facility,
+            role=FacultyProfile.FacultyRole.ADMIN,
+        )
+
+    def _build_view(self):
+        request = self.factory.get("/facilities/manage/")
+        request.user = User.objects.get(pk=self.user.pk)
+        view = FacilityManageView()
+        view.request = request
+        view.kwargs = {}
+        return view
+
+    def test_facility_resolved_once_per_request(self):
+        view = self._build_view()
+        with patch.object(
+            FacilityManageView, "get_scope_facility", return_value=None
+        ) as scope:
+            facility = view.get_facility()
+            with self.assertNumQueries(0):
+                self.assertIs(view.get_facility(), facility)
+                self.assertEqual(facility.organization, self.organization)
+        scope.assert_called_once()
+        self.assertEqual(facility, self.facility)
+
+    def test_root_organization_resolved_once_per_request(self):
+        view = self._build_view()
+        with patch.object(
+            FacilityManageView, "get_scope_facility", return_value=self.facility
+        ):
+            root = view.get_root_organization()
+            with self.assertNumQueries(0):
+                self.assertIs(view.get_root_organization(), root)
+        self.assertEqual(root, self.parent_org)
+
+
+class LazyManageTablesTests(BaseDomainTestCase):
+    def setUp(self):
+        super().setUp()
+        with mute_profile_signals():
+            self.user = User.objects.create_user(
+                username="facility.manage.lazy",
+                password="pass12345",
+                user_type=User.UserType.FACULTY,
+            )
+        FacultyProfile.objects.create(
+            user=self.user,
+            organization=self.organization,
+            facility=self.facility,
+            role=FacultyProfile.FacultyRole.ADMIN,
+        )
+        Department.objects.create(
+            name="Aquatics",
+            abbreviation="AQ",
+            facility=self.facility,
+        )
+        self.client.force_login(self.user)
+
+    def table_url(self, table_name):
+        return reverse(
+            "facilities:manage_table",
+            kwargs={"facility_slug": self.facility.slug, "table_name": table_name},
+        )
+
+    def test_shell_links_fragments_without_building_tables(self):
+        with patch.object(FacilityManageView, "build_tables") as build_tables:
+            response = self.client.get(
+                reverse("facilities:manage", kwargs={"facility_slug": self.facility.slug})
+            )
+
+        self.assertEqual(response.status_code, 200)
+        build_tables.assert_not_called()
+        self.assertContains(response, self.table_url("departments"))
+        self.assertContains(response, self.table_url("facility_enrollments"))
+        self.assertNotContains(response, "Aquatics")
+
+    def test_fragment_builds_only_its_table(self):
+        request = RequestFactory().get(self.table_url("quarters"))
+        request.user = self.user
+        view = FacilityManageView()
+        view.request = request
+        view.kwargs = {"facility_slug": self.facility.slug, "table_name": "quarters"}
+        with patch.object(FacilityManageView, "get_scope_facility", return_value=self.facility):
+            self.assertEqual(list(view.get_tables_config()), ["quarters"])
+
+    def test_fragment_renders_table(self):
+        response = self.client.get(self.table_url("departments"), {"sort": "name"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, "facility/manage_table.html")
+        self.assertContains(response, "Aquatics")
+        self.assertNotContains(response, "Edit Facility")
+
+    def test_unknown_fragment_is_404(self):
+        response = self.client.get(self.table_url("nonexistent"))
+        self.assertEqual(response.status_code, 404)
+
+
+class FacilityManageCountsTests(BaseDomainTestCase):
+    def setUp(self):
+        super().setUp()
         quarters_type = QuartersType.objects.create(
-            name="QA Type",
+            name="Count Type",
             organization=self.organization,
         )
-        Quarters.objects.create(
-            name="Cabin Alpha",
+        for name in ("Cabin One", "Cabin Two"):
+            Quarters.objects.create(
+                name=name,
+                facility=self.facility,
+                type=quarters_type,
+                capacity=4,
+            )
+        Department.objects.create(
+            name="Aquatics",
+            abbreviation="AQ",
             facility=self.facility,
-            type=quarters_type,
-            capacity=10,
         )
-        form = QuartersForm(
-            data={
-                "name": "Cabin Alpha",
-                "facility": self.facility.id,
-                "type": quarters_type.id,
-                "capacity": 8,
-                "description": "",
-            }
+
+    def test_counts_every_table_in_one_query(self):
+        with self.assertNumQueries(1):
+            totals = facility_manage_counts(self.facility)
+
+        self.assertEqual(totals["departments"], 1)
+        self.assertEqual(totals["quarters"], 2)
+        self.assertEqual(
+            totals["facility_enrollments"],
+            enrollments_for_facility(self.facility).count(),
         )
-        self.assertFalse(form.is_valid())
+
+    def test_table_querysets_reuse_precomputed_totals(self):
+        config = facility_manage_tables_config(self.facility)
+        quarters = config["quarters"]["queryset"].order_by("-name")
+
+        with self.assertNumQueries(0):
+            self.assertEqual(quarters.count(), 2)
+        self.assertEqual(quarters.filter(name="Cabin One").count(), 1)
+
+
+class DepartmentTreeTests(BaseDomainTestCase):
+    def setUp(self):
+        super().setUp()
+        self.root = Department.objects.create(
+            name="Program", abbreviation="PRG", facility=self.facility
+        )
+        self.child = Department.objects.create(
+            name="Aquatics", abbreviation="AQ", facility=self.facility, parent=self.root
+        )
+        self.leaf = Department.objects.create(
+            name="Sailing", abbreviation="SAIL", facility=self.facility, parent=self.child
+        )
+        self.other = Department.objects.create(
+            name="Kitchen", abbreviation="KIT", facility=self.facility
+        )
+
+    def test_descendants_and_ancestors(self):
+        self.assertEqual(set(self.root.descendants()), {self.child, self.leaf})
+        self.assertEqual(
+            set(self.root.descendants(include_self=True)), {self.root, self.child, self.leaf}
+        )
+        self.assertEqual(list(self.leaf.ancestors()), [self.root, self.child])
+
+    def test_faculty_in_subtree(self):
+        with mute_profile_signals():
+            user = User.objects.create_user(
+                username="department.subtree",
+                password="pass12345",
+                user_type=User.UserType.FACULTY,
+            )
+        profile = FacultyProfile.objects.create(
+            user=user,
+            organization=self.organization,
+            facility=self.facility,
+            department=self.leaf,
+        )
+        with self.assertNumQueries(1):
+            self.assertEqual(list(self.root.faculty_in_subtree()), [profile])
+        self.assertFalse(self.other.faculty_in_subtree().exists())
+
+    def test_moving_a_department_relinks_its_subtree(self):
+        self.child.parent = self.other
+        self.child.save()
+
+        self.assertEqual(set(self.other.descendants()), {self.child, self.leaf})
+        self.assertFalse(self.root.descendants().exists())
+        self.assertEqual(list(self.leaf.ancestors()), [self.other, self.child])
+
+    def test_tree_is_depth_first_from_one_query(self):
+        with self.assertNumQueries(1):
+            rows = department_tree(departments_for_facility(self.facility))
+        self.assertEqual(
+            [(row.name, row.tree_depth) for row in rows],
+            [("Kitchen", 0), ("Program", 0), ("Aquatics", 1), ("Sailing", 2)],
+        )
+
+    def test_cannot_move_a_department_under_its_own_subtree(self):
+        self.root.parent = self.leaf
+        with self.assertRaises(ValidationError):
+            self.root.clean()
+        self.root.parent = self.root
+        with self.assertRaises(ValidationError):
+            self.root.clean()
+        self.root.parent = self.other
+        self.root.clean()
+
+    def test_tree_view_lists_live_departments_of_the_scope_facility(self):
+        elsewhere = Facility.objects.create(name="Tree Elsewhere", organization=self.organization)
+        Department.objects.create(name="Stables", abbreviation="STB", facility=elsewhere)
+        Department.objects.filter(pk=self.other.pk).update(is_deleted=True)
+        with mute_profile_signals():
+            admin = User.objects.create_superuser(
+                username="tree.admin", email="tree.admin@example.com", password="pass12345"
+            )
+        self.client.force_login(admin)
+        response = self.client.get(
+            reverse("facilities:departments:index", kwargs={"facility_slug": self.facility.slug}),
+            {"view": "tree"},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        names = [row.record.name for row in response.context["table"].rows]
+        self.assertEqual(names, ["Program", "Aquatics", "Sailing"])
+
+
+class SettingsResolverTests(BaseDomainTestCase):
+    def setUp(self):
+        super().setUp()
+        self.department = Department.objects.create(
+            name="Settings Dept",
+            abbreviation="SET",
+            facility=self.facility,
+        )
+
+    def test_resolution_is_cached_until_chain_object_saves(self):
+        with patch.object(
+            Department, "get_setting", return_value="blue", create=True
+        ) as get_setting:
+            self.assertEqual(resolve_setting(self.department, "theme"), "blue")
+            self.assertEqual(resolve_setting(self.department, "theme"), "blue")
+            self.assertEqual(get_setting.call_count, 1)
+
+            self.facility.save()
+            resolve_setting(self.department, "theme")
+            self.assertEqual(get_setting.call_count, 2)
+
+    def test_saving_an_unrelated_facility_keeps_the_cache(self):
+        other = Facility.objects.create(name="Settings Other", organization=self.organization)
+        with patch.object(
+            Department, "get_setting", return_value="blue", create=True
+        ) as get_setting:
+            resolve_setting(self.department, "theme")
+            other.save()
+            resolve_setting(self.department, "theme")
+            self.assertEqual(get_setting.call_count, 1)
+
+    def test_form_titles_read_labels_through_the_resolver(self):
+        with mute_profile_signals():
+            admin = User.objects.create_superuser(
+                username="settings.admin", email="settings.admin@example.com", password="pass12345"
+            )
+        self.client.force_login(admin)
+        with patch.object(Facility, "get_setting", return_value="Unit", create=True):
+            response = self.client.get(
+                reverse("facilities:departments:new", kwargs={"facility_slug": self.facility.slug})
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["title"], "Unit")
+
+    def test_department_selector_joins_fallback_chain(self):
+        department = departments_for_facility(self.facility).get(pk=self.department.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(department.facility.organization, self.organization)
+
+
+class TableLazyLoadTests(BaseDomainTestCase):
+    def setUp(self):
+        super().setUp()
+        parent = Department.objects.create(
+            name="Program",
+            abbreviation="PRG",
+            facility=self.facility,
+        )
+        Department.objects.create(
+            name="Climbing",
+            abbreviation="CLB",
+            facility=self.facility,
+            parent=parent,
+        )
+        with mute_profile_signals():
+            user = User.objects.create_user(
+                username="faculty.lazy",
+                password="pass12345",
+                user_type=User.UserType.FACULTY,
+            )
+        FacultyProfile.objects.create(
+            user=user,
+            organization=self.organization,
+            facility=self.facility,
+        )
+
+    def test_department_rows_render_without_lazy_loads(self):
+        departments = list(departments_for_facility(self.facility))
+        with forbid_lazy_fk_loads():
+            render_table_rows(DepartmentTable(departments))
+            for department in departments:
+                department.get_absolute_url()
+
+    def test_faculty_rows_render_without_lazy_loads(self):
+        faculty = list(faculty_for_facility(self.facility))
+        with forbid_lazy_fk_loads():
+            render_table_rows(FacultyTable(faculty))
+            for profile in faculty:
+                profile.get_absolute_url()
+
+
+class QueryBudgetTests(BaseDomainTestCase):
+    def setUp(self):
+        super().setUp()
+        with mute_profile_signals():
+            self.admin = User.objects.create_superuser(
+                username="budget.admin",
+                email="budget.admin@example.com",
+                password="pass12345",
+            )
+        self.small = seed_facility(self.organization, "Budget Small", faculty=3)
+        self.large = seed_facility(
+            self.organization, "Budget Large", faculty=30, quarters=30, departments=15
+        )
+
+    def _run(self, facility):
+        FacultyProfile.objects.update_or_create(
+            user=self.admin,
+            defaults={
+                "organization": self.organization,
+                "facility": facility,
+                "role": FacultyProfile.FacultyRole.ADMIN,
+            },
+        )
+        self.client.force_login(self.admin)
+        return {row["label"]: row for row in run_benchmarks(self.client, facility)}
+
+    def test_views_stay_within_declared_budgets(self):
+        for label, row in self._run(self.large).items():
+            with self.subTest(view=label):
+                self.assertEqual(row["status"], 200)
+                self.assertIsNotNone(row["budget"])
+                self.assertFalse(
+                    row["over_budget"],
+                    f"{label} ran {row['queries']} queries (budget {row['budget']})",
+                )
+                self.assertFalse(
+                    row["loose_budget"],
+                    f"{label} ran {row['queries']} queries; lower its budget of "
+                    f"{row['budget']} to the measured count",
+                )
+
+    def test_query_counts_do_not_grow_with_facility_size(self):
+        small = self._run(self.small)
+        large = self._run(self.large)
+        for label in small:
+            with self.subTest(view=label):
+                self.assertEqual(small[label]["status"], 200)
+                self.assertEqual(large[label]["status"], 200)
+                self.assertEqual(small[label]["queries"], large[label]["queries"])
+
+
+class ScopedChoiceFieldTests(BaseDomainTestCase):
+    def setUp(self):
+        super().setUp()
+        self.department = Department.objects.create(
+            name="Nature",
+            abbreviation="NAT",
+            facility=self.facility,
+        )
+        other_facility = Facility.objects.create(
+            name="Elsewhere",
+            organization=self.organization,
+        )
+        self.other_department = Department.objects.create(
+            name="Shooting Sports",
+            abbreviation="SS",
+            facility=other_facility,
+        )
+
+    def test_department_choices_are_scoped_and_light(self):
+        form = AssignDepartmentForm(facility=self.facility)
+        queryset = form.fields["department"].queryset
+
+        self.assertEqual(list(queryset), [self.department])
+        self.assertEqual(
+            queryset.query.deferred_loading, ({"id", "name"}, False)
+        )
+
+    def test_autocomplete_returns_matching_ids_and_names(self):
+        with mute_profile_signals():
+            admin = User.objects.create_superuser(
+                username="choices.admin",
+                email="choices.admin@example.com",
+                password="pass12345",
+            )
+        self.client.force_login(admin)
+        response = self.client.get(
+            reverse(
+                "facilities:autocomplete",
+                kwargs={"facility_slug": self.facility.slug, "kind": "department"},
+            ),
+            {"q": "nat"},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json()["results"],
+            [{"id": self.department.id, "name": "Nature"}],
+        )
+
+    def test_autocomplete_404s_without_scope_facility(self):
+        view = ChoiceAutocompleteView()
+        request = RequestFactory().get("/autocomplete/")
+        with patch.object(ChoiceAutocompleteView, "get_scope_facility", return_value=None):
+            with self.assertRaises(Http404):
+                view.get(request, kind="department")
+
+    def test_large_choice_lists_render_only_the_selected_option(self):
+        form = AssignDepartmentForm(facility=self.facility)
+        field = form.fields["department"]
+        scope_choice_field(field, Department.objects.filter(facility=self.facility), "/ac/")
+        self.assertNotIsInstance(field.widget, AutocompleteSelect)
+
+        with patch("facility.forms.choices.CHOICE_AUTOCOMPLETE_THRESHOLD", 0):
+            scope_choice_field(field, Department.objects.filter(facility=self.facility), "/ac/")
+        self.assertIsInstance(field.widget, AutocompleteSelect)
+
+        html = field.widget.render("department", self.department.pk)
+        self.assertIn('data-autocomplete-url="/ac/"', html)
+        self.assertIn(f'<option value="{self.department.pk}" selected>Nature</option>', html)
+        self.assertEqual(field.widget.render("department", None).count("<option"), 1)
+
+
+class ReportVisibilityTests(BaseDomainTestCase):
+    def test_visibility_uses_exists_without_distinct(self):
+        with mute_profile_signals():
+            user = User.objects.create_user(username="reports.viewer", password="pass12345")
+        sql = str(reports_visible_to(user).query).upper()
+        self.assertIn("EXISTS", sql)
+        self.assertNotIn("DISTINCT", sql)
+
+    def test_visibility_is_a_single_query(self):
+        with mute_profile_signals():
+            user = User.objects.create_user(username="reports.counter", password="pass12345")
+        with self.assertNumQueries(1):
+            list(reports_visible_to(user))
+
+    def test_visibility_returns_own_and_shared_reports_once(self):
+        with mute_profile_signals():
+            viewer = User.objects.create_user(username="reports.owner", password="pass12345")
+            other = User.objects.create_user(username="reports.other", password="pass12345")
+        template_model = GeneratedReport._meta.get_field("template").related_model
+        private = template_model.objects.create(name="Private Report")
+        shared = template_model.objects.create(name="Shared Report")
+        shared.available_to.add(viewer)
+
+        own = GeneratedReport.objects.create(template=private, generated_by=viewer)
+        shared_with_viewer = GeneratedReport.objects.create(template=shared, generated_by=other)
+        own_and_shared = GeneratedReport.objects.create(template=shared, generated_by=viewer)
+        GeneratedReport.objects.create(template=private, generated_by=other)
+
+        pks = list(reports_visible_to(viewer).values_list("pk", flat=True))
+        self.assertEqual(
+            sorted(pks), sorted([own.pk, shared_with_viewer.pk, own_and_shared.pk])
+        )
+
+
+class LookupIndexTests(BaseDomainTestCase):
+    def _explain(self, queryset):
+        if connection.vendor == "postgresql":
+            # Tiny test tables always favour a sequential scan.
+            with connection.cursor() as cursor:
+                cursor.execute("SET LOCAL enable_seqscan = off")
+        return queryset.explain()
+
+    def test_quarters_name_lookup_uses_partial_index(self):
+        plan = self._explain(live_quarters_named(self.facility, "Cabin"))
+        self.assertIn("quarters_fac_name_live_idx", plan)
+
+    def test_quarters_type_name_lookup_uses_partial_index(self):
+        plan = self._explain(live_quarters_types_named(self.organization, "Cabin"))
+        self.assertIn("quarterstype_org_name_live_idx", plan)
+
+    def test_facility_name_lookup_uses_partial_index(self):
+        plan = self._explain(live_facilities_named(self.organization, "Camp"))
+        self.assertIn("facility_org_name_live_idx", plan)
+
+    def test_department_lookup_uses_partial_index(self):
+        plan = self._explain(departments_for_facility(self.facility).filter(name="Program"))
+        self.assertIn("department_fac_name_live_idx", plan)
+
+    def test_name_checks_ignore_soft_deleted_rows(self):
+        quarters_type = QuartersType.objects.create(
+            name="Retired Type", organization=self.organization
+        )
+        quarters = Quarters.objects.create(
+            name="Retired Cabin", capacity=2, type=quarters_type, facility=self.facility
+        )
+        self.assertTrue(live_quarters_named(self.facility, "Retired Cabin").exists())
+        Quarters.objects.filter(pk=quarters.pk).update(is_deleted=True)
+        self.assertFalse(live_quarters_named(self.facility, "Retired Cabin").exists())
+
+    def test_faculty_role_lookup_uses_composite_index(self):
+        plan = self._explain(
+            FacultyProfile.objects.filter(
+                facility=self.facility, role=FacultyProfile.FacultyRole.ADMIN
+            )
+        )
+        self.assertIn("faculty_facility_role_idx", plan)
+
+
+class KeysetPaginatorTests(BaseDomainTestCase):
+    def setUp(self):
+        super().setUp()
+        for name in ("Archery", "Boating", "Camping", "Dining", "Ecology"):
+            Department.objects.create(name=name, abbreviation=name[:3], facility=self.facility)
+        self.queryset = Department.objects.filter(facility=self.facility)
+
+    def _names(self, page):
+        return [department.name for department in page.object_list]
+
+    def test_walks_forward_and_back_with_cursors(self):
+        first = KeysetPaginator(self.queryset, 2).page()
+        self.assertEqual(self._names(first), ["Archery", "Boating"])
+        self.assertFalse(first.has_previous())
+
+        second = KeysetPaginator(self.queryset, 2, cursor=first.next_cursor).page()
+        self.assertEqual(self._names(second), ["Camping", "Dining"])
+
+        last = KeysetPaginator(self.queryset, 2, cursor=second.next_cursor).page()
+        self.assertEqual(self._names(last), ["Ecology"])
+        self.assertFalse(last.has_next())
+
+        back = KeysetPaginator(self.queryset, 2, cursor=last.previous_cursor).page()
+        self.assertEqual(self._names(back), ["Camping", "Dining"])
+
+    def test_count_is_skipped_unless_requested(self):
+        paginator = KeysetPaginator(self.queryset, 2)
+        with self.assertNumQueries(1):
+            paginator.page()
+        self.assertIsNone(paginator.count)
+        self.assertEqual(KeysetPaginator(self.queryset, 2, count_mode="exact").count, 5)
+
+    def test_garbage_cursor_falls_back_to_first_page(self):
+        page = KeysetPaginator(self.queryset, 2, cursor="not-a-cursor").page()
+        self.assertEqual(self._names(page), ["Archery", "Boating"])
+
+    def test_walks_descending_ordering(self):
+        ordering = ("-name", "pk")
+        first = KeysetPaginator(self.queryset, 2, ordering=ordering).page()
+        self.assertEqual(self._names(first), ["Ecology", "Dining"])
+
+        second = KeysetPaginator(
+            self.queryset, 2, cursor=first.next_cursor, ordering=ordering
+        ).page()
+        self.assertEqual(self._names(second), ["Camping", "Boating"])
+
+        back = KeysetPaginator(
+            self.queryset, 2, cursor=second.previous_cursor, ordering=ordering
+        ).page()
+        self.assertEqual(self._names(back), ["Ecology", "Dining"])
+
+    def test_cursor_from_other_ordering_restarts(self):
+        first = KeysetPaginator(self.queryset, 2).page()
+        page = KeysetPaginator(
+            self.queryset, 2, cursor=first.next_cursor, ordering=("-name", "pk")
+        ).page()
+        self.assertEqual(self._names(page), ["Ecology", "Dining"])
+
+    def test_index_views_only_offer_keyset_sortable_columns(self):
+        with mute_profile_signals():
+            admin = User.objects.create_superuser(
+                username="keyset.admin", email="keyset.admin@example.com", password="pass12345"
+            )
+        self.client.force_login(admin)
+        response = self.client.get(
+            reverse("facilities:quarters:index", kwargs={"facility_slug": self.facility.slug}),
+            {"sort": "-capacity"},
+        )
+        self.assertEqual(response.status_code, 200)
+        table = response.context["table"]
+        self.assertEqual(table.paginator.ordering, ("-capacity", "pk"))
+        orderable = {column.name for column in table.columns.iterall() if column.orderable}
+        self.assertEqual(orderable, {"name", "capacity", "reserved_beds"})
+
+    def test_unlisted_sort_falls_back_to_default_ordering(self):
+        view = QuartersIndexView()
+        view.request = RequestFactory().get("/", {"sort": "facility"})
+        table = SimpleNamespace(prefixed_order_by_field="sort")
+        self.assertEqual(view.get_keyset_ordering(table), QuartersIndexView.keyset_ordering)
+
+
+class FacilityListCountsTests(BaseDomainTestCase):
+    def setUp(self):
+        super().setUp()
+        quarters_type = QuartersType.objects.create(
+            name="List Cabin", organization=self.organization
+        )
+        for index, capacity in enumerate((4, 6)):
+            Quarters.objects.create(
+                name=f"List Cabin {index}",
+                facility=self.facility,
+                type=quarters_type,
+                capacity=capacity,
+            )
+        for name in ("Archery", "Boating", "Camping"):
+            Department.objects.create(name=name, abbreviation=name[:3], facility=self.facility)
+        self.empty = Facility.objects.create(name="Empty Camp", organization=self.organization)
+
+    def test_counts_do_not_multiply_across_relations(self):
+        expected = {
+            "department_count": Department.objects.filter(facility=self.facility).count(),
+            "quarters_count": Quarters.objects.filter(facility=self.facility).count(),
+            "bed_count": sum(
+                Quarters.objects.filter(facility=self.facility).values_list(
+                    "capacity", flat=True
+                )
+            ),
+            "faculty_count": FacultyProfile.objects.filter(facility=self.facility).count(),
+        }
+        with self.assertNumQueries(1):
+            rows = {
+                facility.pk: facility
+                for facility in facility_list_queryset(counts=FACILITY_LIST_COUNTS)
+            }
+        for field, value in expected.items():
+            self.assertEqual(getattr(rows[self.facility.pk], field), value, field)
+            self.assertEqual(getattr(rows[self.empty.pk], field), 0, field)
+
+    def test_counts_skip_soft_deleted_rows(self):
+        Department.objects.filter(facility=self.facility, name="Archery").update(is_deleted=True)
+        Quarters.objects.filter(facility=self.facility, capacity=4).update(is_deleted=True)
+        row = facility_list_queryset(counts=FACILITY_LIST_COUNTS).get(pk=self.facility.pk)
+        reconcile_facility_stats([self.facility.pk])
+        stats = facility_stats_for(self.facility)
+
+        self.assertEqual(row.department_count, stats.department_count)
+        self.assertEqual(row.quarters_count, stats.quarters_count)
+        self.assertEqual(row.bed_count, stats.total_beds)
+        self.assertEqual(row.faculty_count, stats.faculty_count)
+
+    def test_pages_sorted_by_count(self):
+        queryset = facility_list_queryset(counts=FACILITY_LIST_COUNTS).filter(
+            pk__in=[self.facility.pk, self.empty.pk]
+        )
+        ordering = ("-quarters_count", "pk")
+        first = KeysetPaginator(queryset, 1, ordering=ordering).page()
+        self.assertEqual([f.pk for f in first.object_list], [self.facility.pk])
+        second = KeysetPaginator(
+            queryset, 1, cursor=first.next_cursor, ordering=ordering
+        ).page()
+        self.assertEqual([f.pk for f in second.object_list], [self.empty.pk])
+
+
+class TableExportTests(BaseDomainTestCase):
+    def setUp(self):
+        super().setUp()
+        Department.objects.create(
+            name="Handicraft",
+            abbreviation="HC",
+            facility=self.facility,
+        )
+        with mute_profile_signals():
+            self.admin = User.objects.create_superuser(
+                username="export.admin",
+                email="export.admin@example.com",
+                password="pass12345",
+            )
+
+    def test_csv_export_streams_table_rows(self):
+        self.client.force_login(self.admin)
+        response = self.client.get(
+            reverse(
+                "facilities:export",
+                kwargs={
+                    "facility_slug": self.facility.slug,
+                    "table_name": "departments",
+                    "export_format": "csv",
+                },
+            )
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        self.assertIn("Abbreviation", lines[0])
+        self.assertEqual(len(lines), 2)
+        self.assertIn("Handicraft", lines[1])
+
+    def test_unknown_table_is_not_found(self):
+        self.client.force_login(self.admin)
+        response = self.client.get(
+            reverse(
+                "facilities:export",
+                kwargs={
+                    "facility_slug": self.facility.slug,
+                    "table_name": "secrets",
+                    "export_format": "csv",
+                },
+            )
+        )
+        self.assertEqual(response.status_code, 404)
+
+    def test_export_404s_without_scope_facility(self):
+        view = ExportView()
+        request = RequestFactory().get("/export/")
+        with patch.object(ExportView, "get_scope_facility", return_value=None):
+            with self.assertRaises(Http404):
+                view.get(request, table_name="departments", export_format="csv")
+
+
+class RosterImportTests(BaseDomainTestCase):
+    def setUp(self):
+        super().setUp()
+        Department.objects.create(
+            name="Waterfront",
+            abbreviation="WF",
+            facility=self.facility,
+        )
+
+    def _rows(self, text):
+        return read_roster_csv(text.encode())
+
+    def test_import_view_404s_without_scope_facility(self):
+        view = RosterImportView()
+        view.request = RequestFactory().post("/import/")
+        view.kwargs = {}
+        form = Mock()
+        with patch.object(RosterImportView, "get_scope_facility", return_value=None):
+            with self.assertRaises(Http404):
+                view.form_valid(form)
+        form.save.assert_not_called()
+
+    def test_import_creates_users_and_profiles_in_batches(self):
+        csv_text = (
+            "username,email,first_name,last_name,role,department\n"
+            "ann.lee,ann@example.com,Ann,Lee,Department Admin,WF\n"
+            "bo.kim,bo@example.com,Bo,Kim,,\n"
+            "cy.ray,cy@example.com,Ann,Lee,staff,Waterfront\n"
+        )
+        result = import_roster(self.facility, self._rows(csv_text), batch_size=2)
+
+        self.assertEqual(result["created"], 3)
+        self.assertEqual(result["skipped"], [])
+        ann = FacultyProfile.objects.get(user__username="ann.lee")
+        self.assertEqual(ann.role, FacultyProfile.FacultyRole.DEPARTMENT_ADMIN)
+        self.assertEqual(ann.department.abbreviation, "WF")
+        cy = FacultyProfile.objects.get(user__username="cy.ray")
+        self.assertNotEqual(ann.slug, cy.slug)
+
+    def test_import_skips_duplicates_and_unknown_departments(self):
+        import_roster(
+            self.facility,
+            self._rows("username,first_name,last_name\ndee.fox,Dee,Fox\n"),
+        )
+        result = import_roster(
+            self.facility,
+            self._rows(
+                "username,first_name,last_name,department\n"
+                "dee.fox,Dee,Fox,\n"
+                "eli.ng,Eli,Ng,Nowhere\n"
+                "fay.oh,Fay,Oh,\n"
+                "fay.oh,Fay,Oh,\n"
+            ),
+        )
+
+        self.assertEqual(result["created"], 1)
+        self.assertEqual([line for line, _reason in result["skipped"]], [2, 3, 5])
+
+    def test_unknown_roles_are_row_errors(self):
+        result = import_roster(
+            self.facility,
+            self._rows("username,role\ngus.ray,Captain\nhal.ito,admin\n"),
+        )
+
+        self.assertEqual(result["created"], 1)
+        self.assertEqual(result["skipped"], [(2, "unknown role Captain")])
+
+    def test_usernames_match_existing_users_case_insensitively(self):
+        with mute_profile_signals():
+            user = User.objects.create_user(username="Ida.Moss", password="pass12345")
+        result = import_roster(self.facility, self._rows("username\nida.moss\n"))
+
+        self.assertEqual(result["created"], 1)
+        self.assertEqual(User.objects.filter(username__iexact="ida.moss").count(), 1)
+        self.assertTrue(FacultyProfile.objects.filter(user=user).exists())
+
+    def test_batch_side_effects_are_applied_in_bulk(self):
+        before = facility_stats_for(self.facility).faculty_count
+        receiver = Mock()
+        post_save.connect(receiver, sender=FacultyProfile, dispatch_uid="roster-test")
+        try:
+            import_roster(
+                self.facility, self._rows("username,last_name\njo.ash,Ash\nkay.orr,Orr\n")
+            )
+        finally:
+            post_save.disconnect(sender=FacultyProfile, dispatch_uid="roster-test")
+
+        receiver.assert_not_called()
+        self.assertEqual(facility_stats_for(self.facility).faculty_count, before + 2)
+        roster_names = FacultyRosterEntry.objects.filter(
+            facility_id=self.facility.pk
+        ).values_list("last_name", flat=True)
+        self.assertTrue({"Ash", "Orr"} <= set(roster_names))
+
+
+class FacultyEnrollmentAccessorTests(BaseDomainTestCase):
+    def setUp(self):
+        super().setUp()
+        self.profiles = []
+        for index in range(3):
+            with mute_profile_signals():
+                user = User.objects.create_user(
+                    username=f"faculty.accessor{index}",
+                    password="pass12345",
+                    user_type=User.UserType.FACULTY,
+                )
+            profile = FacultyProfile.objects.create(
+                user=user,
+                organization=self.organization,
+                facility=self.facility,
+            )
+            FacultyEnrollmentRecord.objects.create(
+                name=f"Accessor {index}",
+                faculty=profile,
+                facility_enrollment=self.facility_enrollment,
+            )
+            self.profiles.append(profile)
+
+    def test_accessor_queries_once_per_instance(self):
+        profile = FacultyProfile.objects.get(pk=self.profiles[0].pk)
+        with self.assertNumQueries(1):
+            self.assertEqual(len(profile.enrollment_list), 1)
+            self.assertEqual(len(profile.enrollment_list), 1)
+
+    def test_enrollments_stays_a_queryset(self):
+        profile = FacultyProfile.objects.get(pk=self.profiles[0].pk)
+        enrollments = profile.enrollments
+        self.assertIsInstance(enrollments, QuerySet)
+        self.assertEqual(enrollments.filter(name="Accessor 0").count(), 1)
+
+    def test_accessor_uses_queryset_prefetch(self):
+        with self.assertNumQueries(2):
+            profiles = list(
+                FacultyProfileQuerySet(FacultyProfile)
+                .filter(pk__in=[p.pk for p in self.profiles])
+                .with_enrollments()
+            )
+        with self.assertNumQueries(0):
+            self.assertEqual([len(p.enrollment_list) for p in profiles], [1, 1, 1])
+
+    def test_prime_enrollments_loads_every_profile_in_one_query(self):
+        profiles = list(FacultyProfile.objects.filter(pk__in=[p.pk for p in self.profiles]))
+        with self.assertNumQueries(1):
+            prime_enrollments(profiles)
+        with self.assertNumQueries(0):
+            names = sorted(e.name for p in profiles for e in p.enrollment_list)
+        self.assertEqual(names, ["Accessor 0", "Accessor 1", "Accessor 2"])
+
+        with self.assertNumQueries(0):
+            prime_enrollments(profiles)
+
+
+class FacultyProfileQuerySetTests(BaseDomainTestCase):
+    def setUp(self):
+        super().setUp()
+        self.department = Department.objects.create(
+            name="Waterfront", abbreviation="WF", facility=self.facility
+        )
+        self.week = Week.objects.create(
+            name="Toolkit Week",
+            start=self.facility_enrollment.start,
+            end=self.facility_enrollment.end,
+            facility_enrollment=self.facility_enrollment,
+        )
+        self.profiles = {}
+        for role in FacultyProfile.FacultyRole:
+            with mute_profile_signals():
+                user = User.objects.create_user(
+                    username=f"toolkit.{role.value.lower()}",
+                    password="pass12345",
+                    first_name=role.label,
+                    last_name="Toolkit",
+                    user_type=User.UserType.FACULTY,
+                )
+            self.profiles[role] = FacultyProfile.objects.create(
+                user=user,
+                organization=self.organization,
+                facility=self.facility,
+                department=self.department,
+                role=role,
+            )
+        FacultyEnrollmentRecord.objects.create(
+            name="Toolkit enrollment",
+            faculty=self.profiles[FacultyProfile.FacultyRole.STAFF],
+            facility_enrollment=self.facility_enrollment,
+        )
+
+    def test_with_department_joins_department(self):
+        profiles = list(FacultyProfile.objects.for_facility(self.facility).with_department())
+        with self.assertNumQueries(0):
+            self.assertEqual({p.department.name for p in profiles}, {"Waterfront"})
+
+    def test_with_enrollments_can_filter_instead_of_prefetch(self):
+        enrolled = FacultyProfile.objects.with_enrollments(
+            self.facility_enrollment, prefetch=False
+        )
+        self.assertEqual(list(enrolled), [self.profiles[FacultyProfile.FacultyRole.STAFF]])
+        self.assertEqual(
+            list(FacultyProfile.objects.for_facility_enrollment(self.facility_enrollment)),
+            list(enrolled),
+        )
+
+    def test_with_enrollments_scopes_to_week(self):
+        with self.assertNumQueries(2):
+            profiles = list(
+                FacultyProfile.objects.for_facility(self.facility).with_enrollments(
+                    week=self.week
+                )
+            )
+        with self.assertNumQueries(0):
+            self.assertEqual(sum(len(p.enrollment_list) for p in profiles), 1)
+
+    def test_roster_rows_are_named_tuples(self):
+        rows = list(FacultyProfile.objects.for_facility(self.facility).roster_rows())
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(rows[0].department__name, "Waterfront")
+        self.assertEqual(rows[0].user__last_name, "Toolkit")
+
+
+class FacilityStatsTests(BaseDomainTestCase):
+    def setUp(self):
+        super().setUp()
+        self.quarters_type = QuartersType.objects.create(
+            name="Stats Cabin", organization=self.organization
+        )
+        self.cabin = Quarters.objects.create(
+            name="Stats Cabin 1",
+            facility=self.facility,
+            type=self.quarters_type,
+            capacity=6,
+        )
+        with mute_profile_signals():
+            self.user = User.objects.create_user(
+                username="facility.stats",
+                password="pass12345",
+                user_type=User.UserType.FACULTY,
+            )
+        self.profile = FacultyProfile.objects.create(
+            user=self.user,
+            organization=self.organization,
+            facility=self.facility,
+        )
+        self.stats = facility_stats_for(self.facility)
+
+    def assertStats(self, **expected):
+        self.stats.refresh_from_db()
+        for field, value in expected.items():
+            self.assertEqual(getattr(self.stats, field), value, field)
+
+    def test_row_matches_sources(self):
+        self.assertStats(
+            faculty_count=1,
+            staff_count=1,
+            admin_count=0,
+            quarters_count=1,
+            total_beds=6,
+            enrollment_count=enrollments_for_facility(self.facility).count(),
+        )
+        self.assertEqual(reconcile_facility_stats([self.facility.pk]), [])
+
+    def test_saves_apply_deltas(self):
+        department = Department.objects.create(
+            name="Stats Dept", abbreviation="SD", facility=self.facility
+        )
+        self.profile.role = FacultyProfile.FacultyRole.ADMIN
+        self.profile.save()
+        self.cabin.capacity = 8
+        self.cabin.save()
+        self.assertStats(
+            department_count=1, staff_count=0, admin_count=1, faculty_count=1, total_beds=8
+        )
+
+        department.is_deleted = True
+        department.save()
+        self.assertStats(department_count=0)
+
+    def test_reconcile_repairs_drift(self):
+        Department.objects.bulk_create(
+            [Department(name="Bulk", abbreviation="BLK", slug="bulk", facility=self.facility)]
+        )
+        self.assertStats(department_count=0)
+
+        self.assertIn(self.facility.pk, reconcile_facility_stats())
+        self.assertStats(department_count=1)
+
+    def test_reconcile_command(self):
+        out = StringIO()
+        call_command("reconcile_facility_stats", facility_slug=self.facility.slug, stdout=out)
+        self.assertIn("0 row(s) rewritten", out.getvalue())
+
+    def test_metrics_widget_is_empty_without_a_stats_row(self):
+        FacilityStats.objects.filter(facility=self.facility).delete()
+        view = FacilityDashboardView()
+        with patch.object(FacilityDashboardView, "get_scope_facility", return_value=self.facility):
+            self.assertIsNone(view.get_facility_metrics_widget(None))
+            self.assertFalse(FacilityStats.objects.filter(facility=self.facility).exists())
+
+            reconcile_facility_stats([self.facility.pk])
+            widget = view.get_facility_metrics_widget(None)
+        self.assertEqual(widget["metrics"], facility_stats_for(self.facility).as_metrics())
+
+    def test_widgets_share_one_scope_facility_lookup(self):
+        view = FacilityDashboardView()
+        view.request = RequestFactory().get("/dashboard/")
+        view.request.user = SimpleNamespace(pk=1)
+        with patch(
+            "core.mixins.views.FacilityScopedMixin.get_scope_facility",
+            return_value=self.facility,
+        ) as scope, patch("facility.views.facility.get_facility_overview_text"):
+            view.prepare_widgets()
+            view.get_facility_metrics_widget(None)
+            view.get_facility_overview_widget(None)
+        self.assertEqual(scope.call_count, 1)
+
+
+class DashboardWidgetCacheTests(BaseDomainTestCase):
+    def setUp(self):
+        super().setUp()
+        with mute_profile_signals():
+            self.user = User.objects.create_user(
+                username="faculty.dashboard.cache",
+                password="pass12345",
+                user_type=User.UserType.FACULTY,
+            )
+        self.profile = FacultyProfile.objects.create(
+            user=self.user,
+            organization=self.organization,
+            facility=self.facility,
+        )
+        self.view = FacultyDashboardView()
+        self.view.request = RequestFactory().get("/dashboard/")
+        self.view.request.user = self.user
+
+    def test_widget_data_is_cached_until_facility_data_changes(self):
+        with patch(
+            "facility.views.faculty.get_faculty_resources", return_value=["Handbook"]
+        ) as resources:
+            self.assertEqual(
+                self.view.get_faculty_resources_widget(None), {"items": ["Handbook"]}
+            )
+            self.view.get_faculty_resources_widget(None)
+            self.assertEqual(resources.call_count, 1)
+
+            self.profile.save()
+            self.view.get_faculty_resources_widget(None)
+            self.assertEqual(resources.call_count, 2)
+
+    def test_table_widgets_cache_rendered_html(self):
+        widget = self.view.get_faculty_reports_widget(None)
+        self.assertIsInstance(widget["content"], str)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.view.get_faculty_reports_widget(None), widget)
+
+    def test_evicted_version_never_revives_stale_widgets(self):
+        with patch(
+            "facility.views.faculty.get_faculty_resources", return_value=["Handbook"]
+        ) as resources:
+            self.view.get_faculty_resources_widget(None)
+            cache.delete(f"facility:dashboard:version:facility:{self.facility.pk}")
+            self.profile.save()
+            self.view.get_faculty_resources_widget(None)
+            self.assertEqual(resources.call_count, 2)
+
+    def test_user_scoped_widgets_are_not_shared(self):
+        with patch(
+            "facility.views.faculty.get_faculty_schedule", return_value=[]
+        ) as schedule:
+            self.view.get_faculty_schedule_widget(None)
+            with mute_profile_signals():
+                other = User.objects.create_user(
+                    username="faculty.dashboard.other",
+                    password="pass12345",
+                    user_type=User.UserType.FACULTY,
+                )
+            FacultyProfile.objects.create(
+                user=other,
+                organization=self.organization,
+                facility=self.facility,
+                role=self.profile.role,
+            )
+            self.view.request.user = other
+            self.view.get_faculty_schedule_widget(None)
+            self.assertEqual(schedule.call_count, 2)
+
+
+class ParallelWidgetsTests(SimpleTestCase):
+    class Dashboard(ParallelWidgetsMixin):
+        parallel_widgets = ("first", "second", "slow", "broken")
+        widget_timeout = 1
+
+        def get_first_widget(self, _definition):
+            # Both getters must reach the barrier together, which only happens when
+            # they run at the same time; otherwise it breaks and they fail.
+            self.barrier.wait()
+            return {"name": "first"}
+
+        def get_second_widget(self, _definition):
+            self.barrier.wait()
+            return {"name": "second"}
+
+        def get_slow_widget(self, _definition):
+            self.release.wait()
+            return {"name": "slow"}
+
+        def get_broken_widget(self, _definition):
+            raise RuntimeError("boom")
+
+    def setUp(self):
+        self.view = self.Dashboard()
+        self.view.request = RequestFactory().get("/dashboard/")
+        self.view.request.user = SimpleNamespace(pk=1)
+        self.view.barrier = Barrier(2, timeout=self.view.widget_timeout)
+        self.view.release = Event()
+        self.addCleanup(self.view.release.set)
+
+    def test_widgets_run_concurrently(self):
+        with self.assertLogs("facility.views.mixins", level="WARNING"):
+            self.view.prefetch_widgets()
+        self.assertEqual(self.view.get_first_widget(None), {"name": "first"})
+        self.assertEqual(self.view.get_second_widget(None), {"name": "second"})
+
+    def test_slow_and_failing_widgets_degrade_to_placeholder(self):
+        with self.assertLogs("facility.views.mixins", level="WARNING"):
+            self.view.prefetch_widgets()
+        self.assertEqual(self.view.get_slow_widget(None), {"unavailable": True})
+        self.assertEqual(self.view.get_broken_widget(None), {"unavailable": True})
+
+
+class QuartersFormTests(BaseDomainTestCase):
+    def test_duplicate_name_within_facility_is_invalid(self):
+        quarters_type = QuartersType.objects.create(
+            name="QA Type",
+            organization=self.organization,
+        )
+        Quarters.objects.create(
+            name="Cabin Alpha",
+            facility=self.facility,
+            type=quarters_type,
+            capacity=10,
+        )
+        form = QuartersForm(
+            data={
+                "name": "Cabin Alpha",
+                "facility": self.facility.id,
+                "type": quarters_type.id,
+                "capacity": 8,
+                "description": "",
+            }
+        )
+        self.assertFalse(form.is_valid())
+
+
+class QuartersOccupancyTests(BaseDomainTestCase):
+    def setUp(self):
+        super().setUp()
+        with mute_profile_signals():
+            user = User.objects.create_user(
+                username="faculty.occupant",
+                password="pass12345",
+                user_type=User.UserType.FACULTY,
+            )
+        self.profile = FacultyProfile.objects.create(
+            user=user,
+            organization=self.organization,
+            facility=self.facility,
+        )
+        quarters_type = QuartersType.objects.create(
+            name="Occupancy Type",
+            organization=self.organization,
+        )
+        self.cabin = Quarters.objects.create(
+            name="Cabin Foxtrot",
+            facility=self.facility,
+            type=quarters_type,
+            capacity=3,
+        )
+        self.other_cabin = Quarters.objects.create(
+            name="Cabin Golf",
+            facility=self.facility,
+            type=quarters_type,
+            capacity=3,
+        )
+
+        self.week = Week.objects.create(
+            name="Occupancy Week",
+            start=self.facility_enrollment.start,
+            end=self.facility_enrollment.end,
+            facility_enrollment=self.facility_enrollment,
+        )
+
+    def _occupancy(self, quarters, week=None):
+        row = QuartersOccupancy.objects.filter(
+            quarters=quarters, week=week or self.week
+        ).first()
+        return row.occupancy if row else 0
+
+    def test_available_beds_needs_the_reserved_beds_annotation(self):
+        self.assertIsNone(Quarters.objects.get(pk=self.cabin.pk).available_beds)
+        self.cabin.reserved_beds = 1
+        self.assertEqual(self.cabin.available_beds, 2)
+
+    def test_enrollment_lifecycle_updates_occupancy(self):
+        enrollment = FacultyEnrollmentRecord.objects.create(
+            name="Occupant",
+            faculty=self.profile,
+            facility_enrollment=self.facility_enrollment,
+            quarters=self.cabin,
+        )
+        self.assertEqual(self._occupancy(self.cabin), 1)
+
+        enrollment.quarters = self.other_cabin
+        enrollment.save()
+        self.assertEqual(self._occupancy(self.cabin), 0)
+        self.assertEqual(self._occupancy(self.other_cabin), 1)
+
+        enrollment.delete()
+        self.assertEqual(self._occupancy(self.other_cabin), 0)
+
+    def test_reservations_only_fill_their_own_weeks(self):
+        session = clone_session(self.facility_enrollment)
+        other_week = Week.objects.create(
+            name="Second Week",
+            start=session.start,
+            end=session.end,
+            facility_enrollment=session,
+        )
+        for name, facility_enrollment in (
+            ("First week", self.facility_enrollment),
+            ("Second week", session),
+        ):
+            FacultyEnrollmentRecord.objects.create(
+                name=name,
+                faculty=self.profile,
+                facility_enrollment=facility_enrollment,
+                quarters=self.cabin,
+            )
+
+        self.assertEqual(self._occupancy(self.cabin, self.week), 1)
+        self.assertEqual(self._occupancy(self.cabin, other_week), 1)
+        self.assertEqual(
+            available_quarters(self.facility, self.week, min_beds=2).get(
+                pk=self.cabin.pk
+            ).free_beds,
+            2,
+        )
+        self.assertEqual(occupancy_drift(), [])
+
+    def test_new_week_counts_existing_session_reservations(self):
+        FacultyEnrollmentRecord.objects.create(
+            name="Occupant",
+            faculty=self.profile,
+            facility_enrollment=self.facility_enrollment,
+            quarters=self.cabin,
+        )
+        later = Week.objects.create(
+            name="Later Week",
+            start=self.facility_enrollment.start,
+            end=self.facility_enrollment.end,
+            facility_enrollment=self.facility_enrollment,
+        )
+        self.assertEqual(self._occupancy(self.cabin, later), 1)
+
+    def test_rebuild_command_reports_and_fixes_drift(self):
+        FacultyEnrollmentRecord.objects.create(
+            name="Occupant",
+            faculty=self.profile,
+            facility_enrollment=self.facility_enrollment,
+            quarters=self.cabin,
+        )
+        QuartersOccupancy.objects.filter(quarters=self.cabin, week=self.week).update(
+            occupancy=5
+        )
+
+        out = StringIO()
+        call_command("rebuild_quarters_occupancy", "--dry-run", stdout=out)
+        self.assertIn("stored 5, actual 1", out.getvalue())
+        self.assertEqual(self._occupancy(self.cabin), 5)
+
+        call_command("rebuild_quarters_occupancy", stdout=StringIO())
+        self.assertEqual(self._occupancy(self.cabin), 1)
+
+
+class QuartersAvailabilityTests(BaseDomainTestCase):
+    def setUp(self):
+        super().setUp()
+        with mute_profile_signals():
+            user = User.objects.create_user(
+                username="faculty.availability",
+                password="pass12345",
+                user_type=User.UserType.FACULTY,
+            )
+        profile = FacultyProfile.objects.create(
+            user=user,
+            organization=self.organization,
+            facility=self.facility,
+        )
+        self.quarters_type = QuartersType.objects.create(
+            name="Availability Type",
+            organization=self.organization,
+        )
+        self.small = Quarters.objects.create(
+            name="Cabin Small",
+            facility=self.facility,
+            type=self.quarters_type,
+            capacity=2,
+        )
+        self.large = Quarters.objects.create(
+            name="Cabin Large",
+            facility=self.facility,
+            type=self.quarters_type,
+            capacity=6,
+        )
+        self.week = Week.objects.create(
+            name="Availability Week",
+            start=self.facility_enrollment.start,
+            end=self.facility_enrollment.end,
+            facility_enrollment=self.facility_enrollment,
+        )
+        FacultyEnrollmentRecord.objects.create(
+            name="Reserved",
+            faculty=profile,
+            facility_enrollment=self.facility_enrollment,
+            quarters=self.small,
+        )
+
+    def test_available_quarters_subtracts_reservations_in_one_query(self):
+        with self.assertNumQueries(1):
+            rows = list(available_quarters(self.facility, self.week, min_beds=2))
+
+        self.assertEqual(rows, [self.large])
+        self.assertEqual(rows[0].free_beds, 6)
+
+    def test_soft_deleted_quarters_are_not_offered(self):
+        Quarters.objects.filter(pk=self.large.pk).update(is_deleted=True)
+
+        self.assertEqual(list(available_quarters(self.facility, self.week, min_beds=2)), [])
+
+    def test_batch_plan_best_fits_parties(self):
+        plan = plan_quarters_for_requests(
+            self.facility,
+            [(self.week, 1), (self.week, 5), (self.week, 2)],
+        )
+
+        self.assertEqual(plan, [self.small, self.large, None])
+
+
+class AutoAssignQuartersTests(BaseDomainTestCase):
+    def setUp(self):
+        super().setUp()
+        self.week = Week.objects.create(
+            name="Housing Week",
+            start=self.facility_enrollment.start,
+            end=self.facility_enrollment.end,
+            facility_enrollment=self.facility_enrollment,
+        )
+        quarters_type = QuartersType.objects.create(
+            name="Housing Type",
+            organization=self.organization,
+        )
+        self.cabin = Quarters.objects.create(
+            name="Cabin Hotel",
+            facility=self.facility,
+            type=quarters_type,
+            capacity=2,
+        )
+        self.enrollments = []
+        for index in range(3):
+            with mute_profile_signals():
+                user = User.objects.create_user(
+                    username=f"faculty.housing{index}",
+                    password="pass12345",
+                    user_type=User.UserType.FACULTY,
+                )
+            profile = FacultyProfile.objects.create(
+                user=user,
+                organization=self.organization,
+                facility=self.facility,
+            )
+            self.enrollments.append(
+                FacultyEnrollmentRecord.objects.create(
+                    name=f"Unhoused {index}",
+                    faculty=profile,
+                    facility_enrollment=self.facility_enrollment,
+                    quarters=None,
+                )
+            )
+
+    def test_packs_up_to_capacity_and_reports_overflow(self):
+        assigned, unplaced = auto_assign_quarters(self.facility, self.week)
+
+        self.assertEqual(len(assigned), 2)
+        self.assertEqual(len(unplaced), 1)
+        self.assertEqual(
+            FacultyEnrollmentRecord.objects.filter(quarters=self.cabin).count(), 2
+        )
+        self.assertEqual(
+            QuartersOccupancy.objects.get(quarters=self.cabin, week=self.week).occupancy, 2
+        )
+
+    def test_session_reservations_fit_the_fullest_week(self):
+        later_week = Week.objects.create(
+            name="Later Housing Week",
+            start=self.facility_enrollment.start,
+            end=self.facility_enrollment.end,
+            facility_enrollment=self.facility_enrollment,
+        )
+        QuartersOccupancy.objects.create(quarters=self.cabin, week=later_week, occupancy=1)
+
+        assigned, unplaced = auto_assign_quarters(self.facility, self.week)
+
+        self.assertEqual(len(assigned), 1)
+        self.assertEqual(len(unplaced), 2)
+        self.assertEqual(
+            QuartersOccupancy.objects.get(quarters=self.cabin, week=later_week).occupancy, 2
+        )
+
+    def test_rejects_week_of_another_facility(self):
+        other_facility = Facility.objects.create(
+            name="Housing Other Facility", organization=self.organization
+        )
+        session = clone_session(self.facility_enrollment, facility=other_facility)
+        other_week = Week.objects.create(
+            name="Other Housing Week",
+            start=session.start,
+            end=session.end,
+            facility_enrollment=session,
+        )
+        with self.assertRaises(ValueError):
+            auto_assign_quarters(self.facility, other_week)
+        with self.assertRaises(ValueError):
+            auto_assign_quarters(None, self.week)
+        self.assertFalse(FacultyEnrollmentRecord.objects.filter(quarters=self.cabin).exists())
+
+    def test_assign_view_404s_without_scope_facility(self):
+        view = QuartersAssignView()
+        view.request = RequestFactory().get("/assign/")
+        view.kwargs = {}
+        with patch.object(QuartersAssignView, "get_scope_facility", return_value=None):
+            with self.assertRaises(Http404):
+                view.get_form_kwargs()
 
 
 class FacultyEnrollmentViewTests(BaseDomainTestCase):
@@ -9,18 +9,44 @@ from ..views.facility import (
     UpdateView,
     DeleteView,
     ManageView,
+    ChoiceAutocompleteView,
+    ExportView,
 )
+from ..views.faculty import RosterView
 
 app_name = "facilities"
 
 urlpatterns = [
     # Index
     path("", IndexView.as_view(), name="index"),
+    # Cross-facility faculty roster
+    path(
+        "organizations/<slug:organization_slug>/roster/",
+        RosterView.as_view(),
+        name="roster",
+    ),
     # Show
     path("<int:pk>", ShowView.as_view(), name="show"),
     path("<slug:facility_slug>", ShowView.as_view(), name="show"),
     # Manage
     path("<slug:facility_slug>/manage/", ManageView.as_view(), name="manage"),
+    path(
+        "<slug:facility_slug>/manage/<slug:table_name>/",
+        ManageView.as_view(),
+        name="manage_table",
+    ),
+    # Choice field autocomplete
+    path(
+        "<slug:facility_slug>/autocomplete/<str:kind>/",
+        ChoiceAutocompleteView.as_view(),
+        name="autocomplete",
+    ),
+    # Export
+    path(
+        "<slug:facility_slug>/export/<slug:table_name>/<str:export_format>/",
+        ExportView.as_view(),
+        name="export",
+    ),
     # Create
     path("new/", CreateView.as_view(), name="new"),
     # Update
@@ -10,6 +10,7 @@ from ..views.faculty import (
     DeleteView,
     ManageView,
     DashboardView,
+    RosterImportView,
 )
 
 app_name = "faculty"
@@ -21,8 +22,10 @@ urlpatterns = [
     path("dashboard/", DashboardView.as_view(), name="dashboard"),
     # Manage faculty list (restricted to current user's facility)
     path("manage/", ManageView.as_view(), name="manage"),
+    path("manage/<slug:table_name>/", ManageView.as_view(), name="manage_table"),
     # Create
     path("new/", CreateView.as_view(), name="new"),
+    path("import/", RosterImportView.as_view(), name="import"),
     # Show
     path("<int:pk>", ShowView.as_view(), name="show"),
     path("<slug:faculty_slug>/", ShowView.as_view(), name="show"),
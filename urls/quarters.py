@@ -10,6 +10,7 @@ from ..views.quarters import (
     CreateView,
     UpdateView,
     DeleteView,
+    AssignView,
 )
 
 app_name = "quarters"
@@ -30,6 +31,8 @@ urlpatterns = [
     # Create
     path("new/", CreateView.as_view(), name="new"),
     path("new", CreateView.as_view(), name="new_no_slash"),
+    # Bulk housing assignment
+    path("assign/", AssignView.as_view(), name="assign"),
     # Update
     path("<int:pk>/update/", UpdateView.as_view(), name="update"),
     path("<slug:quarters_slug>/update/", UpdateView.as_view(), name="update"),
@@ -13,21 +13,60 @@ from core.views.base import (
     BaseUpdateView,
     BaseSlugOrPkObjectMixin,
 )
+from core.mixins.views import FacilityScopedMixin
+
 from ..models.facility import Facility
 from ..models.department import Department
 from ..forms.department import DepartmentForm
-from ..tables.department import DepartmentTable
+from ..selectors import department_tree, departments_for_facility
+from ..services.facility_access import scope_to_visible_facilities
+from ..tables.department import DepartmentTable, DepartmentTreeTable
+from .mixins import KeysetPaginationMixin, SettingLabelMixin
 
 
-class IndexView(BaseTableListView):
+class IndexView(FacilityScopedMixin, KeysetPaginationMixin, BaseTableListView):
     """
-    Table listing of all departments.
+    Table listing of all departments; ``?view=tree`` lists the live departments of the
+    scope facility (or of every facility the user may see) nested by parent.
     """
 
     model = Department
     template_name = "department/list.html"
     table_class = DepartmentTable
     context_object_name = "departments"
+    query_budget = 8
+    keyset_sortable = ("name", "abbreviation")
+
+    def is_tree_view(self):
+        return self.request.GET.get("view") == "tree"
+
+    def get_queryset(self):
+        return super().get_queryset().select_related("facility", "parent")
+
+    def get_table_class(self):
+        if self.is_tree_view():
+            return DepartmentTreeTable
+        return super().get_table_class()
+
+    def get_tree_queryset(self):
+        facility = self.get_scope_facility()
+        if facility is not None:
+            return departments_for_facility(facility)
+        queryset = Department.objects.filter(is_deleted=False).select_related(
+            "facility", "parent"
+        )
+        return scope_to_visible_facilities(queryset, self.request.user, field="facility")
+
+    def get_table_data(self):
+        if self.is_tree_view():
+            return department_tree(self.get_tree_queryset())
+        return super().get_table_data()
+
+    def get_table_pagination(self, table):
+        # The whole tree comes from one query; paging would split subtrees.
+        if self.is_tree_view():
+            return False
+        return super().get_table_pagination(table)
 
 
 class IndexByFacilityView(BaseIndexByFilterTableView):
@@ -59,7 +98,7 @@ class ShowView(BaseSlugOrPkObjectMixin, BaseDetailView):
     object_slug_kwarg = "department_slug"
 
 
-class CreateView(BaseCreateView):
+class CreateView(SettingLabelMixin, BaseCreateView):
     """
     Create a Department under a specific Facility (by facility_slug).
     Facility is pre-populated and hidden in the form.
@@ -68,6 +107,8 @@ class CreateView(BaseCreateView):
     model = Department
     form_class = DepartmentForm
     template_name = "department/form.html"
+    label_key = "department_label"
+    label_default = "Department"
 
     def get_success_url(self):
         facility_slug = self.kwargs.get("facility_slug")
@@ -79,15 +120,6 @@ class CreateView(BaseCreateView):
             },
         )
 
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-
-        # organization_labels from session for dynamic naming
-        labels = self.request.session.get("organization_labels", {})
-        context["title"] = labels.get("department_label", "Department")
-
-        return context
-
     def get_initial(self):
         initial = super().get_initial()
         facility_slug = self.kwargs.get("facility_slug")
@@ -116,7 +148,7 @@ class CreateView(BaseCreateView):
         return form
 
 
-class UpdateView(BaseUpdateView):
+class UpdateView(SettingLabelMixin, BaseUpdateView):
     """
     Update a Department, identified by slug in the URL.
     """
@@ -126,6 +158,8 @@ class UpdateView(BaseUpdateView):
     template_name = "department/form.html"
     slug_field = "slug"
     slug_url_kwarg = "department_slug"
+    label_key = "department_label"
+    label_default = "Department"
 
     def get_success_url(self):
         facility_slug = self.kwargs.get("facility_slug")
@@ -137,14 +171,6 @@ class UpdateView(BaseUpdateView):
             },
         )
 
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-
-        labels = self.request.session.get("organization_labels", {})
-        context["title"] = labels.get("department_label", "Department")
-
-        return context
-
 
 class DeleteView(BaseDeleteView):
     """
@@ -2,7 +2,8 @@
 
 from django.urls import reverse_lazy
 from django.shortcuts import get_object_or_404
-from django.http import Http404
+from django.http import FileResponse, Http404, JsonResponse, StreamingHttpResponse
+from django.views import View
 from django.views.generic import TemplateView
 
 from core.views.base import (
@@ -23,19 +24,27 @@ from core.mixins.views import (
 
 from organization.models.organization import Organization
 
+from ..exports import iter_table_values, stream_csv, write_xlsx, xlsx_available
 from ..models.facility import Facility
+from ..services.facility_stats import facility_stats_for
+from .mixins import KeysetPaginationMixin, LazyManageTablesMixin, ParallelWidgetsMixin
 from ..forms.facility import FacilityForm
 from ..tables.facility import FacilityTable
 from ..selectors import (
+    FACILITY_LIST_COUNTS,
+    FACILITY_MANAGE_TABLES,
+    choice_querysets,
     facility_detail_tables_config,
     facility_list_queryset,
     facility_manage_tables_config,
+    facility_scope_queryset,
+    with_facility_counts,
 )
 
-from core.dashboard_data import get_facility_metrics, get_facility_overview_text
+from core.dashboard_data import get_facility_overview_text
 
 
-class IndexView(BaseTableListView):
+class IndexView(KeysetPaginationMixin, BaseTableListView):
     """
     Table of facilities.
     """
@@ -44,9 +53,11 @@ class IndexView(BaseTableListView):
     template_name = "facility/list.html"
     table_class = FacilityTable
     context_object_name = "facilities"
+    query_budget = 8
+    keyset_sortable = ("name", *FACILITY_LIST_COUNTS)
 
     def get_queryset(self):
-        return facility_list_queryset(self.request.user)
+        return facility_list_queryset(self.request.user, counts=FACILITY_LIST_COUNTS)
 
 
 class IndexByOrganizationView(OrgScopedMixin, BaseIndexByFilterTableView):
@@ -64,27 +75,62 @@ class IndexByOrganizationView(OrgScopedMixin, BaseIndexByFilterTableView):
     filter_model = Organization
     context_object_name_for_filter = "organization"
 
+    def get_queryset(self):
+        return with_facility_counts(super().get_queryset())
+
 
-class ManageView(PortalPermissionMixin, FacilityScopedMixin, BaseManageView):
+class ManageView(
+    PortalPermissionMixin, FacilityScopedMixin, LazyManageTablesMixin, BaseManageView
+):
     """
     Manage view for a facility: departments, classes, enrollments etc.
+
+    The page is a shell; each table is served by this view at ``facilities:manage_table``.
     """
 
     template_name = "facility/manage.html"
     portal_key = "facility"
+    query_budget = 12
+    table_fragment_url_name = "facilities:manage_table"
+
+    # Resolved once per request; the view instance only lives for one request.
+    _facility = None
+    _root_organization = None
 
     def get_facility(self):
+        if self._facility is None:
+            self._facility = self.resolve_facility()
+        return self._facility
+
+    def resolve_facility(self):
         facility = self.get_scope_facility()
         if facility:
             return facility
         user = self.request.user
         profile = getattr(user, "facultyprofile_profile", None)
         if profile and profile.facility_id:
-            return get_object_or_404(Facility, id=profile.facility_id)
+            return get_object_or_404(facility_scope_queryset(), id=profile.facility_id)
         raise Http404("Facility not found for user")
 
+    def get_root_organization(self):
+        if self._root_organization is None:
+            self._root_organization = self.get_facility().get_root_organization()
+        return self._root_organization
+
+    def get_table_classes(self):
+        return {name: table_class for name, table_class, _selector in FACILITY_MANAGE_TABLES}
+
     def get_tables_config(self):
-        return facility_manage_tables_config(self.get_facility())
+        return facility_manage_tables_config(self.get_facility(), self.get_table_names())
+
+    def get_table_titles(self, table_class):
+        name, name_plural = super().get_table_titles(table_class)
+        # fix common irregulars
+        if name_plural.lower() == "quarterss":
+            name_plural = "Quarters"
+        if name_plural.lower() == "faculty profiles":
+            name_plural = "Faculty"
+        return name, name_plural
 
     def get_create_url(self, table):
         facility = self.get_facility()
@@ -94,37 +140,14 @@ class ManageView(PortalPermissionMixin, FacilityScopedMixin, BaseManageView):
     def get_context_data(self, **kwargs):
         # Avoid MultiTableMixin's self.tables requirement; build from config instead.
         context = TemplateView.get_context_data(self, **kwargs)
-        tables = self.build_tables()
-        formatted = []
-        for table in tables.values():
-            model_meta = getattr(table, "Meta", None)
-            model = getattr(model_meta, "model", None) if model_meta else None
-            verbose_name = model._meta.verbose_name.title() if model else ""
-            verbose_name_plural = (
-                model._meta.verbose_name_plural.title()
-                if model
-                else verbose_name
-            )
-            # fix common irregulars
-            if verbose_name_plural.lower() == "quarterss":
-                verbose_name_plural = "Quarters"
-            if verbose_name_plural.lower() == "faculty profiles":
-                verbose_name_plural = "Faculty"
-            formatted.append(
-                {
-                    "table": table,
-                    "name": verbose_name or table.__class__.__name__,
-                    "name_plural": verbose_name_plural or verbose_name,
-                    "create_url": getattr(table, "add_url", None),
-                    "icon": getattr(table, "add_icon", None),
-                }
-            )
-
         facility = self.get_facility()
+        context.update(scope_object=facility, facility=facility, **self.get_table_context())
+        if self.is_table_fragment():
+            return context
+
         context.update(
-            scope_object=facility,
-            facility=facility,
-            tables_with_names=formatted,
+            organization=facility.organization,
+            root_organization=self.get_root_organization(),
             facility_edit_url=reverse_lazy("facilities:update", kwargs={"facility_slug": facility.slug}),
         )
         return context
@@ -139,6 +162,7 @@ class ShowView(FacilityScopedMixin, BaseDetailWithTablesView):
     template_name = "facility/show.html"
     context_object_name = "facility"
     object_slug_kwarg = "facility_slug"  # For BaseSlugOrPkObjectMixin inside BaseDetailWithTablesView
+    query_budget = 15
 
     def get_tables_config(self):
         return facility_detail_tables_config(self.get_object())
@@ -180,21 +204,110 @@ class DeleteView(BaseDeleteView):
     slug_url_kwarg = "facility_slug"
 
 
-class DashboardView(PortalPermissionMixin, FacilityScopedMixin, BaseDashboardView):
+class DashboardView(
+    PortalPermissionMixin, FacilityScopedMixin, ParallelWidgetsMixin, BaseDashboardView
+):
     """
     Dashboard for faculty members at a facility.
     """
 
     template_name = "faculty/dashboard.html"
     portal_key = "facility"
+    query_budget = 20
+    parallel_widgets = ("facility_metrics", "facility_overview")
+
+    def prepare_widgets(self):
+        super().prepare_widgets()
+        self._scope_facility = super().get_scope_facility()
+
+    def get_scope_facility(self):
+        if hasattr(self, "_scope_facility"):
+            return self._scope_facility
+        return super().get_scope_facility()
 
     def get_facility_metrics_widget(self, _definition):
         facility = self.get_scope_facility()
-        metrics = get_facility_metrics(facility)
-        if not metrics:
+        if facility is None:
             return None
-        return {"metrics": metrics}
+        # One FacilityStats row instead of an aggregate per metric; like the aggregates
+        # it replaced, no data means no widget.
+        stats = facility_stats_for(facility, compute=False)
+        if stats is None:
+            return None
+        return {"metrics": stats.as_metrics()}
 
     def get_facility_overview_widget(self, _definition):
         facility = self.get_scope_facility()
         return {"content": get_facility_overview_text(facility)}
+
+
+class ChoiceAutocompleteView(PortalPermissionMixin, FacilityScopedMixin, View):
+    """
+    JSON ``[{"id", "name"}]`` matches for the facility-scoped choice fields that are too
+    large to render as a select.
+    """
+
+    portal_key = "facility"
+    limit = 20
+
+    def get(self, request, *args, **kwargs):
+        facility = self.get_scope_facility()
+        if facility is None:
+            raise Http404("Facility not found")
+        querysets = choice_querysets(facility)
+        queryset = querysets.get(kwargs.get("kind"))
+        if queryset is None:
+            raise Http404("Unknown choice list")
+        term = request.GET.get("q", "").strip()
+        if term:
+            queryset = queryset.filter(name__icontains=term)
+        results = list(queryset.order_by("name").values("id", "name")[: self.limit])
+        return JsonResponse({"results": results})
+
+
+class ExportView(PortalPermissionMixin, FacilityScopedMixin, View):
+    """
+    Export one of the facility detail tables as CSV or XLSX.
+
+    Rows are read with ``queryset.iterator()`` and written as they arrive, so memory
+    stays flat however large the facility is. CSV is streamed to the client; XLSX is
+    spooled to a temporary file first (see ``exports.write_xlsx``) and sent once the
+    workbook is complete.
+    """
+
+    portal_key = "facility"
+    formats = ("csv", "xlsx")
+
+    def get(self, request, *args, **kwargs):
+        facility = self.get_scope_facility()
+        if facility is None:
+            raise Http404("Facility not found")
+        tables = {
+            name.removesuffix("_table"): config
+            for name, config in facility_detail_tables_config(facility).items()
+        }
+        table_name = kwargs.get("table_name")
+        export_format = kwargs.get("export_format")
+        config = tables.get(table_name)
+        if config is None or export_format not in self.formats:
+            raise Http404("Unknown export")
+
+        values = iter_table_values(
+            config["class"],
+            config["queryset"],
+            context={"facility_slug": facility.slug},
+        )
+        filename = f"{facility.slug}-{table_name}.{export_format}"
+        if export_format == "csv":
+            response = StreamingHttpResponse(stream_csv(values), content_type="text/csv")
+            response["Content-Disposition"] = f'attachment; filename="{filename}"'
+            return response
+
+        if not xlsx_available():
+            raise Http404("XLSX export is not available")
+        return FileResponse(
+            write_xlsx(values, title=table_name),
+            as_attachment=True,
+            filename=filename,
+            content_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        )
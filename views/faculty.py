@@ -1,8 +1,12 @@
 # facility/views/faculty.py
 
+from functools import partial
+
 from django.urls import reverse_lazy
+from django.contrib import messages
 from django.contrib.auth import get_user_model, authenticate, login
 from django.http import Http404
+from django.shortcuts import get_object_or_404
 from django.views.generic import TemplateView
 
 from core.views.base import (
@@ -15,7 +19,7 @@ from core.views.base import (
     BaseFormView,
     BaseDashboardView,
 )
-from core.mixins.views import PortalPermissionMixin, LoginRequiredMixin
+from core.mixins.views import FacilityScopedMixin, PortalPermissionMixin, LoginRequiredMixin
 from core.utils import get_faculty_profile, is_department_admin, is_faculty_admin
 from core.dashboard_data import get_faculty_resources, get_faculty_schedule
 
@@ -25,29 +29,44 @@ from enrollment.tables.faculty import (
 )
 from enrollment.models.faculty import FacultyEnrollment
 
-from reports.models import GeneratedReport
+from organization.models.organization import Organization
 from reports.tables import GeneratedReportTable
 
 from facility.forms.faculty import FacultyQuartersAssignmentForm, FacultyClassAssignmentForm
 
 from ..models.faculty import FacultyProfile
-from ..tables.faculty import FacultyTable, FacultyByFacilityTable
+from ..models.faculty_roster import FacultyRosterEntry
+from ..selectors import reports_visible_to
+from ..services.dashboard_cache import REPORTS_SCOPE, cached_widget
+from ..services.facility_access import scope_to_visible_facilities
+from ..services.faculty_roster import roster_for_organization
+from .mixins import (
+    KeysetPaginationMixin,
+    LazyManageTablesMixin,
+    ParallelWidgetsMixin,
+    ScopedFormMixin,
+)
+from ..tables.faculty import FacultyTable, FacultyByFacilityTable, FacultyRosterTable
 from ..forms.faculty import (
+    FacultyRosterFilterForm,
+    FacultyRosterImportForm,
     FacultyForm,
     PromoteFacultyForm,
     AssignDepartmentForm,
-    RegistrationForm,
+    FacultyRegistrationForm,
 )
 
 User = get_user_model()
 
 
-class IndexView(BaseTableListView):
+class IndexView(KeysetPaginationMixin, BaseTableListView):
     model = User
     template_name = "faculty/list.html"
     context_object_name = "faculty"
     table_class = FacultyTable
     paginate_by = 10
+    keyset_ordering = ("last_name", "first_name", "pk")
+    keyset_sortable = ("last_name", "first_name", "email")
 
     def get_queryset(self):
         queryset = User.objects.filter(user_type=User.UserType.FACULTY)
@@ -61,9 +80,70 @@ class IndexView(BaseTableListView):
         return queryset
 
 
-class ManageView(PortalPermissionMixin, BaseManageView):
+class RosterView(PortalPermissionMixin, KeysetPaginationMixin, BaseTableListView):
+    """
+    Faculty across every facility under an organization, read from the
+    ``FacultyRosterEntry`` projection instead of joining profiles, users, facilities and
+    departments. Filter with ``?role=&facility=&department=``; rows are limited to the
+    facilities the user may see. Rows without a live facility or a profile slug are
+    left out, since their actions have no facility-scoped URL to link to.
+    """
+
+    model = FacultyRosterEntry
+    portal_key = "faculty"
+    template_name = "faculty/roster.html"
+    context_object_name = "faculty"
+    table_class = FacultyRosterTable
+    paginate_by = 25
+    query_budget = 8
+    keyset_ordering = ("last_name", "first_name", "pk")
+    keyset_sortable = (
+        "last_name",
+        "first_name",
+        "email",
+        "facility_name",
+        "department_name",
+        "role",
+    )
+
+    # Resolved once per request; the view instance only lives for one request.
+    _organization = None
+    _filter_form = None
+
+    def get_organization(self):
+        if self._organization is None:
+            self._organization = get_object_or_404(
+                Organization, slug=self.kwargs["organization_slug"]
+            )
+        return self._organization
+
+    def get_filter_form(self):
+        if self._filter_form is None:
+            self._filter_form = FacultyRosterFilterForm(
+                self.request.GET, organization=self.get_organization()
+            )
+        return self._filter_form
+
+    def get_queryset(self):
+        queryset = scope_to_visible_facilities(
+            roster_for_organization(self.get_organization()),
+            self.request.user,
+            field="facility",
+        ).exclude(facility_slug="").exclude(profile_slug="")
+        return self.get_filter_form().filter(queryset)
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context.update(
+            organization=self.get_organization(), filter_form=self.get_filter_form()
+        )
+        return context
+
+
+class ManageView(PortalPermissionMixin, LazyManageTablesMixin, BaseManageView):
     template_name = "faculty/manage.html"
     portal_key = "faculty"
+    table_fragment_url_name = "facilities:faculty:manage_table"
 
     def test_func(self):
         return is_faculty_admin(self.request.user) or is_department_admin(
@@ -76,6 +156,9 @@ class ManageView(PortalPermissionMixin, BaseManageView):
             return profile.facility
         raise Http404("Facility not found for current user.")
 
+    def get_table_classes(self):
+        return {"faculty": FacultyEnrollmentByFacilityEnrollmentTable}
+
     def get_tables_config(self):
         facility = self.get_facility()
         faculty_qs = FacultyEnrollment.objects.select_related("faculty__user").filter(
@@ -88,40 +171,34 @@ class ManageView(PortalPermissionMixin, BaseManageView):
             }
         }
 
+    def get_create_url(self, table):
+        facility = self.get_facility()
+        return table.get_url("add", context={"facility_slug": facility.slug})
+
     def get_forms_config(self):
+        # Scope every choice field to the admin's facility instead of all tenants.
+        facility = self.get_facility()
         return {
-            "faculty_form": FacultyForm,
-            "promotion_form": PromoteFacultyForm,
-            "department_form": AssignDepartmentForm,
+            "faculty_form": partial(FacultyForm, facility=facility),
+            "promotion_form": partial(PromoteFacultyForm, facility=facility),
+            "department_form": partial(AssignDepartmentForm, facility=facility),
             "class_form": FacultyClassAssignmentForm,
-            "quarters_form": FacultyQuartersAssignmentForm,
+            "quarters_form": partial(FacultyQuartersAssignmentForm, facility=facility),
         }
 
     def get_context_data(self, **kwargs):
         # Bypass MultiTableMixin's expectation of self.tables; build from config instead.
         context = TemplateView.get_context_data(self, **kwargs)
-        tables = self.build_tables()
-        formatted = []
-        for table in tables.values():
-            formatted.append(
-                {
-                    "table": table,
-                    "name": table.Meta.model._meta.verbose_name.title(),
-                    "create_url": getattr(table, "add_url", None),
-                    "icon": getattr(table, "add_icon", None),
-                }
-            )
-
         facility = self.get_facility()
         context.update(
             scope_object=facility,
             facility=facility,
-            tables_with_names=formatted,
+            **self.get_table_context(),
         )
         return context
 
 
-class CreateView(LoginRequiredMixin, BaseCreateView):
+class CreateView(LoginRequiredMixin, FacilityScopedMixin, ScopedFormMixin, BaseCreateView):
     model = FacultyProfile
     form_class = FacultyForm
     template_name = "faculty/form.html"
@@ -131,7 +208,7 @@ class CreateView(LoginRequiredMixin, BaseCreateView):
     error_message = "Failed to create faculty member."
 
 
-class UpdateView(LoginRequiredMixin, BaseUpdateView):
+class UpdateView(LoginRequiredMixin, FacilityScopedMixin, ScopedFormMixin, BaseUpdateView):
     model = FacultyProfile
     form_class = FacultyForm
     template_name = "faculty/form.html"
@@ -139,7 +216,7 @@ class UpdateView(LoginRequiredMixin, BaseUpdateView):
     action = "Edit"
 
 
-class PromoteView(LoginRequiredMixin, BaseUpdateView):
+class PromoteView(LoginRequiredMixin, FacilityScopedMixin, ScopedFormMixin, BaseUpdateView):
     model = FacultyProfile
     form_class = PromoteFacultyForm
     template_name = "faculty/promote.html"
@@ -160,6 +237,9 @@ class ShowView(BaseDetailView):
     context_object_name = "faculty"
     slug_url_kwarg = "faculty_slug"
 
+    def get_queryset(self):
+        return FacultyProfile.objects.select_related("user", "facility").with_department()
+
     def can_view_enrollments(self, faculty):
         user = self.request.user
         if not getattr(user, "is_authenticated", False):
@@ -198,9 +278,35 @@ class ShowView(BaseDetailView):
         return context
 
 
-class RegisterFacultyView(BaseFormView):
+class RosterImportView(PortalPermissionMixin, FacilityScopedMixin, BaseFormView):
+    """
+    Bulk-create faculty for a facility from an uploaded CSV roster.
+    """
+
+    template_name = "faculty/import.html"
+    form_class = FacultyRosterImportForm
+    portal_key = "faculty"
+
+    def form_valid(self, form):
+        facility = self.get_scope_facility()
+        if facility is None:
+            raise Http404("Facility not found")
+        result = form.save(facility)
+        messages.success(self.request, f"Imported {result['created']} faculty.")
+        for line, reason in result["skipped"][:20]:
+            messages.warning(self.request, f"Line {line}: {reason}")
+        return super().form_valid(form)
+
+    def get_success_url(self):
+        return reverse_lazy(
+            "facilities:faculty:index",
+            kwargs={"facility_slug": self.kwargs.get("facility_slug")},
+        )
+
+
+class RegisterFacultyView(FacilityScopedMixin, ScopedFormMixin, BaseFormView):
     template_name = "faculty/register.html"
-    form_class = RegistrationForm
+    form_class = FacultyRegistrationForm
     success_url = reverse_lazy("home")
 
     def form_valid(self, form):
@@ -213,48 +319,109 @@ class RegisterFacultyView(BaseFormView):
         return super().form_valid(form)
 
 
-class DashboardView(BaseDashboardView):
+class DashboardView(ParallelWidgetsMixin, BaseDashboardView):
     """
     Dashboard for faculty members.
+
+    Widget data is cached per (widget, facility, role[, user], data version); versions
+    are bumped by signals in ``facility.signals`` so a change is visible on the next load.
+    Only rendered output is cached: table widgets as the HTML of their first
+    ``widget_rows`` rows, lists as their display strings. A warm load therefore runs
+    no widget queries and no model instances land in the shared cache. Cache misses
+    are fetched concurrently.
     """
 
     template_name = "faculty/dashboard.html"
     portal_key = "faculty"
+    query_budget = 22
+    widget_rows = 10
+    parallel_widgets = (
+        "faculty_schedule",
+        "faculty_resources",
+        "faculty_management",
+        "faculty_reports",
+    )
+
+    def get_parallel_widgets(self):
+        if self.is_faculty_admin():
+            return self.parallel_widgets
+        return tuple(name for name in self.parallel_widgets if name != "faculty_management")
+
+    def prepare_widgets(self):
+        super().prepare_widgets()
+        self.get_profile()
+
+    def get_profile(self):
+        return getattr(self.request.user, "facultyprofile_profile", None)
+
+    def cached_widget(self, widget, builder, per_user=False, scopes=()):
+        profile = self.get_profile()
+        if profile is None:
+            return builder()
+        return cached_widget(
+            widget,
+            builder,
+            facility_id=profile.facility_id,
+            role=profile.role,
+            user_id=self.request.user.pk if per_user else None,
+            scopes=scopes,
+        )
+
+    def cached_table_widget(self, widget, table_class, rows, per_user=False, scopes=()):
+        """
+        Cache the HTML of ``table_class`` over the first ``widget_rows`` of ``rows`` (a
+        queryset or a callable returning rows) and return it as widget content.
+        """
+
+        def render():
+            data = rows() if callable(rows) else rows
+            table = table_class(list(data[: self.widget_rows]), orderable=False)
+            return table.as_html(self.request)
+
+        return {"content": self.cached_widget(widget, render, per_user=per_user, scopes=scopes)}
 
     def get_faculty_management_queryset(self):
         """Fetch data for faculty management widget (admin only)."""
-        return self.request.user.facultyprofile_profile.facility.faculty.all()
+        facility_id = self.request.user.facultyprofile_profile.facility_id
+        return FacultyEnrollment.objects.select_related("faculty__user").filter(
+            facility_enrollment__facility_id=facility_id
+        )
 
     def get_reports_queryset(self):
-        user = self.request.user
-
-        created_reports = GeneratedReport.objects.filter(generated_by=user)
-        user_reports = GeneratedReport.objects.filter(template__available_to=user)
-
-        reports_queryset = created_reports | user_reports
-        return reports_queryset.distinct()
+        return reports_visible_to(self.request.user)
 
     def is_faculty_admin(self):
         return self.request.user.is_admin
 
     def get_faculty_schedule_widget(self, _definition):
-        profile = getattr(self.request.user, "facultyprofile_profile", None)
-        queryset = get_faculty_schedule(profile)
-        return {"table_class": ClassScheduleTable, "queryset": queryset}
+        profile = self.get_profile()
+        return self.cached_table_widget(
+            "schedule",
+            ClassScheduleTable,
+            lambda: list(get_faculty_schedule(profile) or []),
+            per_user=True,
+        )
 
     def get_faculty_resources_widget(self, _definition):
         facility = getattr(self.request.user.facultyprofile_profile, "facility", None)
-        return {"items": get_faculty_resources(facility)}
+        items = self.cached_widget(
+            "resources",
+            lambda: [str(item) for item in get_faculty_resources(facility) or []],
+        )
+        return {"items": items}
 
     def get_faculty_management_widget(self, _definition):
-        queryset = self.get_faculty_management_queryset()
-        return {
-            "table_class": FacultyEnrollmentByFacilityEnrollmentTable,
-            "queryset": queryset,
-        }
+        return self.cached_table_widget(
+            "management",
+            FacultyEnrollmentByFacilityEnrollmentTable,
+            self.get_faculty_management_queryset(),
+        )
 
     def get_faculty_reports_widget(self, _definition):
-        return {
-            "table_class": GeneratedReportTable,
-            "queryset": self.get_reports_queryset(),
-        }
+        return self.cached_table_widget(
+            "reports",
+            GeneratedReportTable,
+            self.get_reports_queryset(),
+            per_user=True,
+            scopes=(REPORTS_SCOPE,),
+        )
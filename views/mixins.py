@@ -0,0 +1,268 @@
+# facility/views/mixins.py
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+from django.db import close_old_connections, connection
+from django.http import Http404
+from django.urls import reverse
+
+from ..models.facility import Facility
+from ..paginators import KeysetPaginator
+from ..services.settings_resolver import prime_fallback_chains, resolve_setting
+
+logger = logging.getLogger(__name__)
+
+# One small pool per widget, so a burst of dashboard loads cannot spawn unbounded
+# threads and a widget whose queries hang only ever blocks its own workers.
+WIDGET_WORKERS = 2
+_widget_executors = {}
+_widget_executors_lock = threading.Lock()
+
+
+def _widget_executor(name):
+    with _widget_executors_lock:
+        executor = _widget_executors.get(name)
+        if executor is None:
+            executor = _widget_executors[name] = ThreadPoolExecutor(
+                max_workers=WIDGET_WORKERS, thread_name_prefix=f"dashboard-widget-{name}"
+            )
+        return executor
+
+
+class SettingLabelMixin:
+    """
+    Title the page with the ``label_key`` setting (e.g. ``department_label``) resolved
+    for the object being edited, or for the URL's facility when there is none yet. The
+    organization labels in the session, then ``label_default``, are the fallbacks.
+    """
+
+    label_key = None
+    label_default = None
+
+    def get_label_owner(self):
+        owner = getattr(self, "object", None)
+        if owner is None and self.kwargs.get("facility_slug"):
+            owner = (
+                Facility.objects.select_related("organization")
+                .filter(slug=self.kwargs["facility_slug"])
+                .first()
+            )
+        return owner
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        labels = self.request.session.get("organization_labels", {})
+        default = labels.get(self.label_key, self.label_default)
+        owner = self.get_label_owner()
+        if owner is not None:
+            prime_fallback_chains([owner])
+        context["title"] = resolve_setting(owner, self.label_key, default)
+        return context
+
+
+class ScopedFormMixin:
+    """
+    Build the form with ``facility=`` set to the view's scope facility, so
+    ``ScopedChoicesMixin`` forms only offer that facility's choices. Pair with
+    ``FacilityScopedMixin``; a request without a facility in scope is a 404.
+    """
+
+    def get_form_kwargs(self):
+        facility = self.get_scope_facility()
+        if facility is None:
+            raise Http404("Facility not found")
+        kwargs = super().get_form_kwargs()
+        kwargs["facility"] = facility
+        return kwargs
+
+
+class KeysetPaginationMixin:
+    """
+    Switch a ``BaseTableListView`` from OFFSET pagination to keyset pagination.
+
+    Pages are addressed by the opaque ``?cursor=`` parameter and always ordered on
+    ``keyset_ordering`` (which must end in a unique column). ``keyset_count_mode``
+    controls the total shown with the table: ``None``, ``"exact"`` or ``"estimate"``.
+    Columns outside ``keyset_sortable`` are rendered without sort links.
+    """
+
+    keyset_ordering = ("name", "pk")
+    # Table columns whose ``?sort=`` re-keys the pages on that column (then ``pk``);
+    # each must be a non-null model field or annotation read straight off the row.
+    keyset_sortable = ()
+    keyset_count_mode = None
+    keyset_cursor_param = "cursor"
+    keyset_table_template = "facility/keyset_table.html"
+
+    def get_table_pagination(self, table):
+        pagination = super().get_table_pagination(table)
+        if pagination is False:
+            return pagination
+        pagination = dict(pagination or {})
+        pagination.update(
+            paginator_class=KeysetPaginator,
+            cursor=self.request.GET.get(self.keyset_cursor_param),
+            ordering=self.get_keyset_ordering(table),
+            count_mode=self.keyset_count_mode,
+        )
+        return pagination
+
+    def get_keyset_ordering(self, table):
+        sort = self.request.GET.get(table.prefixed_order_by_field, "")
+        if sort.lstrip("-") in self.keyset_sortable:
+            return (sort, "pk")
+        return self.keyset_ordering
+
+    def get_table(self, **kwargs):
+        table = super().get_table(**kwargs)
+        for column in table.columns.iterall():
+            if column.name not in self.keyset_sortable:
+                column.column.orderable = False
+        # The keyset template extends whatever template the table already uses.
+        table.keyset_base_template = table.template_name
+        table.keyset_cursor_param = self.keyset_cursor_param
+        table.template_name = self.keyset_table_template
+        return table
+
+
+def _run_widget(getter, timeout):
+    try:
+        if connection.vendor == "postgresql":
+            # A cancelled future keeps running; make the database stop its queries
+            # once the page has given up on them.
+            with connection.cursor() as cursor:
+                cursor.execute("SET statement_timeout = %s", [int(timeout * 1000)])
+        return getter(None)
+    finally:
+        # Worker threads hold their own connections; release them like a request would.
+        close_old_connections()
+
+
+class ParallelWidgetsMixin:
+    """
+    Fetch the data for a ``BaseDashboardView``'s widgets concurrently.
+
+    Every widget named in ``parallel_widgets`` has its ``get_<name>_widget`` getter run
+    on that widget's own small thread pool before the page renders, so latency follows
+    the slowest widget rather than the sum. Widgets that miss the shared
+    ``widget_timeout`` deadline or raise are replaced with ``widget_placeholder``; on
+    PostgreSQL their queries are also cut off at ``widget_timeout`` so abandoned work
+    frees its worker. Getters must not depend on their
+    definition argument (they receive ``None``) and must be thread-safe.
+
+    Widgets run sequentially while the request is inside a transaction, because worker
+    threads use their own connections and cannot see its uncommitted rows.
+    """
+
+    parallel_widgets = ()
+    widget_timeout = 2.0
+    widget_placeholder = {"unavailable": True}
+
+    def get(self, request, *args, **kwargs):
+        if self.get_parallel_widgets() and not connection.in_atomic_block:
+            self.prefetch_widgets()
+        return super().get(request, *args, **kwargs)
+
+    def get_parallel_widgets(self):
+        return self.parallel_widgets
+
+    def prepare_widgets(self):
+        """Resolve state shared by the getters once, before any thread reads it."""
+        # Evaluate the lazy request user here rather than racing to do it in workers.
+        getattr(self.request.user, "pk", None)
+
+    def prefetch_widgets(self):
+        self.prepare_widgets()
+        futures = {
+            name: _widget_executor(name).submit(
+                _run_widget, getattr(self, f"get_{name}_widget"), self.widget_timeout
+            )
+            for name in self.get_parallel_widgets()
+        }
+        deadline = time.monotonic() + self.widget_timeout
+        for name, future in futures.items():
+            try:
+                result = future.result(timeout=max(deadline - time.monotonic(), 0))
+            except FutureTimeoutError:
+                future.cancel()
+                logger.warning("Dashboard widget %s timed out", name)
+                result = dict(self.widget_placeholder)
+            except Exception:
+                logger.exception("Dashboard widget %s failed", name)
+                result = dict(self.widget_placeholder)
+            setattr(self, f"get_{name}_widget", lambda _definition, result=result: result)
+
+
+class LazyManageTablesMixin:
+    """
+    Render a ``BaseManageView`` as a shell whose tables load as separate fragments.
+
+    The page lists one section per table (title, create button and fragment URL) without
+    querying any table. Each fragment is the same view dispatched with a ``table_name``
+    kwarg, building only that table, so paging or sorting one table never re-runs the
+    others. Views provide ``get_table_classes()`` (name -> table class, no queries) and
+    a ``get_tables_config()`` honouring ``get_table_names()``.
+    """
+
+    table_fragment_url_name = None
+    table_fragment_template = "facility/manage_table.html"
+
+    def get_table_classes(self):
+        raise NotImplementedError
+
+    def is_table_fragment(self):
+        return "table_name" in self.kwargs
+
+    def get_table_names(self):
+        if self.is_table_fragment():
+            return (self.kwargs["table_name"],)
+        return tuple(self.get_table_classes())
+
+    def get_template_names(self):
+        if self.is_table_fragment():
+            return [self.table_fragment_template]
+        return super().get_template_names()
+
+    def get_table_titles(self, table_class):
+        """Return ``(name, name_plural)`` for a table section."""
+        model = getattr(table_class.Meta, "model", None)
+        if model is None:
+            return table_class.__name__, table_class.__name__
+        return (
+            model._meta.verbose_name.title(),
+            model._meta.verbose_name_plural.title(),
+        )
+
+    def get_table_fragment_url(self, name):
+        return reverse(
+            self.table_fragment_url_name, kwargs={**self.kwargs, "table_name": name}
+        )
+
+    def get_table_sections(self):
+        sections = []
+        for name, table_class in self.get_table_classes().items():
+            title, title_plural = self.get_table_titles(table_class)
+            sections.append(
+                {
+                    "key": name,
+                    "name": title,
+                    "name_plural": title_plural,
+                    # An empty table is enough to resolve URLs; nothing is queried.
+                    "create_url": self.get_create_url(table_class([])),
+                    "icon": getattr(table_class, "add_icon", None),
+                    "fragment_url": self.get_table_fragment_url(name),
+                }
+            )
+        return sections
+
+    def get_table_context(self):
+        if not self.is_table_fragment():
+            return {"table_sections": self.get_table_sections()}
+        name = self.kwargs["table_name"]
+        if name not in self.get_table_classes():
+            raise Http404("Unknown table")
+        return {"table": self.build_tables()[name], "table_key": name}
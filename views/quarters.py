@@ -2,6 +2,8 @@
 
 from django.urls import reverse_lazy, reverse
 from django.shortcuts import get_object_or_404
+from django.contrib import messages
+from django.http import Http404
 from django import forms
 
 from organization.models.organization import Organization
@@ -13,22 +15,29 @@ from core.views.base import (
     BaseTableListView,
     BaseUpdateView,
     BaseSlugOrPkObjectMixin,
+    BaseFormView,
 )
+from core.mixins.views import FacilityScopedMixin, PortalPermissionMixin
 
 from ..models.quarters import Quarters, QuartersType
 from ..tables.quarters import QuartersTable, QuartersTypeTable
 from ..forms.quarters import QuartersForm, QuartersTypeForm
+from ..forms.faculty import FacultyQuartersAssignmentForm
 from ..models.facility import Facility
+from ..selectors import with_current_occupancy
+from .mixins import KeysetPaginationMixin, SettingLabelMixin
 
 
-class IndexView(BaseTableListView):
+class IndexView(KeysetPaginationMixin, BaseTableListView):
     model = Quarters
     template_name = "quarters/list.html"
     table_class = QuartersTable
     context_object_name = "quarters"
+    query_budget = 8
+    keyset_sortable = ("name", "capacity", "reserved_beds")
 
     def get_queryset(self):
-        qs = super().get_queryset()
+        qs = super().get_queryset().select_related("facility", "type")
         facility_slug = self.kwargs.get("facility_slug")
         if facility_slug:
             qs = qs.filter(facility__slug=facility_slug)
@@ -36,7 +45,7 @@ class IndexView(BaseTableListView):
             profile = getattr(self.request.user, "facultyprofile_profile", None)
             if profile and profile.facility_id:
                 qs = qs.filter(facility=profile.facility)
-        return qs
+        return with_current_occupancy(qs)
 
 
 class IndexByFacilityView(BaseIndexByFilterTableView):
@@ -49,6 +58,9 @@ class IndexByFacilityView(BaseIndexByFilterTableView):
     filter_model = Facility
     context_object_name_for_filter = "facility"
 
+    def get_queryset(self):
+        return with_current_occupancy(super().get_queryset())
+
 
 class IndexByQuartersTypeView(BaseIndexByFilterTableView):
     model = Quarters
@@ -60,6 +72,9 @@ class IndexByQuartersTypeView(BaseIndexByFilterTableView):
     context_object_name_for_filter = "quarters type"
     # BaseIndexByFilterTableView will default to lookup_keys=["slug"]
 
+    def get_queryset(self):
+        return with_current_occupancy(super().get_queryset())
+
 
 class ShowView(BaseSlugOrPkObjectMixin, BaseDetailView):
     model = Quarters
@@ -69,10 +84,12 @@ class ShowView(BaseSlugOrPkObjectMixin, BaseDetailView):
     object_slug_kwarg = "quarters_slug"
 
 
-class CreateView(BaseCreateView):
+class CreateView(SettingLabelMixin, BaseCreateView):
     model = Quarters
     form_class = QuartersForm
     template_name = "quarters/form.html"
+    label_key = "quarters_label"
+    label_default = "Quarters"
 
     def get_success_url(self):
         facility_slug = self.kwargs.get("facility_slug")
@@ -82,12 +99,6 @@ class CreateView(BaseCreateView):
             kwargs={"facility_slug": facility_slug, "quarters_slug": quarters_slug},
         )
 
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        labels = self.request.session.get("organization_labels", {})
-        context["title"] = labels.get("quarters_label", "Quarters")
-        return context
-
     def get_initial(self):
         initial = super().get_initial()
         facility_slug = self.kwargs.get("facility_slug")
@@ -147,6 +158,40 @@ class DeleteView(BaseDeleteView):
         )
 
 
+class AssignView(PortalPermissionMixin, FacilityScopedMixin, BaseFormView):
+    """
+    Auto-assign a week's unassigned faculty and faction enrollments to quarters.
+    """
+
+    template_name = "quarters/assign.html"
+    form_class = FacultyQuartersAssignmentForm
+    portal_key = "facility"
+
+    def get_form_kwargs(self):
+        facility = self.get_scope_facility()
+        if facility is None:
+            raise Http404("Facility not found")
+        kwargs = super().get_form_kwargs()
+        kwargs["facility"] = facility
+        return kwargs
+
+    def form_valid(self, form):
+        assigned, unplaced = form.save()
+        messages.success(self.request, f"Assigned quarters to {len(assigned)} enrollments.")
+        if unplaced:
+            messages.warning(
+                self.request,
+                f"{len(unplaced)} enrollments could not be placed; no quarters had room.",
+            )
+        return super().form_valid(form)
+
+    def get_success_url(self):
+        return reverse(
+            "facilities:quarters:index",
+            kwargs={"facility_slug": self.kwargs.get("facility_slug")},
+        )
+
+
 class QuartersTypeIndexView(BaseTableListView):
     model = QuartersType
     template_name = "quarters/type/list.html"
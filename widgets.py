@@ -57,7 +57,7 @@ class FacultyListWidget(BaseWidget):
             facility = current_user.facultyprofile_profile.facility
 
         if facility:
-            faculty = FacultyProfile.objects.filter(facility=facility)
+            faculty = FacultyProfile.objects.for_facility(facility).roster_rows()
         else:
             faculty = FacultyProfile.objects.none()
 